@@ -4,6 +4,7 @@
 
 # ---- Navigation ----
 START_SCREEN = "clock_digital"
+SCREEN_CACHE_BYTES = 98_304   # RAM-Budget geladener Screens (Modul + Instanz), ruhende nach LRU raus
 
 # ---- Touch / Input ----
 TOUCH_SWAP_XY  = False
@@ -14,11 +15,19 @@ TOUCH_FLIP_Y   = False
 DISPLAY_HZ        = 80_000_000  # nur wenn vom Displaytreiber genutzt
 BACKLIGHT_DIM     = 0           # 0..255, Helligkeit im DIM-Zustand
 BACKLIGHT_BRIGHT  = 200         # 0..255, Aktuelle Helligkeit
+DISPLAY_FILL_BUF_BYTES = 9_600  # RAM-Budget Fill-Blockpuffer (20 Zeilen à 240 px)
+DISPLAY_GLYPH_CACHE_BYTES = 4_096  # RAM-Budget 5x7-Glyphcache (LRU)
+DISPLAY_STATS_MS  = 0           # >0: SPI-Zähler je Screen, alle n ms auf "display/spi_stats"
+DIGIT_ATLAS_CACHE_BYTES = 65_536  # RAM-Budget Ziffernkacheln (gold_waves_orbitron, LRU)
+ASSET_CACHE_BYTES = 196_608  # RAM-Budget gemeinsamer Asset-Cache (BG/Atlanten, kalte Einträge LRU)
+ASSET_CACHE_DEDUPE = True     # identische Dateien (SHA-256) teilen einen Puffer
 
 # ---- Power / Sleep ----
 SLEEP_MODE        = "dim"       # "off" | "dim" | "lightsleep" | "deepsleep"
 DIM_TIMEOUT_MS    = 50_000      # bis DIM
 SLEEP_TIMEOUT_MS  = 90_000      # bis Sleep (nur bei light/deep)
+AOD_ON_DIM        = True        # DIM auf den Uhr-Screens als Always-on: Idle (8 Farben) + Partial-Band, nur Minuten
+AOD_BACKLIGHT     = 24          # 0..255, Helligkeit im Always-on (BACKLIGHT_DIM gilt sonst)
 BATTERY_UPDATE_MS = 10_000      # Interval in ms zum Überprüfen des Batteriestands
 
 # Vorwarnungen (Statusbar/Overlay), 0 = aus
@@ -50,6 +59,10 @@ DEBUG_LORA		= False
 # --- Look & Behavior ---
 TIME_24H     = True
 SHOW_SECONDS = True
+ANALOG_SECONDS_HZ = 1    # Sekundenzeiger-Schritte je Sekunde (1 = springt; >1 = Sweep, opt-in, Teiler von 30,
+                         # wird bei Last gesenkt; 10 Hz: ~6100 SPI-Transaktionen/min statt ~270)
+UI_FRAME_HZ  = 30        # Takt von "time/frame" im Main-Loop (0 = aus), nur solange der Screen Frames will
+UI_FACE_FPS  = 30        # höchstens so viele Flushes je Sekunde (FaceBase.tick, 0 = jeder Frame)
 
 # ---- Watchfaces
 ACTIVE_WATCHFACE_DIGITAL = "gold_waves_orbitron"
@@ -0,0 +1,91 @@
+# host/bench_boot.py — Boot bis zum ersten Frame: alle Screens vorab (load_screens) vs. lazy (ScreenRegistry)
+# Aufruf (Repo-Root):  python3 host/bench_boot.py
+# Jede Variante läuft in einem eigenen Prozess (leere sys.modules): Screens aus nav.json anlegen,
+# Start-Screen zeigen; gemessen werden Laden (Import + Konstruktion), on_show und Python-Heap
+# (tracemalloc; ScreenRegistry misst damit auch am Host) bis zum ersten Frame.
+# Danach ein Rundgang über alle Screens mit SCREEN_CACHE_BYTES: geladene Screens und Heap am Ende.
+import sys, os, json, time, subprocess, tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv, vst7789
+
+hostenv.install()
+os.chdir(hostenv.ROOT)
+
+
+class _Manager:
+    def __init__(self, bus):
+        self.eventbus = bus; self.status = None
+
+
+def _ids():
+    with open("nav.json") as f: nav = json.load(f)
+    ids = list(nav.get("main", ()))
+    for grp in ("sub", "hidden"):
+        for lst in nav.get(grp, {}).values(): ids += lst
+    ids += list(nav.get("upmap", {}).values())
+    out = []
+    for s in ids:
+        if s not in out: out.append(s)
+    return out, nav.get("main", [])
+
+
+def child(mode):
+    from bench_minute import HostBus
+    import config
+    from lib import screen_registry
+    ids, chain = _ids()
+    start = getattr(config, "START_SCREEN", "clock_digital")
+    d, panel = vst7789.make_display(rotation=0)
+    tracemalloc.start()
+    h0 = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    mgr = _Manager(HostBus())
+    if mode == "eager":
+        # wie load_screens(): alles importieren + konstruieren, danach ohne Budget
+        pre = {}
+        for sid in ids:
+            mod = __import__("screens." + sid, None, None, ("*",))
+            pre[sid] = screen_registry._screen_class(mod, sid)(d, manager=mgr)
+        reg = screen_registry.ScreenRegistry(d, mgr, ids, chain=chain, budget_bytes=1 << 30)
+        reg.items()
+    else:
+        reg = screen_registry.ScreenRegistry(d, mgr, ids, chain=chain,
+                                             budget_bytes=int(getattr(config, "SCREEN_CACHE_BYTES", 98_304)))
+    scr = reg[start]
+    t1 = time.perf_counter()
+    scr.on_show()
+    t2 = time.perf_counter()
+    heap = tracemalloc.get_traced_memory()[0] - h0
+    if mode == "eager": del pre
+    loaded = len(reg.loaded())
+    prev = start
+    for sid in ids + [start]:           # Rundgang: hide/show wie der ScreenManager
+        for fn in (reg[prev].on_hide, reg[sid].on_show):
+            try: fn()
+            except Exception: pass      # z.B. absolute Gerätepfade (quick_p1) am Host
+        prev = sid
+    walk = tracemalloc.get_traced_memory()[0] - h0
+    print(json.dumps({"load": (t1 - t0) * 1000.0, "show": (t2 - t1) * 1000.0, "heap": heap, "loaded": loaded, "screens": len(ids),
+                      "walk_loaded": len(reg.loaded()), "walk_heap": walk,
+                      "evictions": reg.evictions}))
+
+
+def main(argv):
+    if argv[:1] == ["--child"]:
+        child(argv[1]); return 0
+    print("  %-6s %8s %8s %10s %8s   %s" % ("mode", "load ms", "show ms", "heap B", "loaded",
+                                            "after walk (loaded, heap)"))
+    for mode in ("eager", "lazy"):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode],
+                             capture_output=True, text=True)
+        if out.returncode:
+            print(out.stderr); return 1
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print("  %-6s %8.1f %8.1f %10d %4d/%-3d   %d/%d, %d B, %d evictions" % (
+            mode, r["load"], r["show"], r["heap"], r["loaded"], r["screens"], r["walk_loaded"], r["screens"],
+            r["walk_heap"], r["evictions"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
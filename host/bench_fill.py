@@ -0,0 +1,58 @@
+# host/bench_fill.py — SPI-Aufrufe/Bytes je Fill-Pfad: alt (Zeile für Zeile) vs. Blockpuffer
+# Aufruf (Repo-Root):  python3 host/bench_fill.py [budget_bytes ...]
+# Referenz (Standardbudget 9600 B = 20 Zeilen): fill_screen 241 -> 13 spi.write() bei gleicher
+# Bytezahl (115201); 15-Streifen-Clear (quick_p1) 285 -> 60.
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv
+
+hostenv.install()
+from lib import display_st7789 as D
+
+
+def legacy_fill_rect(d, x, y, w, h, c565):
+    """Bisheriges Verfahren: ein 480-Byte-Zeilenpuffer, ein spi.write() pro Zeile."""
+    if w <= 0 or h <= 0: return
+    d._set_window(x, y, x + w - 1, y + h - 1)
+    line = bytearray(w * 2)
+    for i in range(0, w * 2, 2):
+        line[i] = (c565 >> 8) & 0xFF; line[i + 1] = c565 & 0xFF
+    for _ in range(h):
+        d._spi.write(line)
+    d._cs.on()
+
+
+SCENARIOS = (
+    ("fill_screen 240x240",       lambda f: f(0, 0, 240, 240, 0x0000)),
+    ("quick_p1 clear (15 strips)", lambda f: [f(0, y, 240, min(16, 240 - y), 0) for y in range(0, 240, 16)]),
+    ("charge fill 134x67",        lambda f: f(54, 87, 134, 67, 0xE62A)),
+    ("icon 20x20",                lambda f: f(10, 5, 20, 20, 0x0000)),
+    ("hline 240x1",               lambda f: f(0, 120, 240, 1, 0xFFFF)),
+)
+
+
+def run(budget):
+    D._CFG_FILL_BYTES = budget
+    d, p = hostenv.make_display()
+    rows = []
+    for name, sc in SCENARIOS:
+        p.reset(); sc(lambda *a: legacy_fill_rect(d, *a)); old = p.snapshot()
+        p.reset(); sc(d.fill_rect); new = p.snapshot()
+        rows.append((name, old, new))
+    return len(d._fillbuf), rows
+
+
+def main(argv):
+    budgets = [int(a) for a in argv] or [480, 4_800, 9_600, 28_800]
+    for b in budgets:
+        size, rows = run(b)
+        print("fill buffer: %d bytes (%d rows @240px)" % (size, size // 480))
+        print("  %-28s %18s %18s" % ("scenario", "before calls/bytes", "after calls/bytes"))
+        for name, old, new in rows:
+            print("  %-28s %8d/%-9d %8d/%-9d" % (name, old["writes"], old["bytes"],
+                                                 new["writes"], new["bytes"]))
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
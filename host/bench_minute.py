@@ -0,0 +1,139 @@
+# host/bench_minute.py — SPI-Verkehr je Minute der Uhr-/Lade-Screens mit simuliertem Main-Loop
+# Aufruf (Repo-Root):  python3 host/bench_minute.py [sekunden]
+# Uhr-Screens laufen zweimal: normal und im Always-on ("display/aod" nach on_show, Zeile "/aod");
+# clock_analog zusätzlich mit Sekundenzeiger-Sweep (opt-in, ANALOG_SECONDS_HZ=10, Zeile "/sweep").
+# Spielt die Events des Main-Loops nach (time/sec, time/min, time/frame mit UI_FRAME_HZ nur solange
+# scr.wants_frames() wie in main.py, Spalte "frames/min",
+# status/battery + status/usb im BATTERY_UPDATE_MS-Takt, Wi-Fi/BT/Notif-Wechsel) und zählt
+# Transaktionen/Bytes am virtuellen ST7789, getrennt nach erstem Bild (on_show) und Laufzeit.
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv, vst7789
+
+hostenv.install()
+os.chdir(hostenv.ROOT)
+import config
+
+T0 = (2025, 8, 23, 10, 8, 30, 5, 235)     # Start 10:08:30, Minutenwechsel nach 30 s
+
+
+class SimTime:
+    """localtime/ticks aus einer simulierten Uhr (ms seit Start), Rest vom echten time."""
+    def __init__(self):
+        self.ms = 0
+
+    def localtime(self, *a):
+        s = T0[5] + self.ms // 1000
+        m = T0[4] + s // 60; h = T0[3] + m // 60
+        return (T0[0], T0[1], T0[2], h % 24, m % 60, s % 60, T0[6], T0[7])
+
+    def ticks_ms(self): return self.ms
+    def ticks_us(self): return self.ms * 1000
+    def ticks_diff(self, a, b): return a - b
+    def ticks_add(self, a, b): return a + b
+
+    def __getattr__(self, name):
+        import time
+        return getattr(time, name)
+
+
+class HostBus:
+    """subscribe(topic, cb) -> Token; publish(topic, payload) ruft die Callbacks synchron."""
+    def __init__(self):
+        self._subs = {}; self._next = 0
+
+    def subscribe(self, topic, cb):
+        self._next += 1
+        self._subs[self._next] = (topic, cb)
+        return self._next
+
+    def unsubscribe(self, token, cb=None):
+        self._subs.pop(token, None)
+
+    def publish(self, topic, payload=None):
+        for t, cb in list(self._subs.values()):
+            if t == topic: cb(payload)
+
+
+SCREENS = (("clock_digital", "screens.clock_digital", "ScreenClockDigital",
+            "ui.watchfaces_digital.gold_waves_orbitron.main"),
+           ("clock_analog", "screens.clock_analog", "ScreenClockAnalog",
+            "ui.watchfaces_analog.gold_classic_analog.main"),
+           ("charge", "screens.charge", "ScreenCharge",
+            "ui.charge_face.gold_black.main"))
+
+# Status-Wechsel innerhalb der Minute: Sekunde -> [(topic, payload), ...]
+FLAPS = {5:  [("status/wifi", {"state": "connecting"})],
+         7:  [("status/wifi", {"state": "connected"})],
+         20: [("status/bt", {"state": "connected"})],
+         40: [("status/notif", {"count": 1})],
+         45: [("status/wifi", {"state": "connecting"})],
+         46: [("status/wifi", {"state": "connected"})]}
+
+
+def _patch(sim, *mods):
+    for m in mods:
+        if hasattr(m, "_time"): m._time = sim
+        if hasattr(m, "time"): m.time = sim
+
+
+def run(sid, smod, cls, fmod, seconds=60, aod=False, sec_hz=None):
+    sim = SimTime(); bus = HostBus()
+    sm = __import__(smod, None, None, [cls]); fm = __import__(fmod, None, None, ["Face"])
+    hz0 = getattr(fm, "_CFG_SEC_HZ", None)
+    if sec_hz is not None: fm._CFG_SEC_HZ = sec_hz
+    try:
+        import ui.face_runtime as rt      # Frame-Takt der Faces (ab FaceBase)
+    except ImportError:
+        rt = None
+    _patch(sim, sm, fm, *((rt,) if rt else ()))
+    d, panel = vst7789.make_display(rotation=0)
+    d.fill_rect(0, 0, 240, 240, 0)
+    scr = getattr(sm, cls)(d, manager=None, eventbus=bus)
+    wants = getattr(scr, "wants_frames", None)
+    frames = 0
+    panel.reset()
+    scr.on_show()
+    if sec_hz is not None: fm._CFG_SEC_HZ = hz0
+    if aod: bus.publish("display/aod", {"on": True})
+    show = panel.snapshot(); panel.reset()
+    frame_ms = 1000 // int(getattr(config, "UI_FRAME_HZ", 30))
+    batt_ms = int(getattr(config, "BATTERY_UPDATE_MS", 10_000))
+    pct = 76; last = sim.localtime()
+    for ms in range(1, seconds * 1000 + 1):
+        sim.ms = ms
+        if ms % 1000 == 0:
+            lt = sim.localtime()
+            bus.publish("time/sec", {"hh": lt[3], "mm": lt[4], "ss": lt[5], "ts": lt})
+            if lt[4] != last[4]:
+                bus.publish("time/min", {"hh": lt[3], "mm": lt[4], "ts": lt})
+            last = lt
+            for topic, p in FLAPS.get(ms // 1000, ()):
+                bus.publish(topic, p)
+        if ms % frame_ms == 0 and wants and wants():
+            bus.publish("time/frame", {"ms": ms}); frames += 1
+        if ms % batt_ms == 0:
+            pct += 1
+            bus.publish("status/battery", {"percent": pct, "charging": True, "vbat_mV": 3990 + pct})
+            bus.publish("status/usb", {"state": "charging"})
+    scr.on_hide()
+    return show, panel.snapshot(), panel.checksum(), frames
+
+
+def main(argv):
+    seconds = int(argv[0]) if argv else 60
+    print("  %-18s %7s %9s %9s %10s %10s" % ("screen", "show tx", "show B", "tx/min", "B/min", "frames/min"))
+    for sid, smod, cls, fmod in SCREENS:
+        runs = [("", False, None)]
+        if sid.startswith("clock"): runs.append(("/aod", True, None))
+        if sid == "clock_analog": runs.append(("/sweep", False, 10))
+        for tag, aod, hz in runs:
+            show, rt, _, frames = run(sid, smod, cls, fmod, seconds, aod, hz)
+            k = 60.0 / seconds
+            print("  %-18s %7d %9d %9d %10d %10d" % (sid + tag, show["transactions"], show["bytes"],
+                                                    rt["transactions"] * k, rt["bytes"] * k, frames * k))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,50 @@
+# host/bench_shapes.py — SPI-Verkehr der Span-Formen vs. altem Pixel-für-Pixel-draw_line
+# Aufruf (Repo-Root):  python3 host/bench_shapes.py
+# Referenz: flache und steile Linie 240 -> 41 Transaktionen (Läufe je Zeile bzw. Spalte),
+# Zeiger 71 -> 56; die 45°-Diagonale bleibt bei 240 (jeder Lauf ist ein Pixel, kein Gewinn).
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv
+
+hostenv.install()
+
+
+def legacy_draw_line(d, x0, y0, x1, y1, c565):
+    """Bisheriges Verfahren: ein draw_pixel (eigenes Fenster) pro Punkt."""
+    dx = abs(x1 - x0); sx = 1 if x0 < x1 else -1
+    dy = -abs(y1 - y0); sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        d.draw_pixel(x0, y0, c565)
+        if x0 == x1 and y0 == y1: break
+        e2 = 2 * err
+        if e2 >= dy: err += dy; x0 += sx
+        if e2 <= dx: err += dx; y0 += sy
+
+
+SCENARIOS = (
+    ("diagonal 0,0-239,239",   lambda d: legacy_draw_line(d, 0, 0, 239, 239, 0xFFFF), lambda d: d.draw_line(0, 0, 239, 239, 0xFFFF)),
+    ("shallow 0,100-239,140",  lambda d: legacy_draw_line(d, 0, 100, 239, 140, 0xFFFF), lambda d: d.draw_line(0, 100, 239, 140, 0xFFFF)),
+    ("steep 100,0-140,239",    lambda d: legacy_draw_line(d, 100, 0, 140, 239, 0xFFFF), lambda d: d.draw_line(100, 0, 140, 239, 0xFFFF)),
+    ("hand 120,120-175,50",    lambda d: legacy_draw_line(d, 120, 120, 175, 50, 0xFFFF), lambda d: d.draw_line(120, 120, 175, 50, 0xFFFF)),
+    ("thick hand t=6",         None, lambda d: d.draw_line(120, 120, 175, 50, 0xFFFF, 6)),
+    ("ring r=100 t=6",         None, lambda d: d.draw_circle(120, 120, 100, 0xFFFF, 6)),
+    ("progress arc 0..270",    None, lambda d: d.draw_arc(120, 120, 100, 0, 270, 0xFFFF, 6)),
+    ("fill_circle r=40",       None, lambda d: d.fill_circle(120, 120, 40, 0xFFFF)),
+    ("round_rect 200x60 r=12", None, lambda d: d.fill_round_rect(20, 90, 200, 60, 12, 0xFFFF)),
+)
+
+
+def main():
+    d, p = hostenv.make_display()
+    print("  %-24s %22s %22s" % ("shape", "legacy trans/bytes", "spans trans/bytes"))
+    for name, old, new in SCENARIOS:
+        o = "-"
+        if old:
+            p.reset(); old(d); s = p.snapshot(); o = "%d/%d" % (s["transactions"], s["bytes"])
+        p.reset(); new(d); s = p.snapshot()
+        print("  %-24s %22s %22s" % (name, o, "%d/%d" % (s["transactions"], s["bytes"])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# host/bench_window.py — Transaktionen/Bytes pro Icon-Update: altes _set_window vs. Fast-Path
+# Aufruf (Repo-Root):  python3 host/bench_window.py
+import sys, os, struct
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv
+
+hostenv.install()
+
+
+def legacy_set_window(d, x0, y0, x1, y1):
+    """Bisheriges Verfahren: CASET, RASET, RAMWR je mit eigenem CS-Zyklus und neuen Objekten."""
+    if x0 < 0: x0 = 0
+    if y0 < 0: y0 = 0
+    if x1 >= d._w: x1 = d._w - 1
+    if y1 >= d._h: y1 = d._h - 1
+    for c, a in ((0x2A, struct.pack(">HH", x0 + d._xoff, x1 + d._xoff)),
+                 (0x2B, struct.pack(">HH", y0 + d._yoff, y1 + d._yoff))):
+        d._cs.off(); d._dc.off(); d._spi.write(bytes([c])); d._dc.on(); d._spi.write(a); d._cs.on()
+    d._cs.off(); d._dc.off(); d._spi.write(bytes([0x2C])); d._dc.on()
+
+
+ICON = bytearray(20 * 20 * 2)
+
+SCENARIOS = (
+    ("icon 20x20 (new spot)",      lambda d: d.blit_rgb565(10, 5, 20, 20, ICON)),
+    ("icon 20x20 (same spot x2)",  lambda d: [d.blit_rgb565(34, 5, 20, 20, ICON) for _ in range(2)]),
+    ("5 status icons",             lambda d: [d.blit_rgb565(10 + 24 * i, 5, 20, 20, ICON) for i in range(5)]),
+    ("seconds slot 24x22 x2",      lambda d: [d.blit_rgb565(110, 218, 24, 22, ICON) for _ in range(2)]),
+    ("hand line 120,120-175,50",   lambda d: d.draw_line(120, 120, 175, 50, 0xFFFF)),
+)
+
+
+def main():
+    d, p = hostenv.make_display()
+    fast = d._set_window
+    print("  %-28s %24s %24s" % ("update", "before trans/bytes(cmd)", "after trans/bytes(cmd)"))
+    for name, sc in SCENARIOS:
+        res = []
+        for legacy in (True, False):
+            d._set_window = (lambda *a: legacy_set_window(d, *a)) if legacy else fast
+            d._win_reset()
+            p.reset(); sc(d); s = p.snapshot()
+            res.append("%d/%d(%d)" % (s["transactions"], s["bytes"], s["cmd_bytes"]))
+        print("  %-28s %24s %24s" % (name, res[0], res[1]))
+    d._set_window = fast
+
+
+if __name__ == "__main__":
+    main()
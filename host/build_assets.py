@@ -0,0 +1,232 @@
+# host/build_assets.py — Watchface-Assets aus Quellen + Layout bauen (Dedupe, Packen, Meta, .idx, Report)
+# Aufruf (Repo-Root):
+#   python3 host/build_assets.py                 # alle ui/**/build.json bauen + Größenreport
+#   python3 host/build_assets.py --dry-run       # nur Report, nichts schreiben
+#   python3 host/build_assets.py ui/.../build.json
+#
+# build.json (neben manifest.json des Faces):
+#   {"assets": "assets", "bg": "bg_full.bin",
+#    "atlases": [{"name": "digits", "keys": ["slot", "char"], "list": "tiles",
+#                 "src": "../../../host/assets_src/<face>",              # Quellen (relativ zu build.json;
+#                                                                         # Default: assets), nicht aufs Gerät
+#                 "import": ["digit_atlas.bin", "digit_meta.json"],      # gebackenes Bundle übernehmen
+#                 "sprites": [{"slot": "H1", "char": "0", "x": 45, "y": 20,
+#                              "src": "src/h1_0.ppm"},                    # oder Einzelbilder
+#                             {"...": "...", "src": "src/sheet.bin", "size": [220, 440],
+#                              "rect": [0, 0, 110, 110]}],                # Ausschnitt aus RGB565-Rohbild
+#                 "encode": "raw" | "rle" | "ink",                        # ink: nur Pixel != BG
+#                 "compose": {"SS": 2},                                   # Mehrzeichen-Slots zerlegen
+#                 "out": ["digit_ink.bin", "digit_ink_meta.json"]}]}
+#
+# Pipeline je Atlas: Quellen laden -> mehrstellige Slots in Einzelzeichen-Zellen zerlegen, wenn das
+# byte-identisch geht -> identische Kacheln zusammenlegen -> lückenlos packen (kein Stride, kein
+# Padding) -> kodieren -> <out>.bin + <out>_meta.json + .idx (host/index_compile.py).
+import sys, os, json, hashlib
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from index_compile import compile_file
+from rle_convert import encode as rle_encode
+from ink_convert import encode as ink_encode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ---- Quellen ---------------------------------------------------------------
+def _rgb565(r, g, b):
+    v = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    return bytes(((v >> 8) & 0xFF, v & 0xFF))
+
+
+def load_ppm(path):
+    """Binäres PPM (P6, maxval 255) -> (w, h, RGB565-BE)."""
+    with open(path, "rb") as f: data = f.read()
+    tok = []; i = 0
+    while len(tok) < 4:
+        while data[i:i + 1].isspace(): i += 1
+        if data[i:i + 1] == b"#":
+            while data[i:i + 1] not in (b"\n", b""): i += 1
+            continue
+        j = i
+        while not data[j:j + 1].isspace(): j += 1
+        tok.append(data[i:j]); i = j
+    if tok[0] != b"P6" or int(tok[3]) != 255:
+        raise ValueError("%s: nur P6/255" % path)
+    w, h = int(tok[1]), int(tok[2]); i += 1
+    px = data[i:i + w * h * 3]
+    return w, h, b"".join(_rgb565(px[k], px[k + 1], px[k + 2]) for k in range(0, len(px), 3))
+
+
+def _crop(px, sw, rect):
+    x, y, w, h = rect
+    return b"".join(px[((y + r) * sw + x) * 2:((y + r) * sw + x + w) * 2] for r in range(h))
+
+
+def _sprite(base, sp, cache):
+    src = os.path.join(base, sp["src"])
+    if src not in cache:
+        if src.endswith(".ppm"):
+            cache[src] = load_ppm(src)
+        else:
+            sw, sh = sp["size"]
+            with open(src, "rb") as f: cache[src] = (sw, sh, f.read())
+    sw, sh, px = cache[src]
+    rect = sp.get("rect") or (0, 0, sw, sh)
+    return rect[2], rect[3], _crop(px, sw, rect) if tuple(rect) != (0, 0, sw, sh) else px
+
+
+def _import(base, bin_name, meta_name, listkey):
+    """Gebackenes Bundle (Atlas + Meta) als Quelle: -> (meta-Kopf, [eintrag, pixel])."""
+    with open(os.path.join(base, bin_name), "rb") as f: atlas = f.read()
+    with open(os.path.join(base, meta_name), "r", encoding="utf-8") as f: meta = json.load(f)
+    stride = int((meta.get("atlas") or {}).get("w") or 0) * 2
+    items = []
+    for e in meta[listkey]:
+        off = int(e["offset"]); w = int(e["w"]); h = int(e["h"])
+        if "length" in e or not stride:
+            px = atlas[off:off + w * h * 2]
+        else:
+            px = b"".join(atlas[off + r * stride:off + r * stride + w * 2] for r in range(h))
+        items.append([dict(e), px])
+    return meta, items
+
+
+# ---- Zerlegen mehrstelliger Slots --------------------------------------------
+def split_cells(items, keys, slot, n):
+    """
+    Kacheln eines Slots mit n-stelligen Schlüsseln in n gleich breite Zellen zerlegen, wenn
+    jede Zelle nur vom Zeichen an ihrer Stelle abhängt. -> (neue Einträge, None) oder (None, Grund).
+    """
+    sk, ck = keys[0], keys[1]
+    tiles = [it for it in items if it[0].get(sk) == slot]
+    if not tiles: return None, "keine Kacheln"
+    w = tiles[0][0]["w"]; h = tiles[0][0]["h"]
+    if w % n or any(len(str(t[0][ck])) != n for t in tiles):
+        return None, "Breite %d nicht in %d Zellen teilbar" % (w, n)
+    cw = w // n
+    cells = {}; bad = 0
+    for i in range(n):
+        for e, px in tiles:
+            cell = b"".join(px[(r * w + i * cw) * 2:(r * w + (i + 1) * cw) * 2] for r in range(h))
+            k = (i, str(e[ck])[i])
+            if cells.setdefault(k, cell) != cell: bad += 1
+    if bad:
+        return None, "%d Zellen hängen vom Nachbarzeichen ab" % bad
+    e0 = tiles[0][0]; out = []
+    for (i, ch), cell in sorted(cells.items()):
+        e = {sk: "%s%d" % (slot, i), ck: ch, "x": e0["x"] + i * cw, "y": e0["y"], "w": cw, "h": h}
+        out.append([e, cell])
+    return out, None
+
+
+# ---- Bauen -------------------------------------------------------------------
+def build_atlas(base, spec, bg, dry=False, src=None):
+    keys = spec.get("keys") or ["group", "state"]
+    listkey = spec.get("list") or "items"
+    src = src or base
+    head = {listkey: None}; items = []
+    if spec.get("import"):
+        head, items = _import(src, spec["import"][0], spec["import"][1], listkey)
+    cache = {}
+    for sp in spec.get("sprites") or ():
+        w, h, px = _sprite(src, sp, cache)
+        e = dict((k, sp[k]) for k in sp if k not in ("src", "size", "rect"))
+        e["w"] = w; e["h"] = h
+        items.append([e, px])
+    raw_in = sum(len(px) for _, px in items)
+    n_in = len(items)
+
+    # 1) Mehrzeichen-Slots in Einzelzeichen zerlegen (nur wenn byte-identisch)
+    notes = []
+    for slot, n in sorted((spec.get("compose") or {}).items()):
+        cells, why = split_cells(items, keys, slot, int(n))
+        if cells is None:
+            notes.append("%s: bleibt gebacken (%s)" % (slot, why))
+            continue
+        before = len([1 for e, _ in items if e.get(keys[0]) == slot])
+        items = [it for it in items if it[0].get(keys[0]) != slot] + cells
+        notes.append("%s: %d Kacheln -> %d Einzelzeichen" % (slot, before, len(cells)))
+
+    # 2) Kodieren + identische Kacheln zusammenlegen, lückenlos packen
+    enc = spec.get("encode") or "raw"
+    out = bytearray(); seen = {}; lst = []
+    for e, px in items:
+        w, h = int(e["w"]), int(e["h"])
+        if enc == "ink":
+            data = ink_encode(px, bg, int(e["x"]), int(e["y"]), w, h)
+        elif enc == "rle":
+            data = rle_encode(px, w, h)
+        else:
+            data = px
+        dg = hashlib.sha1(data).digest() + b"%d,%d" % (w, h)
+        off = seen.get(dg)
+        if off is None:
+            off = len(out); seen[dg] = off; out += data
+        # Feldreihenfolge der Quelle bleibt erhalten, offset/length zeigen in den neuen Atlas
+        e["offset"] = off; e["length"] = len(data)
+        if enc != "raw": e["enc"] = enc
+        lst.append(e)
+    # Schlüsselreihenfolge der Quelle (Liste an ihrem Platz): erneutes Bauen ist diff-frei
+    meta = dict((k, lst if k == listkey else v) for k, v in head.items())
+    meta.setdefault(listkey, lst)
+    if enc == "ink":
+        meta["atlas"] = {"format": "RGB565_INK", "bg": spec.get("bg_name", "bg_full.bin")}
+    elif enc == "rle":
+        meta["atlas"] = {"format": "RGB565_RLE"}
+    else:
+        meta.pop("atlas", None)
+    rep = {"name": spec.get("name", spec["out"][0]), "tiles_in": n_in, "bytes_in": raw_in,
+           "tiles": len(lst), "unique": len(seen), "bytes": len(out), "enc": enc, "notes": notes}
+    if not dry:
+        bin_path = os.path.join(base, spec["out"][0]); meta_path = os.path.join(base, spec["out"][1])
+        with open(bin_path, "wb") as f: f.write(out)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False); f.write("\n")
+        rep["idx"] = os.path.getsize(compile_file(meta_path)[0])
+    return rep
+
+
+def build_face(layout_path, dry=False):
+    with open(layout_path, "r", encoding="utf-8") as f: lay = json.load(f)
+    base = os.path.join(os.path.dirname(layout_path), lay.get("assets", "assets"))
+    bg = b""
+    if lay.get("bg"):
+        with open(os.path.join(base, lay["bg"]), "rb") as f: bg = f.read()
+    reps = []
+    for spec in lay.get("atlases") or ():
+        spec = dict(spec); spec.setdefault("bg_name", lay.get("bg"))
+        src = os.path.join(os.path.dirname(layout_path), spec["src"]) if spec.get("src") else None
+        reps.append(build_atlas(base, spec, bg, dry, src))
+    return os.path.relpath(os.path.dirname(layout_path), ROOT), len(bg), reps
+
+
+def report(face, bg_bytes, reps):
+    print("%s" % face)
+    print("  %-10s %5s %6s %6s %9s %9s %5s %6s" % ("atlas", "enc", "tiles", "uniq", "in", "out", "%", "idx"))
+    tin = bg_bytes; tout = bg_bytes
+    if bg_bytes:
+        print("  %-10s %5s %6s %6s %9d %9d %5s" % ("bg", "raw", 1, 1, bg_bytes, bg_bytes, "100"))
+    for r in reps:
+        tin += r["bytes_in"]; tout += r["bytes"] + r.get("idx", 0)
+        print("  %-10s %5s %6d %6d %9d %9d %5.1f %6s" % (
+            r["name"], r["enc"], r["tiles"], r["unique"], r["bytes_in"], r["bytes"],
+            100.0 * r["bytes"] / max(1, r["bytes_in"]), r.get("idx", "-")))
+        for n in r["notes"]:
+            print("      %s" % n)
+    print("  %-10s %5s %6s %6s %9d %9d %5.1f" % ("gesamt", "", "", "", tin, tout, 100.0 * tout / max(1, tin)))
+
+
+def _find_layouts():
+    for base, _dirs, files in os.walk(os.path.join(ROOT, "ui")):
+        if "build.json" in files:
+            yield os.path.join(base, "build.json")
+
+
+def main(argv):
+    dry = "--dry-run" in argv
+    paths = [a for a in argv if not a.startswith("--")] or sorted(_find_layouts())
+    for p in paths:
+        report(*build_face(p, dry))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,134 @@
+# host/hands_build.py — Zeigergeometrie des Analog-Faces vorberechnen (assets/hands.bin)
+# Aufruf (Repo-Root):
+#   python3 host/hands_build.py          # gold_classic_analog: 181 Stunden- + 16 Minutenpositionen
+# Rastert den ersten Quadranten (0..90°) mit Kantendeckung (Gleitkomma, nur hier am Host), packt
+# jede Position als Zeilenprofil (Format: lib/hand_table.py) und prüft beim Rücklesen:
+#   - jede gebaute Position kommt pixelgleich aus HandTable zurück
+#   - alle 780 Positionen (gespiegelt) gegen direktes Rastern: Zahl abweichender Pixel
+import sys, os, struct
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv
+
+hostenv.install()
+os.chdir(hostenv.ROOT)
+from lib.hand_table import MAGIC, REC_MAX, SRC_MAX, HandSpans, HandTable, encode
+
+FACE = "ui.watchfaces_analog.gold_classic_analog.main"
+QH, QM = 180, 15          # Quadrant: 180 Stunden- (0,5°) und 15 Minutenschritte (6°)
+
+
+def capsule_rows(face, rows, x0, y0, x1, y1, r0, c, taper):
+    """
+    Kapsel von (x0,y0) nach (x1,y1), Radius r0, zur Spitze hin auf 1 px verjüngt, mit
+    Kantendeckung: Abstand Pixelmitte–Achse gegen Radius → Alpha 0..15 (Spans: c | a<<4,
+    a=0 deckend). Je Zeile werden nur die x-Werte nahe der Achse geprüft.
+    """
+    import math
+    dx = x1-x0; dy = y1-y0; L2 = dx*dx + dy*dy; L = math.sqrt(L2) or 1.0
+    R = r0 + 1.0
+    for y in range(int(math.floor(min(y0, y1) - R)), int(math.ceil(max(y0, y1) + R)) + 1):
+        # Achsenparameter t, deren Punkte höchstens R von der Zeile entfernt liegen
+        if dy:
+            ta = (y - R - y0)/dy; tb = (y + R - y0)/dy
+            if ta > tb: ta, tb = tb, ta
+            if ta < 0.0: ta = 0.0
+            if tb > 1.0: tb = 1.0
+            if ta > tb: continue
+        else:
+            ta, tb = 0.0, 1.0
+        xa = x0 + dx*ta; xb = x0 + dx*tb
+        if xa > xb: xa, xb = xb, xa
+        for x in range(int(math.floor(xa - R)), int(math.ceil(xb + R)) + 1):
+            px = x - x0; py = y - y0
+            t = (px*dx + py*dy)/L2 if L2 else 0.0
+            t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+            s = t*L
+            r = r0 - (s - (L - taper))*(r0 - 1.0)/taper if s > L - taper else r0
+            ex = px - dx*t; ey = py - dy*t
+            cov = r + 0.5 - math.sqrt(ex*ex + ey*ey)
+            a = 15 if cov >= 1.0 else int(cov*15.0 + 0.5)
+            if a <= 0: continue
+            face._span_add(rows, y, x, x, c if a >= 15 else c | (a << 4))
+
+
+def hand_rows(face, pos):
+    """Zeilenspans eines Zeigers in Position pos (0..719 Stunde, 720..779 Minute)."""
+    import math
+    if pos < 720:
+        ang = ((pos//60)/12.0)*360.0 + ((pos%60)/60.0)*30.0 - 90.0
+        ln, th, taper = face.hr_len, face.hr_th, 8
+    else:
+        ang = ((pos-720)/60.0)*360.0 - 90.0
+        ln, th, taper = face.min_len, face.min_th, 12
+    ex = face.cx + math.cos(ang*math.pi/180.0)*ln
+    ey = face.cy + math.sin(ang*math.pi/180.0)*ln
+    rows = {}
+    capsule_rows(face, rows, face.cx, face.cy, ex, ey, th/2.0, 0, taper)
+    return rows
+
+
+def _pixels(rows_or_spans):
+    """{(x, y): deckung} aus Zeilenspans-dict oder HandSpans."""
+    out = {}
+    if isinstance(rows_or_spans, dict):
+        for y, lst in rows_or_spans.items():
+            for xa, xb, c in lst:
+                for x in range(xa, xb + 1): out[(x, y)] = c >> 4 or 15
+        return out
+    sp = rows_or_spans; b = sp.buf
+    for y in range(sp.y0, sp.y0 + sp.n):
+        a, e = sp.row(y)
+        for k in range(a, e, 3):
+            for x in range(b[k], b[k + 1] + 1): out[(x, y)] = b[k + 2] >> 4 or 15
+    return out
+
+
+def build(modname=FACE):
+    mod = __import__(modname, None, None, ["Face"])
+    # Face ohne Tabelle bauen: hands.bin fehlt oder ist veraltet, nur Geometrie wird gebraucht
+    load = mod._load_hands; mod._load_hands = lambda path: None
+    try: face = mod.Face(display=None)
+    finally: mod._load_hands = load
+    pos = list(range(QH + 1)) + [720 + m for m in range(QM + 1)]
+    rows = [hand_rows(face, p) for p in pos]
+    recs = [encode(r) for r in rows]
+    out = bytearray(MAGIC + struct.pack(">HHBBBB", QH, QM, face.cx, face.cy, 0, 0))
+    o = len(out) + (len(recs) + 1) * 4
+    offs = []
+    for r in recs:
+        offs.append(o); o += len(r)
+    offs.append(o)
+    out += struct.pack(">%dI" % len(offs), *offs)
+    for r in recs: out += r
+    path = face._hands_path
+    with open(path, "wb") as f: f.write(out)
+    return path, pos, rows, recs, face, mod
+
+
+def verify(path, pos, rows, face, mod):
+    """-> (Records nicht pixelgleich, abweichende Pixel aller Positionen, größter Span-Puffer)."""
+    ht = HandTable(path); sp = HandSpans(); bad = 0; diff = 0; big = 0
+    for p, r in zip(pos, rows):
+        ht.read(p, sp)
+        if _pixels(sp) != _pixels(r): bad += 1
+    for p in range(mod.HAND_POS):
+        ht.read(p, sp); big = max(big, sp.start[sp.n])
+        a = _pixels(sp); b = _pixels(hand_rows(face, p))
+        diff += sum(1 for k in set(a) | set(b) if a.get(k) != b.get(k))
+    ht.close()
+    return bad, diff, big
+
+
+def main(argv):
+    path, pos, rows, recs, face, mod = build(*argv[:1])
+    src = max(len(r) for r in recs)
+    print("%s: %d Records für %d Positionen, %d Bytes (größter Record %d/%d)" % (
+        os.path.relpath(path, hostenv.ROOT), len(recs), mod.HAND_POS, os.path.getsize(path), src, SRC_MAX))
+    bad, diff, big = verify(path, pos, rows, face, mod)
+    print("Rücklesen: %s; gespiegelt gegen direkt gerastert: %d Pixel verschieden; Span-Puffer %d/%d" % (
+        "ok" if not bad else "%d Records verschieden" % bad, diff, big, REC_MAX))
+    return 1 if bad or src > SRC_MAX or big > REC_MAX else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,152 @@
+# host/hostenv.py — Host-Umgebung (CPython) für Treiber-/Render-Benchmarks ohne Hardware
+# Stellt machine (Pin/SPI/PWM/I2C), core.logger (falls nicht vorhanden) und die
+# MicroPython-Erweiterungen von time bereit, damit lib/display_st7789.py auf dem PC läuft.
+# Nur für Host-Skripte gedacht – wird nie auf die Uhr kopiert.
+import os, sys, time, types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_INSTALLED = False
+
+
+class HostPin:
+    OUT = 1; IN = 0; PULL_UP = 2; PULL_DOWN = 3
+    IRQ_FALLING = 1; IRQ_RISING = 2
+
+    def __init__(self, pin_id=None, mode=None, pull=None, value=None, **kw):
+        self.id = pin_id
+        self.role = None          # "cs" / "dc", gesetzt von attach()
+        self.listener = None      # Objekt mit pin_changed(pin, v)
+        self._v = 1 if value else 0
+
+    def value(self, v=None):
+        if v is None:
+            return self._v
+        v = 1 if v else 0
+        if v != self._v:
+            self._v = v
+            if self.listener:
+                self.listener.pin_changed(self, v)
+
+    def on(self):  self.value(1)
+    def off(self): self.value(0)
+    def irq(self, *a, **k): return None
+
+
+class HostSPI:
+    def __init__(self, bus_id=None, **kw):
+        self.baudrate = kw.get("baudrate")
+        self.listener = None      # Objekt mit spi_write(buf)
+
+    def write(self, buf):
+        if self.listener:
+            self.listener.spi_write(buf)
+
+    def deinit(self): pass
+
+
+class HostPWM:
+    def __init__(self, pin=None, freq=0, duty_u16=0, **kw):
+        self._duty = duty_u16
+    def duty_u16(self, v=None):
+        if v is None: return self._duty
+        self._duty = v
+    def duty(self, v=None): return 0
+    def freq(self, v=None): return 0
+
+
+class HostI2C:
+    def __init__(self, *a, **k): pass
+    def readfrom_mem(self, addr, reg, n): return bytes(n)
+    def writeto_mem(self, addr, reg, buf): pass
+    def scan(self): return []
+
+
+class Probe:
+    """Zählt SPI-Verkehr: Transaktionen (CS-Low-Flanken), write()-Aufrufe, Bytes, Command-Bytes."""
+    def __init__(self):
+        self._dc = 1
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0
+        self.writes = 0
+        self.bytes = 0
+        self.cmd_bytes = 0
+
+    def pin_changed(self, pin, v):
+        if pin.role == "cs" and v == 0:
+            self.transactions += 1
+        elif pin.role == "dc":
+            self._dc = v
+
+    def spi_write(self, buf):
+        n = len(buf)
+        self.writes += 1
+        self.bytes += n
+        if not self._dc:
+            self.cmd_bytes += n
+
+    def snapshot(self):
+        return {"transactions": self.transactions, "writes": self.writes,
+                "bytes": self.bytes, "cmd_bytes": self.cmd_bytes}
+
+
+def _patch_time():
+    t0 = time.perf_counter()
+    def ticks_us(): return int((time.perf_counter() - t0) * 1_000_000)
+    def ticks_ms(): return int((time.perf_counter() - t0) * 1_000)
+    for name, fn in (("sleep_us", lambda us: None),
+                     ("sleep_ms", lambda ms: None),
+                     ("ticks_us", ticks_us),
+                     ("ticks_ms", ticks_ms),
+                     ("ticks_diff", lambda a, b: a - b),
+                     ("ticks_add", lambda a, b: a + b)):
+        if not hasattr(time, name):
+            setattr(time, name, fn)
+
+
+def install():
+    """Idempotent: Shims registrieren und Repo-Root in sys.path aufnehmen."""
+    global _INSTALLED
+    if _INSTALLED:
+        return
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    _patch_time()
+    if "machine" not in sys.modules:
+        m = types.ModuleType("machine")
+        m.Pin = HostPin; m.SPI = HostSPI; m.PWM = HostPWM; m.I2C = HostI2C
+        m.RTC = lambda *a, **k: None
+        sys.modules["machine"] = m
+    try:
+        import core.logger  # noqa: F401 (echtes Modul bevorzugen)
+    except Exception:
+        core = sys.modules.get("core") or types.ModuleType("core")
+        core.__path__ = []
+        lg = types.ModuleType("core.logger")
+        def _log(*a, **k): pass
+        lg.info = lg.warn = lg.debug = lg.error = _log
+        lg.set_level = lambda *a, **k: None
+        core.logger = lg
+        sys.modules["core"] = core
+        sys.modules["core.logger"] = lg
+    _INSTALLED = True
+
+
+def attach(disp, listener):
+    """Hängt listener (Probe o.ä.) an CS/DC/SPI eines ST7789Display."""
+    disp._cs.role = "cs"; disp._dc.role = "dc"
+    disp._cs.listener = listener; disp._dc.listener = listener
+    disp._spi.listener = listener
+    listener.pin_changed(disp._dc, disp._dc.value())   # aktuellen DC-Pegel übernehmen
+    return listener
+
+
+def make_display(probe=None, **kw):
+    """Erzeugt ein ST7789Display auf Host-SPI; liefert (disp, probe)."""
+    install()
+    from lib import display_st7789
+    disp = display_st7789.ST7789Display(**kw)
+    probe = attach(disp, probe or Probe())
+    probe.reset()
+    return disp, probe
@@ -0,0 +1,76 @@
+# host/index_compile.py — *_meta.json unter ui/ in binäre Fixed-Record-Indizes (.idx) übersetzen
+# Aufruf (Repo-Root):  python3 host/index_compile.py [pfad ...]   (Default: alle *_meta*.json unter ui/)
+# Format (lib/asset_index.py):
+#   Header  ">4sHHH": b"AIX1", count, key_len, stride (Atlasbreite in px, 0 = Kacheln zusammenhängend)
+#   Record  key (key_len Bytes, UTF-8, mit 0 aufgefüllt, bytewise sortiert)
+#           ">IIhhHH": offset, length, x, y, w, h
+# Schlüssel: "slot:char" (digit_meta), "group:state" (icons/quick_p1), "ch" (glyph_meta).
+import sys, os, json, struct
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAGIC = b"AIX1"
+KEY_FIELDS = ("slot", "group", "char", "state", "ch", "name", "id")
+
+
+def _records(node, path=None):
+    """Liefert (key, eintrag) für alle Dicts mit offset/w/h (Pfad ohne den obersten Container)."""
+    if isinstance(node, dict):
+        if "offset" in node and "w" in node and "h" in node:
+            parts = [str(node[k]) for k in KEY_FIELDS if k in node]
+            yield ":".join(parts or path or ()), node
+            return
+        for k, v in node.items():
+            if k.startswith("_"): continue
+            for r in _records(v, () if path is None else path + (str(k),)): yield r
+    elif isinstance(node, list):
+        for v in node:
+            for r in _records(v, path or ()): yield r
+
+
+def compile_meta(meta):
+    entries = list(_records(meta))
+    atlas = meta.get("atlas")
+    # Kacheln ohne "length" liegen als Unterrechteck im Atlas -> Zeilenlänge mitgeben
+    stride = 0
+    if isinstance(atlas, dict) and not all("length" in e for _, e in entries):
+        stride = int(atlas.get("w") or 0)
+    recs = {}
+    for key, e in entries:
+        w = int(e["w"]); h = int(e["h"])
+        recs[key.encode("utf-8")] = (int(e["offset"]), int(e.get("length", w * h * 2)),
+                                     int(e.get("x", 0)), int(e.get("y", 0)), w, h)
+    klen = max([len(k) for k in recs] or [1])
+    out = bytearray(struct.pack(">4sHHH", MAGIC, len(recs), klen, stride))
+    for k in sorted(recs):
+        out += k + b"\0" * (klen - len(k))
+        out += struct.pack(">IIhhHH", *recs[k])
+    return bytes(out), len(recs)
+
+
+def compile_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    data, n = compile_meta(meta)
+    out = os.path.splitext(path)[0] + ".idx"
+    with open(out, "wb") as f:
+        f.write(data)
+    return out, n, os.path.getsize(path), len(data)
+
+
+def _find_metas():
+    for base, _dirs, files in os.walk(os.path.join(ROOT, "ui")):
+        for fn in sorted(files):
+            if fn.endswith(".json") and "_meta" in fn:
+                yield os.path.join(base, fn)
+
+
+def main(argv):
+    paths = argv or sorted(_find_metas())
+    for p in paths:
+        out, n, a, b = compile_file(p)
+        print("%-70s %4d Einträge  %6d -> %5d Bytes" % (os.path.relpath(out, ROOT), n, a, b))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
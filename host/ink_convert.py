@@ -0,0 +1,106 @@
+# host/ink_convert.py — Kachel-Atlas (Ziffern auf BG) in hintergrundunabhängige Tinte zerlegen
+# Aufruf (Repo-Root):
+#   python3 host/ink_convert.py [atlas.bin meta.json bg.bin]   # Default: gold_waves_orbitron
+#   -> <atlas-dir>/digit_ink.bin + digit_ink_meta.json (+ .idx) und Vergleich aller Kacheln
+# Der gebackene Atlas liegt als Build-Quelle in host/assets_src (nicht auf dem Gerät); die
+# ausgelieferten Kacheln baut host/build_assets.py (mit Zerlegen/Dedupe) in das assets-Verzeichnis.
+# Jede Kachel speichert nur die Pixel, die vom BG abweichen (Format: lib/ink_atlas.py);
+# zur Laufzeit wird der BG-Ausschnitt darunter gelegt. Der Vergleich setzt jede Kachel
+# mit lib.ink_atlas.InkAtlas zusammen und prüft sie Byte für Byte gegen den alten Atlas.
+import sys, os, json
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv
+from index_compile import compile_file
+
+hostenv.install()
+from lib.ink_atlas import InkAtlas, INK_RUN, INK_LIT
+
+ASSETS = os.path.join(hostenv.ROOT, "ui", "watchfaces_digital", "gold_waves_orbitron", "assets")
+SRC = os.path.join(hostenv.ROOT, "host", "assets_src", "gold_waves_orbitron")
+LCD_W = 240
+
+
+def encode(tile, bg, x, y, w, h):
+    n = w * h
+    p = [tile[i * 2:i * 2 + 2] for i in range(n)]
+    b = []
+    for r in range(h):
+        o = ((y + r) * LCD_W + x) * 2
+        b += [bg[o + c * 2:o + c * 2 + 2] for c in range(w)]
+    out = bytearray(); i = 0; end = 0
+    while i < n:
+        if p[i] == b[i]:
+            j = i
+            while j < n and j - i < 64 and p[j] == b[j]: j += 1
+            out.append(j - i - 1); i = j
+            continue
+        j = i
+        while j < n and j - i < 64 and p[j] == p[i] and p[j] != b[j]: j += 1
+        if j - i >= 2:
+            out.append(INK_RUN | (j - i - 1)); out += p[i]; i = j; end = len(out)
+            continue
+        # Literal bis BG-Pixel, Lauf (>= 2 gleiche) oder 128 Pixel
+        j = i + 1
+        while j < n and j - i < 128 and p[j] != b[j] and not (j + 1 < n and p[j + 1] == p[j]):
+            j += 1
+        out.append(INK_LIT | (j - i - 1)); out += b"".join(p[i:j]); i = j; end = len(out)
+    # durchsichtiges Kachelende braucht keine Pakete (Decoder hört am Datenende auf)
+    return bytes(out[:end])
+
+
+def convert(atlas_path, meta_path, bg_path):
+    with open(atlas_path, "rb") as f: atlas = f.read()
+    with open(bg_path, "rb") as f: bg = f.read()
+    with open(meta_path, "r", encoding="utf-8") as f: meta = json.load(f)
+    out = bytearray()
+    for t in meta["tiles"]:
+        x, y, w, h = t["x"], t["y"], t["w"], t["h"]
+        enc = encode(atlas[t["offset"]:t["offset"] + w * h * 2], bg, x, y, w, h)
+        t["offset"] = len(out); t["length"] = len(enc); t["enc"] = "ink"
+        out += enc
+    meta["atlas"] = {"format": "RGB565_INK", "bg": os.path.basename(bg_path)}
+    d = os.path.dirname(atlas_path)
+    ink_path = os.path.join(d, "digit_ink.bin")
+    meta_out = os.path.join(d, "digit_ink_meta.json")
+    with open(ink_path, "wb") as f: f.write(out)
+    with open(meta_out, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False); f.write("\n")
+    idx, _n, _a, _b = compile_file(meta_out)
+    return ink_path, meta_out, idx
+
+
+def verify(atlas_path, meta_path, bg_path, ink_path, ink_meta_path):
+    """Alle Kacheln zusammensetzen und mit dem Original vergleichen -> (gleich, gesamt)."""
+    with open(atlas_path, "rb") as f: atlas = f.read()
+    with open(bg_path, "rb") as f: bg = f.read()
+    with open(meta_path, "r", encoding="utf-8") as f: old = json.load(f)["tiles"]
+    with open(ink_meta_path, "r", encoding="utf-8") as f: new = json.load(f)["tiles"]
+    ink = InkAtlas(ink_path, 16_384)
+    same = 0
+    for a, b in zip(old, new):
+        ref = atlas[a["offset"]:a["offset"] + a["length"]]
+        got = ink.get(b["x"], b["y"], b["w"], b["h"], b["offset"], b["length"], bg)
+        if bytes(got) == ref: same += 1
+        else: print("  DIFF %s/%s" % (a["slot"], a["char"]))
+    ink.close()
+    return same, len(old)
+
+
+def main(argv):
+    if len(argv) >= 3:
+        atlas_path, meta_path, bg_path = argv[:3]
+    else:
+        atlas_path = os.path.join(SRC, "digit_atlas.bin")
+        meta_path = os.path.join(SRC, "digit_meta.json")
+        bg_path = os.path.join(ASSETS, "bg_full.bin")
+    ink_path, ink_meta, idx = convert(atlas_path, meta_path, bg_path)
+    a = os.path.getsize(atlas_path); b = os.path.getsize(ink_path)
+    print("%s: %d -> %d Bytes (%.1f%%), %s, %s" % (os.path.basename(ink_path), a, b, 100.0 * b / a,
+                                                  os.path.basename(ink_meta), os.path.basename(idx)))
+    same, total = verify(atlas_path, meta_path, bg_path, ink_path, ink_meta)
+    print("Vergleich: %d/%d Kacheln byte-identisch" % (same, total))
+    return 0 if same == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,124 @@
+# host/render_faces.py — Watchfaces am virtuellen ST7789 rendern, Verkehr zählen, Goldens prüfen
+# Aufruf (Repo-Root):
+#   python3 host/render_faces.py              # Tabelle + Vergleich mit host/golden.json
+#   python3 host/render_faces.py --update     # Goldens neu schreiben (nach gewollter Bildänderung)
+#   python3 host/render_faces.py --dump /tmp/frames   # Frames als PPM ablegen
+# Exit-Code 1, wenn ein Frame vom Golden abweicht.
+import sys, os, json
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hostenv, vst7789
+
+hostenv.install()
+os.chdir(hostenv.ROOT)          # Faces lesen Assets relativ zum Repo-Root
+
+GOLDEN = os.path.join(hostenv.ROOT, "host", "golden.json")
+TS = (2025, 8, 23, 10, 8, 30, 5, 235)     # feste Uhrzeit für reproduzierbare Frames
+
+
+class _FixedTime:
+    def localtime(self, *a): return TS
+    def __getattr__(self, name):
+        import time
+        return getattr(time, name)
+
+
+def _load(modname):
+    mod = __import__(modname, None, None, ["Face"])
+    if hasattr(mod, "_time"):
+        mod._time = _FixedTime()
+    return mod
+
+
+def digital(d):
+    m = _load("ui.watchfaces_digital.gold_waves_orbitron.main")
+    f = m.Face(d)
+    yield "first_frame", f.on_show
+    yield "minute", lambda: f.render(10, 9, 31)
+    yield "seconds", lambda: f.render_seconds(10, 9, 32)
+    yield "icon_burst", lambda: (f.on_wifi({"state": "connected"}),
+                                 f.on_bt({"state": "connected"}),
+                                 f.on_battery({"percent": 55, "charging": True}))
+    yield "aod_enter", lambda: f.set_aod(True, 10, 9)
+    yield "aod_minute", lambda: (f.on_wifi({"state": "off"}), f.render_aod(10, 10))
+    yield "aod_wake", lambda: f.set_aod(False, 10, 10, 5)
+
+
+def analog(d):
+    m = _load("ui.watchfaces_analog.gold_classic_analog.main")
+    f = m.Face(display=d)
+    yield "first_frame", lambda: f.render_full(10, 8, 30)
+    yield "minute", lambda: f.render(10, 9, 0)
+    yield "hour", lambda: f.render(11, 0, 0)
+    yield "seconds", lambda: f.render_sec(11, 0, 1, 0)
+    # Sweep ist opt-in (ANALOG_SECONDS_HZ > 1): hier fest 10 Hz
+    yield "sweep", lambda: (setattr(f, "_sec_hz", m._sec_rate(10)), f.render_frame(500))
+    yield "icon_burst", lambda: (f.on_wifi({"state": "connected"}),
+                                 f.on_bt({"state": "connected"}),
+                                 f.on_battery({"percent": 55, "charging": True}),
+                                 f.on_notif({"count": 2}))
+    yield "aod_enter", lambda: f.set_aod(True, 11, 0)
+    yield "aod_minute", lambda: (f.on_wifi({"state": "off"}), f.render_aod(11, 1))
+    yield "aod_wake", lambda: f.set_aod(False, 11, 1, 5)
+
+
+def charge(d):
+    m = _load("ui.charge_face.gold_black.main")
+    f = m.Face(d)
+    def first():
+        f.set_battery(76, 4012, True); f.set_usb("charging"); f.render_full()
+    yield "first_frame", first
+    yield "percent", lambda: f.set_battery(77, 4020, True)
+    yield "unplug", lambda: (f.set_usb("off"), f.set_battery(77, 3990, False))
+
+
+FACES = (("gold_waves_orbitron", digital),
+         ("gold_classic_analog", analog),
+         ("gold_black", charge))
+
+
+def run(dump=None):
+    results = []
+    for name, scen in FACES:
+        d, panel = vst7789.make_display(rotation=0)
+        d.fill_rect(0, 0, 240, 240, 0)
+        for step, fn in scen(d):
+            panel.reset()
+            fn()
+            s = panel.snapshot()
+            key = "%s/%s" % (name, step)
+            results.append((key, s, panel.checksum()))
+            if dump:
+                panel.save_ppm(os.path.join(dump, key.replace("/", "__") + ".ppm"))
+    return results
+
+
+def main(argv):
+    update = "--update" in argv
+    dump = None
+    if "--dump" in argv:
+        dump = argv[argv.index("--dump") + 1]
+        os.makedirs(dump, exist_ok=True)
+    try:
+        with open(GOLDEN) as f: golden = json.load(f)
+    except Exception:
+        golden = {}
+    results = run(dump)
+    bad = 0
+    print("  %-36s %6s %6s %8s %6s  %s" % ("face/step", "trans", "writes", "bytes", "cmd", "golden"))
+    for key, s, md5 in results:
+        g = golden.get(key)
+        st = "new" if g is None else ("ok" if g == md5 else "DIFF")
+        if st == "DIFF": bad += 1
+        print("  %-36s %6d %6d %8d %6d  %s" % (key, s["transactions"], s["writes"], s["bytes"],
+                                               s["cmd_bytes"], st))
+    if update:
+        with open(GOLDEN, "w") as f:
+            json.dump(dict((k, m) for k, _, m in results), f, indent=1, sort_keys=True)
+            f.write("\n")
+        print("golden.json aktualisiert")
+        return 0
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
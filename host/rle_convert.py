@@ -0,0 +1,113 @@
+# host/rle_convert.py — RGB565-Atlanten/-Bilder in das RLE-Format von blit_rle() wandeln
+# Aufruf (Repo-Root):
+#   python3 host/rle_convert.py atlas <atlas.bin> <meta.json>   # -> <atlas>.rle + <meta>_rle.json
+#   python3 host/rle_convert.py raw <bild.bin> <w> <h>          # -> <bild>.rle
+# Meta-Einträge mit offset/w/h werden übernommen; offset/length zeigen danach in
+# die .rle-Datei, "enc": "rle" markiert sie. Sprites ohne "length" werden mit der
+# Atlasbreite (meta["atlas"]["w"]) als Zeilenlänge ausgeschnitten (z.B. quick_p1).
+import sys, os, json, struct
+
+MAGIC = b"RL16"
+
+
+def encode(px, w, h):
+    """px: RGB565-BE (w*h*2 Bytes) -> RLE-Sprite inkl. Header."""
+    out = bytearray(MAGIC + struct.pack(">HH", w, h))
+    n = w * h
+    p = [px[i * 2:i * 2 + 2] for i in range(n)]
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and j - i < 128 and p[j] == p[i]:
+            j += 1
+        if j - i >= 2:
+            out.append(0x80 | (j - i - 1)); out += p[i]
+            i = j
+            continue
+        # Literal bis zum nächsten Lauf (>= 2 gleiche Pixel) oder 128 Pixel
+        j = i + 1
+        while j < n and j - i < 128 and not (j + 1 < n and p[j + 1] == p[j]):
+            j += 1
+        out.append(j - i - 1)
+        for k in range(i, j):
+            out += p[k]
+        i = j
+    return bytes(out)
+
+
+def decode(data, off=0):
+    """Referenz-Decoder (Host): -> (w, h, RGB565-Bytes)."""
+    if data[off:off + 4] != MAGIC:
+        raise ValueError("RLE: magic")
+    w, h = struct.unpack_from(">HH", data, off + 4)
+    ip = off + 8; out = bytearray(); total = w * h * 2
+    while len(out) < total:
+        c = data[ip]; ip += 1
+        if c & 0x80:
+            out += data[ip:ip + 2] * ((c & 0x7F) + 1); ip += 2
+        else:
+            m = (c + 1) * 2; out += data[ip:ip + m]; ip += m
+    return w, h, bytes(out)
+
+
+def _sprites(node):
+    if isinstance(node, dict):
+        if "offset" in node and "w" in node and "h" in node:
+            yield node
+        else:
+            for v in node.values():
+                for s in _sprites(v): yield s
+    elif isinstance(node, list):
+        for v in node:
+            for s in _sprites(v): yield s
+
+
+def convert_atlas(bin_path, meta_path):
+    with open(bin_path, "rb") as f: atlas = f.read()
+    with open(meta_path, "r", encoding="utf-8") as f: meta = json.load(f)
+    stride = int((meta.get("atlas") or {}).get("w") or 0) * 2
+    out = bytearray()
+    n_in = 0
+    for sp in _sprites(meta):
+        off = int(sp["offset"]); w = int(sp["w"]); h = int(sp["h"])
+        if "length" in sp or not stride:
+            px = atlas[off:off + w * h * 2]
+        else:
+            px = b"".join(atlas[off + r * stride: off + r * stride + w * 2] for r in range(h))
+        n_in += len(px)
+        enc = encode(px, w, h)
+        sp["offset"] = len(out); sp["length"] = len(enc); sp["enc"] = "rle"
+        out += enc
+    if isinstance(meta.get("atlas"), dict):
+        meta["atlas"]["format"] = "RGB565_RLE"
+    rle_path = os.path.splitext(bin_path)[0] + ".rle"
+    meta_out = os.path.splitext(meta_path)[0] + "_rle.json"
+    with open(rle_path, "wb") as f: f.write(out)
+    with open(meta_out, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False); f.write("\n")
+    return rle_path, meta_out, n_in, len(out)
+
+
+def convert_raw(bin_path, w, h):
+    with open(bin_path, "rb") as f: px = f.read()
+    enc = encode(px[:w * h * 2], w, h)
+    rle_path = os.path.splitext(bin_path)[0] + ".rle"
+    with open(rle_path, "wb") as f: f.write(enc)
+    return rle_path, w * h * 2, len(enc)
+
+
+def main(argv):
+    if len(argv) >= 3 and argv[0] == "atlas":
+        rle, meta, a, b = convert_atlas(argv[1], argv[2])
+        print("%s (%d -> %d Bytes, %.0f%%), %s" % (rle, a, b, 100.0 * b / max(1, a), meta))
+    elif len(argv) >= 4 and argv[0] == "raw":
+        rle, a, b = convert_raw(argv[1], int(argv[2]), int(argv[3]))
+        print("%s (%d -> %d Bytes, %.0f%%)" % (rle, a, b, 100.0 * b / max(1, a)))
+    else:
+        print("usage: rle_convert.py atlas <bin> <meta> | raw <bin> <w> <h>")
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,82 @@
+# host/tests/test_asset_cache.py — AssetCache: Refcount, Inhalts-Dedupe, LRU-Verdrängung im Budget
+import sys, os, shutil, tempfile, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hostenv
+
+hostenv.install()
+from lib.asset_cache import AssetCache
+
+
+class AssetCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _file(self, name, data):
+        p = os.path.join(self.dir, name)
+        with open(p, "wb") as f: f.write(data)
+        return p
+
+    def test_refcount_and_hits(self):
+        a = self._file("a", b"A" * 100)
+        c = AssetCache(1000)
+        b1 = c.acquire(a); b2 = c.acquire(a)
+        self.assertIs(b1, b2)
+        self.assertEqual((c.misses, c.hits), (1, 1))
+        c.release(a); c.release(a); c.release(a)     # zu viele release() bleiben folgenlos
+        self.assertEqual(c.stats()["hot"], 0)
+        self.assertEqual(c.resident(), 100)          # kalt, aber noch im Cache
+        self.assertIs(c.acquire(a), b1)
+
+    def test_ranges(self):
+        a = self._file("a", bytes(range(200)))
+        c = AssetCache(1000)
+        self.assertEqual(c.acquire(a, 10, 5), bytes(range(10, 15)))
+        self.assertEqual(c.acquire(a, 190), bytes(range(190, 200)))
+        self.assertEqual(c.stats()["entries"], 2)
+
+    def test_dedupe(self):
+        a = self._file("a", b"X" * 64); b = self._file("b", b"X" * 64); d = self._file("d", b"Y" * 64)
+        c = AssetCache(1000)
+        ba = c.acquire(a); bb = c.acquire(b); bd = c.acquire(d)
+        self.assertIs(ba, bb)
+        self.assertIsNot(ba, bd)
+        self.assertEqual(c.resident(), 128)
+        # gemeinsamer Eintrag bleibt heiß, bis beide Nutzer freigegeben haben
+        c.release(a); c.trim()
+        self.assertIs(c.acquire(b), bb)
+        c.release(b); c.release(b); c.release(d); c.trim()
+        self.assertEqual((c.resident(), c.stats()["aliases"]), (0, 0))
+
+    def test_no_dedupe(self):
+        a = self._file("a", b"X" * 64); b = self._file("b", b"X" * 64)
+        c = AssetCache(1000, dedupe=False)
+        self.assertIsNot(c.acquire(a), c.acquire(b))
+        self.assertEqual(c.resident(), 128)
+
+    def test_lru_eviction_spares_hot(self):
+        p = [self._file("f%d" % i, bytes((i,)) * 100) for i in range(4)]
+        c = AssetCache(250)
+        c.acquire(p[0]); c.acquire(p[1])
+        c.release(p[0]); c.release(p[1])
+        c.acquire(p[1]); c.release(p[1])             # p[1] zuletzt benutzt
+        c.acquire(p[2])                              # verdrängt p[0] (LRU)
+        self.assertEqual(c.evictions, 1)
+        self.assertIs(c.acquire(p[1]), c.acquire(p[1]))
+        self.assertEqual(c.misses, 3)
+        c.acquire(p[3])                              # p[1] und p[2] heiß: Budget läuft über
+        self.assertEqual(c.evictions, 1)
+        self.assertEqual(c.resident(), 300)
+        c.release(p[2])                              # über Budget: kalter Eintrag geht sofort
+        self.assertEqual((c.evictions, c.resident()), (2, 200))
+
+    def test_missing_file(self):
+        c = AssetCache(100)
+        self.assertIsNone(c.acquire(os.path.join(self.dir, "nope")))
+        self.assertEqual(c.resident(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
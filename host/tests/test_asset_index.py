@@ -0,0 +1,52 @@
+# host/tests/test_asset_index.py — AssetIndex: Binärsuche über index_compile-Records
+# Aufruf (Repo-Root):  python3 -m pytest -q host/tests   (oder python3 -m unittest discover host/tests)
+import sys, os, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hostenv
+
+hostenv.install()
+from index_compile import compile_meta
+from lib.asset_index import AssetIndex, load
+
+
+def _meta(n):
+    tiles = []
+    for i in range(n):
+        tiles.append({"slot": "S%d" % (i % 7), "char": str(i), "x": i, "y": -i, "w": 3, "h": 2,
+                      "offset": i * 12, "length": 12})
+    return {"tiles": tiles, "_digit_spacing": 4}
+
+
+class AssetIndexTest(unittest.TestCase):
+    def test_every_key_found(self):
+        meta = _meta(50)
+        idx = AssetIndex(data=compile_meta(meta)[0])
+        self.assertEqual(idx.count, 50)
+        for t in meta["tiles"]:
+            want = (t["x"], t["y"], 3, 2, t["offset"], 12)
+            self.assertEqual(idx.get("%s:%s" % (t["slot"], t["char"])), want)
+            self.assertEqual(idx.get((t["slot"], t["char"])), want)
+
+    def test_missing_keys(self):
+        idx = AssetIndex(data=compile_meta(_meta(9))[0])
+        for k in ("", "S0", "S0:", "S0:1", "A:0", "Z:9", "S0:0x", "S0:00000000000000"):
+            self.assertIsNone(idx.get(k), k)
+            self.assertNotIn(k, idx)
+        self.assertEqual(idx.get("S9:9", "dflt"), "dflt")
+
+    def test_single_and_stride(self):
+        meta = {"atlas": {"w": 80}, "icons": [{"group": "bt", "state": "on", "x": 5, "y": 6,
+                                               "w": 20, "h": 10, "offset": 40}]}
+        idx = AssetIndex(data=compile_meta(meta)[0])
+        self.assertEqual(idx.stride, 80)
+        self.assertEqual(idx.get(("bt", "on")), (5, 6, 20, 10, 40, 400))
+        self.assertIsNone(idx.get(("bt", "off")))
+
+    def test_bad_magic(self):
+        with self.assertRaises(ValueError):
+            AssetIndex(data=b"XXXX" + bytes(6))
+        self.assertIsNone(load(os.path.join(hostenv.ROOT, "does-not-exist.idx")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# host/tests/test_face_runtime.py — FaceBase: Dispatch-Tabelle, Scratch-Pool, Index, Frame-Takt
+import sys, os, json, shutil, tempfile, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hostenv
+
+hostenv.install()
+from ui import face_runtime as R
+
+
+class _Clock:
+    def __init__(self): self.ms = 1000
+    def ticks_ms(self): return self.ms
+    def ticks_diff(self, a, b): return a - b
+
+
+class _Comp:
+    """Compositor-Ersatz: zählt Flushes, pending() solange invalidiert wurde."""
+    def __init__(self): self.rects = []; self.flushes = 0
+    def invalidate(self, x, y, w, h): self.rects.append((x, y, w, h))
+    def invalidate_all(self): self.rects.append((0, 0, 240, 240))
+    def pending(self): return bool(self.rects)
+    def flush(self): self.rects = []; self.flushes += 1
+    def discard(self): self.rects = []
+
+
+class DispatchTest(unittest.TestCase):
+    def test_table(self):
+        class Old:
+            def render(self): pass
+            def render_sec(self): pass
+            def on_time(self): pass
+            on_wifi = None                      # kein callable: fehlt in der Tabelle
+        class New(Old):
+            def render_seconds(self): pass
+        fx = R.dispatch_table(Old())
+        self.assertEqual(sorted(fx), ["render", "sec", "time"])
+        self.assertEqual(fx["sec"].__name__, "render_sec")
+        self.assertEqual(R.dispatch_table(New())["sec"].__name__, "render_seconds")
+        self.assertEqual(R.dispatch_table(None), {})
+        face = R.FaceBase()
+        self.assertIs(face.dispatch(), face.dispatch())
+        self.assertIn("wants", face.dispatch())
+
+    def test_pool(self):
+        R.scratch_free()
+        a = R.scratch("t", 10); b = R.scratch("t", 4)
+        self.assertEqual((len(a), len(b)), (10, 4))
+        self.assertIs(a.obj, b.obj)                  # wiederverwendet
+        self.assertEqual(len(R.scratch("t", 20).obj), 20)
+        p = R.pattern(0x1234)
+        self.assertEqual(bytes(p[:4]), b"\x12\x34\x12\x34")
+        self.assertEqual(len(p), 480)
+        self.assertIs(R.pattern(0x1234).obj, p.obj)
+        R.scratch_free()
+        self.assertIsNot(R.pattern(0x1234).obj, p.obj)
+
+
+class IndexTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.dir, "assets"))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_json_fallback(self):
+        meta = {"icons": [{"group": "bt", "state": "on", "x": 3, "y": 4, "w": 5, "h": 6, "offset": 7}]}
+        with open(os.path.join(self.dir, "assets", "icons_meta.json"), "w") as f: json.dump(meta, f)
+        class F(R.FaceBase): ASSET_BASE = self.dir
+        lut = F()._index("icons_meta", "icons", ("group", "state"))
+        self.assertEqual(lut[("bt", "on")], (3, 4, 5, 6, 7, 60))
+        self.assertIsNone(F()._index("missing", "icons", ("group", "state")))
+
+
+class FrameTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock(); self._time = R._time; R._time = self.clock
+        self.face = R.FaceBase(); self.face.comp = self.comp = _Comp()
+
+    def tearDown(self):
+        R._time = self._time
+
+    def test_no_ticks_flush_now(self):
+        f = self.face
+        f.invalidate_region(0, 0, 10, 10)
+        self.assertEqual(self.comp.flushes, 1)
+        self.assertTrue(f.wants_frames())            # Burst: Takt anfordern
+        self.clock.ms += R._STALE_MS + 1
+        self.assertFalse(f.wants_frames())
+
+    def test_ticks_cap_flushes(self):
+        f = self.face; fm = f._frame_ms
+        f.tick(self.clock.ms)
+        f.invalidate_region(0, 0, 10, 10)            # mit Takt: gesammelt, nicht sofort
+        self.assertEqual(self.comp.flushes, 0)
+        self.assertTrue(f.tick(self.clock.ms))
+        self.assertEqual(self.comp.flushes, 1)
+        self.clock.ms += 1; f.tick(self.clock.ms)
+        f.invalidate_region(0, 0, 10, 10)
+        self.clock.ms += 1
+        self.assertTrue(f.tick(self.clock.ms))       # zu früh: offen, Takt bleibt
+        self.assertEqual(self.comp.flushes, 1)
+        self.clock.ms += fm; f.tick(self.clock.ms)
+        self.assertEqual(self.comp.flushes, 2)
+        self.clock.ms += R._STALE_MS + 1
+        self.assertFalse(f.tick(self.clock.ms))      # nichts offen, Burst vorbei: Takt ruht
+
+    def test_stale_tick_flushes_now(self):
+        f = self.face
+        f.tick(self.clock.ms)
+        self.clock.ms += R._STALE_MS + 1             # Frame-Takt ausgesetzt
+        f.invalidate_region(0, 0, 10, 10)
+        self.assertEqual(self.comp.flushes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# host/tests/test_hand_table.py — HandTable/HandSpans: Zeilenprofile packen, auspacken, spiegeln
+import sys, os, struct, tempfile, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hostenv
+
+hostenv.install()
+from lib.hand_table import MAGIC, REC_MAX, HandSpans, HandTable, encode, pack
+
+HANDS = os.path.join(hostenv.ROOT, "ui", "watchfaces_analog", "gold_classic_analog", "assets", "hands.bin")
+
+
+def _pixels(sp):
+    """{(x, y): deckung 1..15} aus HandSpans."""
+    out = {}; b = sp.buf
+    for y in range(sp.y0, sp.y0 + sp.n):
+        a, e = sp.row(y)
+        for k in range(a, e, 3):
+            for x in range(b[k], b[k + 1] + 1): out[(x, y)] = b[k + 2] >> 4 or 15
+    return out
+
+
+def _rows_pixels(rows):
+    out = {}
+    for y, lst in rows.items():
+        for xa, xb, c in lst:
+            for x in range(xa, xb + 1): out[(x, y)] = c >> 4 or 15
+    return out
+
+
+# Zeile 50: Kante, deckend, Kante; 51: Lücke im Kantenteil; 52: leer; 53: nur Kantenpixel
+ROWS = {50: [[118, 118, 3 << 4], [119, 124, 0], [125, 126, 9 << 4]],
+        51: [[119, 119, 15 << 4], [121, 130, 0], [132, 132, 2 << 4]],
+        53: [[120, 120, 7 << 4]]}
+
+
+def _shift(rows, dx, dy):
+    return dict((y + dy, [[a + dx, b + dx, c] for a, b, c in lst]) for y, lst in rows.items())
+
+
+class HandTableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Quadrant qh = 2 (8 Stundenpositionen), qm = 1 (4 Minutenpositionen), Mitte (120, 120)
+        cls.recs = [_shift(ROWS, i, i) for i in range(3)] + [_shift(ROWS, 0, 10 + i) for i in range(2)]
+        data = [encode(r) for r in cls.recs]
+        out = bytearray(MAGIC + struct.pack(">HHBBBB", 2, 1, 120, 120, 0, 0))
+        o = len(out) + (len(data) + 1) * 4; offs = []
+        for d in data:
+            offs.append(o); o += len(d)
+        offs.append(o)
+        out += struct.pack(">%dI" % len(offs), *offs)
+        for d in data: out += d
+        fd, cls.path = tempfile.mkstemp(suffix=".bin")
+        with os.fdopen(fd, "wb") as f: f.write(out)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.path)
+
+    def test_roundtrip(self):
+        ht = HandTable(self.path); sp = HandSpans()
+        for pos, rec in ((0, 0), (1, 1), (2, 2), (8, 3), (9, 4)):
+            ht.read(pos, sp)
+            self.assertEqual(_pixels(sp), _rows_pixels(self.recs[rec]), pos)
+        self.assertEqual(ht.count, 12)
+        ht.close()
+
+    def test_mirror(self):
+        ht = HandTable(self.path); sp = HandSpans()
+        # Stunde: 3, 4 = y-Spiegel von 1, 0; 5, 6 = x+y-Spiegel von 1, 2; 7 = x-Spiegel von 1;
+        # Minute (ab 8): 10 = y-Spiegel von Record 3, 11 = x+y-Spiegel von Record 4
+        cases = ((3, 1, False, True), (4, 0, False, True), (5, 1, True, True),
+                 (6, 2, True, True), (7, 1, True, False),
+                 (10, 3, False, True), (11, 4, True, True))
+        for pos, rec, fx, fy in cases:
+            want = {}
+            for (x, y), a in _rows_pixels(self.recs[rec]).items():
+                want[(240 - x if fx else x, 240 - y if fy else y)] = a
+            ht.read(pos, sp)
+            self.assertEqual(_pixels(sp), want, pos)
+        ht.close()
+
+    def test_spans_rows(self):
+        a = HandSpans(); b = HandSpans()
+        a.set(pack(ROWS)); b.set(pack(_shift(ROWS, 0, 1)))
+        self.assertEqual((a.y0, a.n), (50, 4))
+        self.assertEqual(a.row(52), (a.start[2], a.start[2]))
+        self.assertEqual(a.row(49), (0, 0))
+        self.assertFalse(a.same_row(b, 51))
+        self.assertFalse(a.same_row(b, 52))   # b: Zeile 52 = alte Zeile 51
+        b.set(pack(ROWS))
+        self.assertTrue(all(a.same_row(b, y) for y in range(48, 56)))
+
+    def test_pack_clips(self):
+        sp = HandSpans()
+        sp.set(pack({-3: [[0, 5, 0]], 10: [[-4, 2, 0], [238, 300, 1]]}))
+        self.assertEqual((sp.y0, sp.n), (10, 1))
+        self.assertEqual(bytes(sp.buf[3:9]), bytes((0, 2, 0, 238, 239, 1)))
+        self.assertEqual(pack({}), bytes(2))
+
+    def test_bad_magic(self):
+        fd, p = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f: f.write(b"HND1" + bytes(20))
+        try:
+            with self.assertRaises(ValueError): HandTable(p)
+        finally:
+            os.remove(p)
+
+    def test_face_table(self):
+        # ausgelieferte hands.bin: alle Positionen lesbar, im AOD-Band und im festen Puffer
+        ht = HandTable(HANDS); sp = HandSpans()
+        self.assertEqual(ht.count, 780)
+        for pos in range(ht.count):
+            ht.read(pos, sp)
+            self.assertTrue(sp.n and 31 <= sp.y0 and sp.y0 + sp.n - 1 <= 209, pos)
+            self.assertLessEqual(sp.start[sp.n], REC_MAX)
+            self.assertEqual(len(sp.buf), REC_MAX)
+        ht.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# host/tests/test_ink_atlas.py — InkAtlas: Zusammensetzen, Cache-Schlüssel je Position, pin()
+import sys, os, tempfile, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hostenv
+
+hostenv.install()
+from ink_convert import encode
+from lib.ink_atlas import InkAtlas
+
+W = 240
+INK = b"\xfe\xc0"
+
+
+def _bg():
+    # jede Position anders: Zeile im High-, Spalte im Low-Byte
+    return bytes(v for y in range(W) for x in range(W) for v in (y, x))
+
+
+def _tile(bg, x, y, w, h, mask):
+    """Kachel = BG-Ausschnitt, wo mask(c, r) gilt Tinte."""
+    out = bytearray()
+    for r in range(h):
+        for c in range(w):
+            o = ((y + r) * W + x + c) * 2
+            out += INK if mask(c, r) else bg[o:o + 2]
+    return bytes(out)
+
+
+def _diag(c, r):
+    return c == r or c == r + 1
+
+
+class InkAtlasTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bg = _bg()
+        fd, cls.path = tempfile.mkstemp(suffix=".bin")
+        # zwei Kacheln 6x4 mit verschiedener Tinte, kodiert gegen den BG bei (10, 20)
+        a = encode(_tile(cls.bg, 10, 20, 6, 4, _diag), cls.bg, 10, 20, 6, 4)
+        b = encode(_tile(cls.bg, 10, 20, 6, 4, lambda c, r: r == 1), cls.bg, 10, 20, 6, 4)
+        cls.a = (0, len(a)); cls.b = (len(a), len(b))
+        with os.fdopen(fd, "wb") as f: f.write(a + b)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.path)
+
+    def setUp(self):
+        self.ink = InkAtlas(self.path, budget_bytes=6 * 4 * 2)
+
+    def tearDown(self):
+        self.ink.close()
+
+    def test_compose(self):
+        got = bytes(self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], self.bg))
+        self.assertEqual(got, _tile(self.bg, 10, 20, 6, 4, _diag))
+
+    def test_shared_offset_other_position(self):
+        # build_assets legt gleiche Tinte zweier Slots auf einen offset: BG je Position
+        self.ink.budget = 1 << 16
+        for x, y in ((10, 20), (100, 150), (10, 20), (100, 150)):
+            got = bytes(self.ink.get(x, y, 6, 4, self.a[0], self.a[1], self.bg))
+            self.assertEqual(got, _tile(self.bg, x, y, 6, 4, _diag), (x, y))
+        self.assertEqual((self.ink.misses, self.ink.hits), (2, 2))
+
+    def test_plain_ground_separate(self):
+        self.ink.budget = 1 << 16
+        black = bytes(W * 2)
+        self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], self.bg)
+        got = bytes(self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], black, 0))
+        self.assertEqual(got, _tile(bytes(W * W * 2), 10, 20, 6, 4, _diag))
+        got = bytes(self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], self.bg))
+        self.assertEqual(got, _tile(self.bg, 10, 20, 6, 4, _diag))
+
+    def test_lru_within_budget(self):
+        # Budget = eine Kachel: ungepinnt wird die ältere Kachel recycelt
+        self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], self.bg)
+        self.ink.get(10, 20, 6, 4, self.b[0], self.b[1], self.bg)
+        self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], self.bg)
+        self.assertEqual((self.ink.misses, self.ink.hits), (3, 0))
+        self.assertLessEqual(self.ink._bytes, self.ink.budget)
+
+    def test_pin_keeps_views(self):
+        self.ink.pin(True)
+        va = self.ink.get(10, 20, 6, 4, self.a[0], self.a[1], self.bg)
+        vb = self.ink.get(10, 20, 6, 4, self.b[0], self.b[1], self.bg)
+        self.assertEqual(bytes(va), _tile(self.bg, 10, 20, 6, 4, _diag))
+        self.assertEqual(bytes(vb), _tile(self.bg, 10, 20, 6, 4, lambda c, r: r == 1))
+        self.assertGreater(self.ink._bytes, self.ink.budget)   # gepinnt darf überlaufen
+        self.ink.pin(False)
+        self.assertLessEqual(self.ink._bytes, self.ink.budget)
+        # die jüngere Kachel bleibt, die ältere ist weg
+        self.ink.get(10, 20, 6, 4, self.b[0], self.b[1], self.bg)
+        self.assertEqual(self.ink.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# host/tests/test_screen_registry.py — ScreenRegistry: Lazy-Laden, LRU-/Anker-Verdrängung, Fehlschläge
+import sys, os, shutil, tempfile, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hostenv
+
+hostenv.install()
+from lib import screen_registry as SR
+
+PKG = "fake_screens"
+# Konstruktion kostet 100 B, das erste on_show weitere 20 B (über den Zähler HEAP im Paket)
+SCREEN = """from %s import HEAP
+class Screen:
+    def __init__(self, d, manager=None):
+        HEAP[0] += 100; self.shown = 0
+    def on_show(self):
+        if not self.shown: HEAP[0] += 20
+        self.shown += 1
+""" % PKG
+
+
+class ScreenRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        p = os.path.join(self.dir, PKG); os.mkdir(p)
+        with open(os.path.join(p, "__init__.py"), "w") as f: f.write("HEAP = [0]\n")
+        for sid in ("a", "b", "c", "d", "x", "y"):
+            with open(os.path.join(p, sid + ".py"), "w") as f: f.write(SCREEN)
+        with open(os.path.join(p, "broken.py"), "w") as f: f.write("raise ImportError('kaputt')\n")
+        sys.path.insert(0, self.dir)
+        import fake_screens
+        self.heap = fake_screens.HEAP
+        self._heap = SR._heap; SR._heap = lambda: self.heap[0]
+
+    def tearDown(self):
+        SR._heap = self._heap
+        sys.path.remove(self.dir)
+        for k in [k for k in sys.modules if k == PKG or k.startswith(PKG + ".")]: del sys.modules[k]
+        shutil.rmtree(self.dir)
+
+    def _reg(self, budget=1 << 20, ids=("a", "b", "c", "d", "x", "y", "broken")):
+        return SR.ScreenRegistry(None, None, ids, chain=("a", "b", "c", "d"), budget_bytes=budget,
+                                 package=PKG)
+
+    def test_lazy_and_failed(self):
+        r = self._reg()
+        self.assertEqual(r.loaded(), {})
+        self.assertIn("broken", r)
+        self.assertIsNone(r.get("broken"))
+        self.assertNotIn("broken", r)
+        self.assertNotIn("broken", r.keys())
+        self.assertEqual(len(r), 6)
+        with self.assertRaises(KeyError): r["nope"]
+        s = r["a"]
+        self.assertIs(r["a"], s)
+        self.assertEqual((r.loads, r.stats()["failed"]), (1, 1))
+
+    def test_items_single_lookup(self):
+        r = self._reg()
+        out = r.items()
+        self.assertEqual([sid for sid, _ in out], ["a", "b", "c", "d", "x", "y"])
+        self.assertEqual(r.loads, 6)
+        # je Screen ein Zugriff: Laden (1 Tick) + Zugriff (1 Tick); broken zählt nicht
+        self.assertEqual(r._tick, 12)
+        self.assertEqual(len(r.values()), 6)
+        self.assertEqual(r.loads, 6)
+
+    def test_first_show_charged(self):
+        r = self._reg()
+        s = r["a"]
+        self.assertEqual(r.resident(), 100)
+        s.on_show(); s.on_show()
+        self.assertEqual(r.resident(), 120)
+        self.assertEqual((r.current(), s.shown), (s, 2))
+
+    def test_lru_spares_current_and_neighbours(self):
+        r = self._reg(budget=400)
+        for sid in ("x", "y", "a", "b", "c"): r[sid].on_show()
+        # sichtbar c, Nachbarn b/d in der Kette: x und y (LRU) müssen zuerst gehen
+        self.assertEqual(sorted(r.loaded()), ["a", "b", "c"])
+        self.assertEqual(r.evictions, 2)
+        self.assertNotIn(PKG + ".x", sys.modules)
+        r["x"].on_show()                             # Unterscreen von c aus: Anker bleibt c
+        self.assertEqual(sorted(r.loaded()), ["b", "c", "x"])
+        self.assertEqual(r.loads, 6)
+
+    def test_evict(self):
+        r = self._reg()
+        r["a"].on_show(); r["b"]
+        self.assertFalse(r.evict("a"))               # sichtbar
+        self.assertTrue(r.evict("b"))
+        self.assertFalse(r.evict("b"))
+        self.assertEqual(r.resident(), 120)
+        self.assertIsNot(r["b"], None)
+        self.assertEqual(r.loads, 3)
+
+    def test_no_measurement_no_eviction(self):
+        SR._heap = lambda: 0
+        r = self._reg(budget=1)
+        for sid in ("a", "b", "c", "d", "x", "y"): r[sid].on_show()
+        self.assertEqual((r.resident(), r.evictions), (0, 0))
+
+    def test_host_heap_tracemalloc(self):
+        import tracemalloc
+        if tracemalloc.is_tracing(): self.skipTest("tracemalloc läuft bereits")
+        self.assertEqual(self._heap(), 0)            # CPython ohne gc.mem_alloc, nicht tracend
+        tracemalloc.start()
+        try:
+            h0 = self._heap(); blob = bytearray(50_000)
+            self.assertGreaterEqual(self._heap() - h0, 50_000)
+            del blob
+        finally:
+            tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
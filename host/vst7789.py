@@ -0,0 +1,185 @@
+# host/vst7789.py — Virtuelles ST7789 (240x320 GRAM) für Host-Renderings
+# Dekodiert den echten Command-Strom des Treibers (CASET/RASET/RAMWR/MADCTL,
+# VSCRDEF/VSCSAD, PTLAR/PTLON/NORON, IDMON/IDMOFF) pixelgenau und zählt nebenbei den
+# SPI-Verkehr wie hostenv.Probe. frame() liefert das sichtbare 240x240-Bild so, wie es
+# auf der Uhr erscheint (Einbaulage = Rotation 0 des Treibers): im Partial-Modus sind
+# Zeilen außerhalb des Bereichs schwarz, im Idle-Modus zählt nur das MSB je Kanal.
+import hashlib, struct
+import hostenv
+
+GRAM_W, GRAM_H = 240, 320
+VIEW_W, VIEW_H = 240, 240
+
+_CASET = 0x2A; _RASET = 0x2B; _RAMWR = 0x2C; _RAMWRC = 0x3C
+_MADCTL = 0x36; _VSCRDEF = 0x33; _VSCSAD = 0x37; _SWRESET = 0x01
+_PTLON = 0x12; _NORON = 0x13; _PTLAR = 0x30; _IDMOFF = 0x38; _IDMON = 0x39
+_MY = 0x80; _MX = 0x40; _MV = 0x20
+
+
+class VirtualST7789(hostenv.Probe):
+    def __init__(self):
+        self.gram = bytearray(GRAM_W * GRAM_H * 2)
+        self.madctl = 0
+        self.vscrdef = (0, GRAM_H, 0)
+        self.vsp = 0
+        self.ptlar = (0, GRAM_H - 1)
+        self.partial = False
+        self.idle = False
+        self._cmd = None
+        self._args = bytearray()
+        hostenv.Probe.__init__(self)
+        self._reset_window()
+
+    def _reset_window(self):
+        self.xs, self.xe = 0, GRAM_W - 1
+        self.ys, self.ye = 0, GRAM_H - 1
+        self._cx = self._cy = 0
+        self._hi = None                 # halbes Pixel aus vorherigem write()
+
+    # --- Probe-Schnittstelle ---
+    def pin_changed(self, pin, v):
+        hostenv.Probe.pin_changed(self, pin, v)
+        if pin.role == "cs" and v == 1:
+            self._finish()
+
+    def spi_write(self, buf):
+        hostenv.Probe.spi_write(self, buf)
+        buf = bytes(buf)
+        if not self._dc:
+            self._finish()
+            self._cmd = buf[0]; self._args = bytearray(buf[1:])
+            if self._cmd in (_RAMWR, _RAMWRC):
+                if self._cmd == _RAMWR:
+                    self._cx, self._cy = self.xs, self.ys
+                self._hi = None
+            elif self._cmd == _SWRESET:
+                self.madctl = 0; self.vscrdef = (0, GRAM_H, 0); self.vsp = 0
+                self.ptlar = (0, GRAM_H - 1); self.partial = False; self.idle = False
+                self._reset_window()
+            elif self._cmd in (_PTLON, _NORON):
+                self.partial = self._cmd == _PTLON
+            elif self._cmd in (_IDMON, _IDMOFF):
+                self.idle = self._cmd == _IDMON
+            return
+        if self._cmd in (_RAMWR, _RAMWRC):
+            self._pixels(buf)
+        else:
+            self._args += buf
+
+    def _finish(self):
+        """Parameter des laufenden Commands übernehmen (bei CS-High oder neuem Command)."""
+        c = self._cmd; a = self._args
+        if c == _CASET and len(a) >= 4:
+            self.xs, self.xe = struct.unpack(">HH", a[:4])
+        elif c == _RASET and len(a) >= 4:
+            self.ys, self.ye = struct.unpack(">HH", a[:4])
+        elif c == _MADCTL and len(a) >= 1:
+            self.madctl = a[0]
+        elif c == _VSCRDEF and len(a) >= 6:
+            self.vscrdef = struct.unpack(">HHH", a[:6])
+        elif c == _VSCSAD and len(a) >= 2:
+            self.vsp = struct.unpack(">H", a[:2])[0]
+        elif c == _PTLAR and len(a) >= 4:
+            self.ptlar = struct.unpack(">HH", a[:4])
+        if c not in (_RAMWR, _RAMWRC):
+            self._args = bytearray()
+
+    # --- Pixelpfad ---
+    def _pixels(self, buf):
+        i = 0; n = len(buf)
+        if self._hi is not None and n:
+            self._put(self._hi, buf[0]); self._hi = None; i = 1
+        g = self.gram
+        mad = self.madctl
+        mv = mad & _MV; mx = mad & _MX; my = mad & _MY
+        xs, xe, ys, ye = self.xs, self.xe, self.ys, self.ye
+        cx, cy = self._cx, self._cy
+        while i + 1 < n:
+            if cy <= ye:
+                px, py = (cy, cx) if mv else (cx, cy)
+                if mx: px = GRAM_W - 1 - px
+                if my: py = GRAM_H - 1 - py
+                if 0 <= px < GRAM_W and 0 <= py < GRAM_H:
+                    o = (py * GRAM_W + px) * 2
+                    g[o] = buf[i]; g[o + 1] = buf[i + 1]
+            i += 2
+            cx += 1
+            if cx > xe:
+                cx = xs; cy += 1
+        self._cx, self._cy = cx, cy
+        if i < n:
+            self._hi = buf[i]
+
+    def _put(self, hi, lo):
+        self._pixels(bytes((hi, lo)))
+
+    # --- Ausgabe ---
+    def _display_row(self, p):
+        """GRAM-Zeile, die in Panelzeile p angezeigt wird (Vertikalscroll)."""
+        tfa, vsa, _bfa = self.vscrdef
+        if vsa and tfa <= p < tfa + vsa:
+            return tfa + (p - tfa + self.vsp - tfa) % vsa
+        return p
+
+    def _shown(self, p):
+        """Panelzeile p wird getrieben (Partial-Bereich, auch umlaufend PSL > PEL)."""
+        if not self.partial: return True
+        s, e = self.ptlar
+        return s <= p <= e if s <= e else (p >= s or p <= e)
+
+    def frame(self):
+        """Sichtbares Bild (240x240 RGB565 big-endian) in Einbaulage."""
+        out = bytearray(VIEW_W * VIEW_H * 2)
+        g = self.gram; rb = GRAM_W * 2
+        for y in range(VIEW_H):
+            p = VIEW_H - 1 - y                       # Panel ist 180° eingebaut
+            if not self._shown(p): continue          # außerhalb des Partial-Bereichs: schwarz
+            src = self._display_row(p) * rb
+            row = g[src:src + VIEW_W * 2]
+            o = y * VIEW_W * 2
+            # horizontal spiegeln (Pixelweise, 2 Byte)
+            for x in range(VIEW_W):
+                s = (VIEW_W - 1 - x) * 2
+                out[o + x * 2] = row[s]; out[o + x * 2 + 1] = row[s + 1]
+        if self.idle:
+            # 8 Farben: je Kanal nur das MSB (voll oder aus)
+            for i in range(0, len(out), 2):
+                c = (out[i] << 8) | out[i + 1]
+                c = (0xF800 if c & 0x8000 else 0) | (0x07E0 if c & 0x0400 else 0) | (0x001F if c & 0x0010 else 0)
+                out[i] = c >> 8; out[i + 1] = c & 0xFF
+        return bytes(out)
+
+    def checksum(self):
+        return hashlib.md5(self.frame()).hexdigest()
+
+    def save_ppm(self, path):
+        f = self.frame()
+        px = bytearray(VIEW_W * VIEW_H * 3)
+        for i in range(VIEW_W * VIEW_H):
+            c = (f[i * 2] << 8) | f[i * 2 + 1]
+            r = (c >> 11) & 0x1F; g = (c >> 5) & 0x3F; b = c & 0x1F
+            px[i * 3] = (r << 3) | (r >> 2)
+            px[i * 3 + 1] = (g << 2) | (g >> 4)
+            px[i * 3 + 2] = (b << 3) | (b >> 2)
+        with open(path, "wb") as fh:
+            fh.write(b"P6\n%d %d\n255\n" % (VIEW_W, VIEW_H))
+            fh.write(px)
+
+
+def make_display(**kw):
+    """ST7789Display am virtuellen Panel (inkl. Init-Sequenz); liefert (disp, panel)."""
+    hostenv.install()
+    from lib import display_st7789
+    panel = VirtualST7789()
+    # Pins/SPI vor dem Konstruktor anhängen, damit Init + MADCTL dekodiert werden
+    orig = display_st7789.ST7789Display._setup_spi
+    def _setup_spi(self, bauds, modes):
+        orig(self, bauds, modes)
+        hostenv.attach(self, panel)
+    display_st7789.ST7789Display._setup_spi = _setup_spi
+    try:
+        disp = display_st7789.ST7789Display(**kw)
+    finally:
+        display_st7789.ST7789Display._setup_spi = orig
+    panel.reset()
+    return disp, panel
@@ -0,0 +1,170 @@
+# asset_cache.py — Gemeinsamer Asset-Cache für Faces/Screens (Refcount + RAM-Budget)
+# acquire(path[, offset, length]) liefert den Puffer (bytes) und zählt den Nutzer;
+# release(...) gibt ihn zurück. Unbenutzte Einträge bleiben "kalt" im Cache und werden
+# erst verdrängt (LRU), wenn das Budget überschritten ist. Dateien/Ausschnitte mit
+# identischem Inhalt (Länge + SHA-256) teilen sich einen Puffer.
+try:
+    from core.logger import warn as log_warn
+except Exception:
+    def log_warn(*a, **k): pass
+try:
+    import uos as _os
+except Exception:
+    import os as _os
+try:
+    import uhashlib as _hashlib
+except Exception:
+    import hashlib as _hashlib
+try:
+    import config
+    _CFG_BUDGET = int(getattr(config, "ASSET_CACHE_BYTES", 196_608))
+    _CFG_DEDUPE = bool(getattr(config, "ASSET_CACHE_DEDUPE", True))
+except Exception:
+    _CFG_BUDGET = 196_608
+    _CFG_DEDUPE = True
+
+_CHUNK = 1024
+
+
+def _key(path, offset, length):
+    if not offset and length is None: return path
+    return "%s@%d+%s" % (path, offset, length)
+
+
+class AssetCache:
+    """
+    Puffer sind read-only (bytes) und bleiben gültig, solange der Nutzer sie hält;
+    nach release() nicht mehr verwenden (Eintrag kann verdrängt werden).
+    """
+    def __init__(self, budget_bytes=_CFG_BUDGET, dedupe=_CFG_DEDUPE):
+        self.budget = int(budget_bytes)
+        self.dedupe = dedupe
+        self._e = {}          # kanonischer key -> [buf, refs, tick]
+        self._alias = {}      # key -> kanonischer key (gleicher Inhalt)
+        self._sig = {}        # (länge, digest) -> kanonischer key
+        self._psig = {}       # key -> (länge, digest), überlebt Verdrängung
+        self._bytes = 0
+        self._tick = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # --- intern ---
+    def _signature(self, path, offset, length):
+        h = _hashlib.sha256(); n = 0
+        buf = bytearray(_CHUNK); mv = memoryview(buf)
+        with open(path, "rb") as f:
+            if offset: f.seek(offset)
+            while length is None or n < length:
+                want = _CHUNK if length is None else min(_CHUNK, length - n)
+                got = f.readinto(mv[:want])
+                if not got: break
+                h.update(mv[:got]); n += got
+        return (n, h.digest())
+
+    def _load(self, path, offset, length):
+        with open(path, "rb") as f:
+            if offset: f.seek(offset)
+            return f.read() if length is None else f.read(length)
+
+    def _hit(self, ck):
+        e = self._e[ck]
+        self._tick += 1
+        e[1] += 1; e[2] = self._tick
+        self.hits += 1
+        return e[0]
+
+    def _drop(self, ck):
+        e = self._e.pop(ck)
+        self._bytes -= len(e[0])
+        for s, k in list(self._sig.items()):
+            if k == ck: del self._sig[s]
+        for k, c in list(self._alias.items()):
+            if c == ck: del self._alias[k]
+        self.evictions += 1
+
+    def _fit(self, need):
+        """Kalte Einträge (refs == 0) nach LRU verdrängen, bis need ins Budget passt."""
+        while self._bytes + need > self.budget:
+            old = None; ot = 0
+            for k, e in self._e.items():
+                if e[1] == 0 and (old is None or e[2] < ot): old = k; ot = e[2]
+            if old is None: return False
+            self._drop(old)
+        return True
+
+    # --- API ---
+    def acquire(self, path, offset=0, length=None):
+        """Puffer für Datei bzw. Ausschnitt; None, wenn nicht lesbar."""
+        k = _key(path, offset, length)
+        ck = self._alias.get(k, k)
+        if ck in self._e:
+            return self._hit(ck)
+        try:
+            sig = None
+            if self.dedupe:
+                sig = self._psig.get(k)
+                if sig is None:
+                    sig = self._signature(path, offset, length)
+                    self._psig[k] = sig
+                ck = self._sig.get(sig)
+                if ck is not None and ck in self._e:
+                    self._alias[k] = ck
+                    return self._hit(ck)
+                need = sig[0]
+            else:
+                need = length if length is not None else _os.stat(path)[6] - offset
+            self._fit(need)
+            buf = self._load(path, offset, length)
+        except Exception as e:
+            log_warn("asset %s: %r" % (k, e))
+            return None
+        self.misses += 1
+        if self._bytes + len(buf) > self.budget:
+            log_warn("asset cache over budget (%d + %d > %d)" % (self._bytes, len(buf), self.budget))
+        self._tick += 1
+        self._e[k] = [buf, 1, self._tick]
+        self._bytes += len(buf)
+        if sig is not None:
+            self._sig[sig] = k
+        return buf
+
+    def release(self, path, offset=0, length=None):
+        k = _key(path, offset, length)
+        e = self._e.get(self._alias.get(k, k))
+        if e is None or e[1] <= 0: return
+        e[1] -= 1
+        if e[1] == 0 and self._bytes > self.budget:
+            self._fit(0)
+
+    def trim(self):
+        """Alle kalten Einträge sofort freigeben (z.B. vor großen Allokationen)."""
+        for k in [k for k, e in self._e.items() if e[1] == 0]:
+            self._drop(k)
+
+    def resident(self):
+        return self._bytes
+
+    def stats(self):
+        return {"bytes": self._bytes, "budget": self.budget, "entries": len(self._e),
+                "hot": len([1 for e in self._e.values() if e[1] > 0]),
+                "aliases": len(self._alias), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+_CACHE = None
+
+
+def get_cache():
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = AssetCache()
+    return _CACHE
+
+
+def acquire(path, offset=0, length=None):
+    return get_cache().acquire(path, offset, length)
+
+
+def release(path, offset=0, length=None):
+    get_cache().release(path, offset, length)
@@ -0,0 +1,66 @@
+# asset_index.py — Binärer Asset-Index (.idx aus host/index_compile.py)
+# Ein read() beim Laden, danach Binärsuche über sortierte Fixed-Records;
+# kein JSON-Parsing und kein lineares Durchsuchen pro Draw.
+try:
+    import ustruct as struct
+except Exception:
+    import struct
+
+_MAGIC = b"AIX1"
+_HDR = 10          # ">4sHHH"
+_REC = 16          # ">IIhhHH"
+
+
+class AssetIndex:
+    """
+    get(key) -> (x, y, w, h, offset, length) oder None.
+    key: "group:state" bzw. Tupel ("group", "state") – Teile werden mit ":" verbunden.
+    stride: Atlasbreite in Pixeln für Unterrechteck-Kacheln (0 = Kacheln zusammenhängend).
+    """
+    def __init__(self, path=None, data=None):
+        b = data
+        if b is None:
+            with open(path, "rb") as f:
+                b = f.read()
+        if b[0:4] != _MAGIC:
+            raise ValueError("asset index: magic")
+        self._b = b
+        self.count, self._k, self.stride = struct.unpack_from(">HHH", b, 4)
+        self._rs = self._k + _REC
+        self._memo = {}
+
+    def _find(self, kb):
+        b = self._b; k = self._k; rs = self._rs
+        if len(kb) > k: return -1
+        if len(kb) < k: kb = kb + b"\0" * (k - len(kb))
+        lo = 0; hi = self.count - 1
+        while lo <= hi:
+            mid = (lo + hi) >> 1
+            o = _HDR + mid * rs
+            cur = b[o:o + k]
+            if cur == kb: return o
+            if cur < kb: lo = mid + 1
+            else: hi = mid - 1
+        return -1
+
+    def get(self, key, default=None):
+        r = self._memo.get(key)
+        if r is not None: return r
+        s = ":".join(key) if isinstance(key, tuple) else key
+        o = self._find(s.encode("utf-8"))
+        if o < 0: return default
+        off, ln, x, y, w, h = struct.unpack_from(">IIhhHH", self._b, o + self._k)
+        r = (x, y, w, h, off, ln)
+        self._memo[key] = r
+        return r
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+
+def load(path):
+    """AssetIndex oder None (Datei fehlt/kaputt) – Aufrufer fallen dann auf JSON zurück."""
+    try:
+        return AssetIndex(path)
+    except Exception:
+        return None
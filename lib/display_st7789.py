@@ -1,7 +1,7 @@
 # display_st7789.py — ST7789-Treiber für LilyGO T-Watch S3 (ESP32-S3)
 # HW-SPI only, AXP2101 Power-Seq, PWM-Backlight, Zeichenprims + 5x7 Font
 from machine import Pin, I2C, SPI, PWM
-import time, struct
+import time
 from core.logger import warn as log_warn
 from lib.power_axp2101 import create_power
 
@@ -11,18 +11,29 @@ try:
     _CFG_SPI_HZ = int(getattr(config, "DISPLAY_HZ", 40_000_000))
 except Exception:
     _CFG_SPI_HZ = 40_000_000
+# RAM-Budget des Fill-Blockpuffers (mehrere Zeilen einer Farbe, min. 1 Zeile)
+try:
+    _CFG_FILL_BYTES = int(getattr(config, "DISPLAY_FILL_BUF_BYTES", 9_600))
+except Exception:
+    _CFG_FILL_BYTES = 9_600
+# RAM-Budget des 5x7-Glyphcaches (RGB565-Glyphen, LRU)
+try:
+    _CFG_GLYPH_BYTES = int(getattr(config, "DISPLAY_GLYPH_CACHE_BYTES", 4_096))
+except Exception:
+    _CFG_GLYPH_BYTES = 4_096
 
 # Physische Panelgröße
 LCD_W = 240
 LCD_H = 240
 
 # ST7789 Commands
-_SWRESET=0x01; _SLPIN=0x10; _SLPOUT=0x11; _NORON=0x13
+_SWRESET=0x01; _SLPIN=0x10; _SLPOUT=0x11; _PTLON=0x12; _NORON=0x13
 _INVOFF=0x20; _INVON=0x21; _DISPON=0x29
 _CASET =0x2A; _RASET=0x2B; _RAMWR=0x2C
 _MADCTL=0x36; _COLMOD=0x3A; _PORCTRL=0xB2; _GCTRL=0xB7
 _VCOMS =0xBB; _LCMCTRL=0xC0; _VDVVRHEN=0xC2; _VRHS=0xC3
-_VDVSET=0xC4; _FRCTRL2=0xC6; _PWCTRL1=0xD0; _VSCRDEF=0x33
+_VDVSET=0xC4; _FRCTRL2=0xC6; _PWCTRL1=0xD0; _VSCRDEF=0x33; _VSCSAD=0x37
+_PTLAR=0x30; _IDMOFF=0x38; _IDMON=0x39
 
 # MADCTL Bits
 _MADCTL_MY=0x80; _MADCTL_MX=0x40; _MADCTL_MV=0x20
@@ -34,6 +45,280 @@ BLACK=rgb565(0,0,0); WHITE=rgb565(255,255,255); RED=rgb565(255,0,0)
 GREEN=rgb565(0,255,0); BLUE=rgb565(0,0,255); CYAN=rgb565(0,255,255)
 MAGENTA=rgb565(255,0,255); YELLOW=rgb565(255,255,0)
 
+# ---- Span-Rasterizer --------------------------------------------------------
+# Formen werden in Rechteck-Runs emit(x, y, w, h) zerlegt (horizontale bzw.
+# vertikale Läufe, gleiche Läufe aufeinanderfolgender Zeilen zusammengefasst).
+# Das Display gibt jeden Run als ein Fenster aus; Offscreen-Puffer können
+# denselben Emitter-Vertrag nutzen.
+
+def _isqrt(n):
+    if n <= 0: return 0
+    r = int(n ** 0.5)
+    while r * r > n: r -= 1
+    while (r + 1) * (r + 1) <= n: r += 1
+    return r
+
+class _RunMerger:
+    """Fasst Zeilen-Runs mit identischem (x, w) direkt untereinander zu höheren Rechtecken zusammen."""
+    def __init__(self, emit):
+        self.emit = emit
+        self.open = {}            # (x, w) -> [y0, h]
+
+    def row(self, y, *spans):
+        prev = self.open; nxt = {}
+        for i in range(0, len(spans), 2):
+            x = spans[i]; w = spans[i + 1]
+            if w <= 0: continue
+            o = prev.pop((x, w), None)
+            if o is not None and o[0] + o[1] == y:
+                o[1] += 1; nxt[(x, w)] = o
+            else:
+                if o is not None: self.emit(x, o[0], w, o[1])
+                nxt[(x, w)] = [y, 1]
+        for (x, w), o in prev.items():
+            self.emit(x, o[0], w, o[1])
+        self.open = nxt
+
+    def close(self):
+        for (x, w), o in self.open.items():
+            self.emit(x, o[0], w, o[1])
+        self.open = {}
+
+def span_line(x0, y0, x1, y1, emit):
+    """Bresenham, aber als Läufe: x-dominant -> horizontale, y-dominant -> vertikale Runs."""
+    dx = x1 - x0 if x1 >= x0 else x0 - x1
+    dy = y1 - y0 if y1 >= y0 else y0 - y1
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    if dx >= dy:
+        err = dx // 2; x = x0; y = y0; xs = x0
+        for _ in range(dx):
+            err -= dy
+            if err < 0:
+                emit(xs if xs < x else x, y, (x - xs if x >= xs else xs - x) + 1, 1)
+                y += sy; err += dx; xs = x + sx
+            x += sx
+        emit(xs if xs < x else x, y, (x - xs if x >= xs else xs - x) + 1, 1)
+    else:
+        err = dy // 2; x = x0; y = y0; ys = y0
+        for _ in range(dy):
+            err -= dx
+            if err < 0:
+                emit(x, ys if ys < y else y, 1, (y - ys if y >= ys else ys - y) + 1)
+                x += sx; err += dy; ys = y + sy
+            y += sy
+        emit(x, ys if ys < y else y, 1, (y - ys if y >= ys else ys - y) + 1)
+
+def span_polygon(pts, emit):
+    """
+    Konvexes Polygon in kontinuierlichen Koordinaten (Pixel (x,y) = Fläche [x,x+1)×[y,y+1)).
+    Abtastung an Pixelmitten, ein Run pro Zeile.
+    """
+    n = len(pts)
+    if n < 3: return
+    ymin = min(p[1] for p in pts); ymax = max(p[1] for p in pts)
+    ya = int(ymin - 0.5)
+    if ya < ymin - 0.5: ya += 1
+    mg = _RunMerger(emit)
+    y = ya
+    while y + 0.5 < ymax:
+        yc = y + 0.5
+        xl = None; xr = None
+        j = n - 1
+        for i in range(n):
+            ax, ay = pts[j]; bx, by = pts[i]
+            if (ay <= yc < by) or (by <= yc < ay):
+                xc = ax + (yc - ay) * (bx - ax) / (by - ay)
+                if xl is None or xc < xl: xl = xc
+                if xr is None or xc > xr: xr = xc
+            j = i
+        if xl is not None:
+            a = int(xl - 0.5)
+            if a < xl - 0.5: a += 1
+            b = int(xr - 0.5)
+            if b < xr - 0.5: b += 1
+            mg.row(y, a, b - a)
+        y += 1
+    mg.close()
+
+def span_thick_line(x0, y0, x1, y1, thickness, emit):
+    """Linie mit Breite thickness (flache Enden) als Viereck auf den Pixelmitten."""
+    if thickness <= 1:
+        span_line(x0, y0, x1, y1, emit); return
+    dx = x1 - x0; dy = y1 - y0
+    ln = (dx * dx + dy * dy) ** 0.5
+    if ln == 0:
+        h = thickness // 2
+        emit(x0 - h, y0 - h, thickness, thickness); return
+    k = thickness / (2.0 * ln)
+    nx = -dy * k; ny = dx * k
+    # Enden um einen halben Pixel verlängern, damit beide Endpunkte enthalten sind
+    ux = dx * 0.5 / ln; uy = dy * 0.5 / ln
+    ax = x0 + 0.5 - ux; ay = y0 + 0.5 - uy; bx = x1 + 0.5 + ux; by = y1 + 0.5 + uy
+    span_polygon(((ax + nx, ay + ny), (bx + nx, by + ny),
+                  (bx - nx, by - ny), (ax - nx, ay - ny)), emit)
+
+def span_circle(cx, cy, r, emit, thickness=1):
+    """Kreisring (Außenradius r, Breite thickness) zeilenweise."""
+    if r < 0: return
+    ri = r - thickness
+    mg = _RunMerger(emit)
+    for dy in range(-r, r + 1):
+        xo = _isqrt(r * r + r - dy * dy)
+        q = ri * ri + ri - dy * dy
+        if ri < 0 or q < 0:
+            mg.row(cy + dy, cx - xo, 2 * xo + 1)
+        else:
+            xi = _isqrt(q)
+            mg.row(cy + dy, cx - xo, xo - xi, cx + xi + 1, xo - xi)
+    mg.close()
+
+def span_fill_circle(cx, cy, r, emit):
+    if r < 0: return
+    mg = _RunMerger(emit)
+    for dy in range(-r, r + 1):
+        xo = _isqrt(r * r + r - dy * dy)
+        mg.row(cy + dy, cx - xo, 2 * xo + 1)
+    mg.close()
+
+def span_arc(cx, cy, r, a0, a1, emit, thickness=1):
+    """
+    Ringsegment von a0 nach a1 (Grad, im Uhrzeigersinn ab 12 Uhr) – z.B. Fortschrittsringe.
+    Winkeltest per Kreuzprodukt (keine Trigonometrie pro Pixel).
+    """
+    if a1 - a0 >= 360 or a0 - a1 >= 360:
+        span_circle(cx, cy, r, emit, thickness); return
+    import math
+    sweep = (a1 - a0) % 360
+    r0 = math.radians(a0); r1 = math.radians(a0 + sweep)
+    sx = int(math.sin(r0) * 1024); sy = int(-math.cos(r0) * 1024)
+    ex = int(math.sin(r1) * 1024); ey = int(-math.cos(r1) * 1024)
+    small = sweep <= 180
+    ri = r - thickness
+    mg = _RunMerger(emit)
+    for dy in range(-r, r + 1):
+        xo = _isqrt(r * r + r - dy * dy)
+        q = ri * ri + ri - dy * dy
+        if ri < 0 or q < 0: segs = ((-xo, xo),)
+        else:
+            xi = _isqrt(q); segs = ((-xo, -xi - 1), (xi + 1, xo))
+        spans = []
+        for a, b in segs:
+            run = None
+            for px in range(a, b + 1):
+                c1 = sx * dy - sy * px          # cross(s, p)
+                c2 = px * ey - dy * ex          # cross(p, e)
+                inside = (c1 >= 0 and c2 >= 0) if small else (c1 >= 0 or c2 >= 0)
+                if inside:
+                    if run is None: run = px
+                elif run is not None:
+                    spans.append(cx + run); spans.append(px - run); run = None
+            if run is not None:
+                spans.append(cx + run); spans.append(b + 1 - run)
+        mg.row(cy + dy, *spans)
+    mg.close()
+
+def span_round_rect(x, y, w, h, r, emit, thickness=0):
+    """Abgerundetes Rechteck; thickness=0 -> gefüllt, sonst Rahmen dieser Breite."""
+    if w <= 0 or h <= 0: return
+    m = (w if w < h else h) // 2
+    if r > m: r = m
+    if r < 0: r = 0
+    t = thickness
+    if t > 0 and (2 * t >= w or 2 * t >= h): t = 0
+    cxl = x + r; cxr = x + w - 1 - r; cyt = y + r; cyb = y + h - 1 - r
+    ri = r - t
+    mg = _RunMerger(emit)
+    def corner(yy, dy):
+        xo = _isqrt(r * r + r - dy * dy)
+        q = ri * ri + ri - dy * dy
+        if not t or ri < 0 or q < 0:
+            mg.row(yy, cxl - xo, cxr - cxl + 2 * xo + 1)
+        else:
+            xi = _isqrt(q)
+            mg.row(yy, cxl - xo, xo - xi, cxr + xi + 1, xo - xi)
+    for yy in range(y, cyt):
+        corner(yy, cyt - yy)
+    mg.close()
+    if not t:
+        emit(x, cyt, w, cyb - cyt + 1)
+    else:
+        a = cyt; b = cyb
+        ft = y + t - 1; fb = y + h - t
+        if a <= ft:
+            e = ft if ft < b else b
+            emit(x, a, w, e - a + 1); a = e + 1
+        if fb <= b:
+            s = fb if fb > a else a
+            if s <= b: emit(x, s, w, b - s + 1); b = s - 1
+        if a <= b:
+            emit(x, a, t, b - a + 1); emit(x + w - t, a, t, b - a + 1)
+    for yy in range(cyb + 1, y + h):
+        corner(yy, yy - cyb)
+    mg.close()
+
+# ---- RLE-Sprites (host/rle_convert.py) --------------------------------------
+# Header: b"RL16", w, h (u16 BE). Danach Pakete über Zeilengrenzen hinweg:
+#   c & 0x80 -> Lauf von (c & 0x7F)+1 Pixeln, gefolgt von einer RGB565-Farbe
+#   sonst    -> c+1 Literal-Pixel (je 2 Byte)
+RLE_MAGIC = b"RL16"
+_RLE_MAXPKT = 1 + 128 * 2
+
+def rle_size(hdr):
+    """(w, h) aus den ersten 8 Bytes eines RLE-Sprites."""
+    if bytes(hdr[0:4]) != RLE_MAGIC: raise ValueError("RLE: magic")
+    return (hdr[4] << 8) | hdr[5], (hdr[6] << 8) | hdr[7]
+
+# ---- Blend-Tabellen (4-bit Alpha) -------------------------------------------
+# _BL5[a*32+v] = round(v*a/15) für 5-bit-Kanäle, _BL6 analog für 6 bit.
+# out = T[a][src] + T[15-a][dst]; die Summe kann den Kanal nicht überlaufen,
+# weil v*a/15 bei ungeradem Nenner nie auf .5 endet.
+_BL5 = None; _BL6 = None
+
+def _blend_tables():
+    global _BL5, _BL6
+    if _BL5 is None:
+        t5 = bytearray(16 * 32); t6 = bytearray(16 * 64)
+        for a in range(16):
+            for v in range(32): t5[a * 32 + v] = (v * a * 2 + 15) // 30
+            for v in range(64): t6[a * 64 + v] = (v * a * 2 + 15) // 30
+        _BL5 = t5; _BL6 = t6
+    return _BL5, _BL6
+
+def blend_tables():
+    """(L5, L6) für eigenes Mischen außerhalb des Treibers (z.B. Kanten-AA der Analogzeiger)."""
+    return _blend_tables()
+
+# ---- SPI-Instrumentierung (opt-in) ------------------------------------------
+# Ersetzt bei stats_enable() das SPI-Objekt des Displays; ausgeschaltet liegt
+# das rohe SPI-Objekt im Schreibpfad (keine Kosten). Zählwerte je Tag:
+# [commands, windows, bytes, writes, us]
+class _SpiStats:
+    def __init__(self, spi, dc):
+        self.spi = spi
+        self.dc = dc
+        self.tags = {}
+        self.tag("-")
+
+    def tag(self, name):
+        s = self.tags.get(name)
+        if s is None:
+            s = self.tags[name] = [0, 0, 0, 0, 0]
+        self.cur = s
+
+    def write(self, buf):
+        t0 = time.ticks_us()
+        self.spi.write(buf)
+        s = self.cur
+        s[4] += time.ticks_diff(time.ticks_us(), t0)
+        s[3] += 1; s[2] += len(buf)
+        if not self.dc.value():
+            s[0] += 1
+            if buf[0] == _RAMWR: s[1] += 1
+
+    def __getattr__(self, name):
+        return getattr(self.spi, name)
+
 # ---- ST7789 ----
 class ST7789Display:
     def __init__(self,
@@ -58,8 +343,26 @@ class ST7789Display:
         # Backlight
         self._bl_pwm=PWM(Pin(bl_pin,Pin.OUT), freq=bl_pwm_freq, duty_u16=0)
         self._brightness=1.0
-        # Zeilenbuffer
-        self._linebuf=bytearray(LCD_W*2); self._mv_line=memoryview(self._linebuf)
+        # Fill-Blockpuffer: wird je Farbe einmal befüllt und über Aufrufe hinweg wiederverwendet
+        nfill=_CFG_FILL_BYTES & ~1
+        if nfill<LCD_W*2: nfill=LCD_W*2
+        self._fillbuf=bytearray(nfill); self._mv_fill=memoryview(self._fillbuf)
+        self._fill_c=-1; self._fill_n=0   # aktuelle Farbe / gültige Bytes
+        # Clip-Stack (inklusive Koordinaten x0,y0,x1,y1; wird in set_rotation gesetzt)
+        self._clip=(0,0,LCD_W-1,LCD_H-1); self._clip_stack=[]
+        # Vorallokierte Command-/Adresspuffer + Fenster-Cache (rohe CASET/RASET-Werte)
+        self._cb1=bytearray(1); self._wa=bytearray(4); self._px2=bytearray(2)
+        self._win_x=-1; self._win_y=-1
+        # Hardware-Scroll: Definition (top, height, tfa) und aktiver Versatz (top, height, off) oder None
+        self._rot=0; self._scr_def=None; self._scr_pos=0; self._scr=None
+        # Always-on: Idle-Modus (8 Farben) an/aus, Partial-Bereich (top, height) oder None
+        self._idle=False; self._ptl=None
+        # SPI-Statistik (None = aus) und aktuelles Tag
+        self._stats=None; self._stats_tag="-"
+        # Eingangspuffer für RLE-Streams aus Dateien (lazy)
+        self._rle_in=None
+        # 5x7-Glyphcache: (ch, scale, fg, bg) -> [bytes RGB565, lru_tick]
+        self._gcache={}; self._gcache_bytes=0; self._gtick=0
         # Default-Font (extern), falls vorhanden
         self._default_face = None
         self._default_style = None
@@ -81,7 +384,8 @@ class ST7789Display:
 
     # --- Low-level ---
     def _cmd(self,c,data=None):
-        self._cs.off(); self._dc.off(); self._spi.write(bytes([c]))
+        cb=self._cb1; cb[0]=c
+        self._cs.off(); self._dc.off(); self._spi.write(cb)
         if data: self._dc.on(); self._spi.write(data)
         self._cs.on()
 
@@ -91,15 +395,30 @@ class ST7789Display:
         if y0<0: y0=0
         if x1>=self._w: x1=self._w-1
         if y1>=self._h: y1=self._h-1
-        # ST7789: immer X->CASET, Y->RASET senden und OFFSETS addieren
+        # ST7789: X->CASET, Y->RASET mit OFFSETS; unveränderte Adressen nicht erneut senden
+        # (RAMWR setzt den Schreibzeiger ohnehin auf den Fensteranfang zurück)
         x0o = x0 + self._xoff; x1o = x1 + self._xoff
         y0o = y0 + self._yoff; y1o = y1 + self._yoff
-        self._cmd(_CASET, struct.pack(">HH", x0o, x1o))
-        self._cmd(_RASET, struct.pack(">HH", y0o, y1o))
-        self._cs.off(); self._dc.off(); self._spi.write(bytes([_RAMWR])); self._dc.on()
-        time.sleep_us(8)
+        spi=self._spi; dc=self._dc; cb=self._cb1; a=self._wa
+        self._cs.off()
+        kx=(x0o<<16)|x1o
+        if kx!=self._win_x:
+            cb[0]=_CASET; dc.off(); spi.write(cb)
+            a[0]=x0o>>8; a[1]=x0o&0xFF; a[2]=x1o>>8; a[3]=x1o&0xFF
+            dc.on(); spi.write(a); self._win_x=kx
+        ky=(y0o<<16)|y1o
+        if ky!=self._win_y:
+            cb[0]=_RASET; dc.off(); spi.write(cb)
+            a[0]=y0o>>8; a[1]=y0o&0xFF; a[2]=y1o>>8; a[3]=y1o&0xFF
+            dc.on(); spi.write(a); self._win_y=ky
+        cb[0]=_RAMWR; dc.off(); spi.write(cb); dc.on()
+
+    def _win_reset(self):
+        """Fenster-Cache verwerfen (nach Reset/MADCTL: Adressen neu senden)."""
+        self._win_x=-1; self._win_y=-1
 
     def _init_panel(self):
+        self._win_reset()
         self._cmd(_SWRESET); time.sleep_ms(150)
         self._cmd(_SLPOUT);  time.sleep_ms(150)
         self._cmd(_COLMOD, b"\x55")
@@ -168,6 +487,8 @@ class ST7789Display:
 
     def set_rotation(self, rot:int):
         rot = rot%4
+        if self._scr_def: self.scroll_reset()
+        self._rot = rot
         mad = _MADCTL_BGR if self._bgr else 0
         # MADCTL + Offsets je Rotation (ST7789V 240x240)
         if   rot==0:
@@ -187,29 +508,140 @@ class ST7789Display:
             self._xoff, self._yoff = 0, 0
             self._w, self._h = LCD_H, LCD_W   # swap
 
+        # Clip auf neue logische Größe zurücksetzen
+        self._clip=(0,0,self._w-1,self._h-1); self._clip_stack=[]
         self._cmd(_MADCTL, bytes([mad]))
+        self._win_reset()
         # Vollbildfenster setzen (mit Offsets)
         self._set_window(0,0,self._w-1,self._h-1)
         time.sleep_ms(2)
 
+    # --- Clip-Stack ---
+    def push_clip(self, x, y, w, h):
+        """Schneidet (x,y,w,h) mit dem aktuellen Clip; gilt für fill/blit/pixel bis pop_clip()."""
+        self._clip_stack.append(self._clip)
+        cx0,cy0,cx1,cy1=self._clip
+        x1=x+w-1; y1=y+h-1
+        if x<cx0: x=cx0
+        if y<cy0: y=cy0
+        if x1>cx1: x1=cx1
+        if y1>cy1: y1=cy1
+        self._clip=(x,y,x1,y1)   # evtl. leer (x>x1 / y>y1)
+
+    def pop_clip(self):
+        if self._clip_stack:
+            self._clip=self._clip_stack.pop()
+
+    def get_clip(self):
+        x0,y0,x1,y1=self._clip
+        return x0, y0, x1-x0+1, y1-y0+1
+
+    # --- SPI-Statistik ---
+    def stats_enable(self, enable=True):
+        """Zähler ein-/ausschalten (tauscht das SPI-Objekt im Schreibpfad)."""
+        if enable and self._stats is None:
+            self._stats=_SpiStats(self._spi, self._dc)
+            self._stats.tag(self._stats_tag)
+            self._spi=self._stats
+        elif not enable and self._stats is not None:
+            self._spi=self._stats.spi; self._stats=None
+
+    def stats_tag(self, tag):
+        """Folgenden SPI-Verkehr tag (Face-/Screen-Name) zurechnen; liefert das vorige Tag."""
+        prev=self._stats_tag; self._stats_tag=tag
+        if self._stats is not None: self._stats.tag(tag)
+        return prev
+
+    def stats_snapshot(self):
+        """{tag: {cmds, windows, bytes, writes, us}} seit dem letzten Reset; None wenn aus."""
+        st=self._stats
+        if st is None: return None
+        out={}
+        for k, v in st.tags.items():
+            if v[3]: out[k]={"cmds":v[0], "windows":v[1], "bytes":v[2], "writes":v[3], "us":v[4]}
+        return out
+
+    def stats_reset(self):
+        st=self._stats
+        if st is not None:
+            st.tags={}; st.tag(self._stats_tag)
+
     def sleep(self, enable=True):
         if enable: self._cmd(_SLPIN)
         else: self._cmd(_SLPOUT); time.sleep_ms(120)
 
+    # ---- Always-on: Idle-Modus + Partial-Bereich ----------------------------
+    # GRAM-Zugriffe bleiben unverändert; das Panel zeigt im Idle-Modus nur das MSB je Kanal
+    # (8 Farben) und treibt im Partial-Modus nur die Zeilen des Bereichs, der Rest bleibt dunkel.
+    def idle_mode(self, enable=True):
+        enable = bool(enable)
+        if enable != self._idle:
+            self._cmd(_IDMON if enable else _IDMOFF)
+            self._idle = enable
+
+    def partial_mode(self, top, height):
+        """Nur Bildschirmzeilen [top, top+height) anzeigen; False, wenn die Rotation es nicht erlaubt."""
+        if self._rot not in (0, 2): return False
+        if top < 0: top = 0
+        if top + height > LCD_H: height = LCD_H - top
+        if height <= 0: return False
+        # Panelzeilen wie beim Scrollbereich (Rotation 0: gespiegelt)
+        s = top if self._rot == 2 else LCD_H - top - height
+        e = s + height - 1
+        self._cmd(_PTLAR, bytes((s >> 8, s & 0xFF, e >> 8, e & 0xFF)))
+        if self._ptl is None: self._cmd(_PTLON)
+        self._ptl = (top, height)
+        return True
+
+    def normal_mode(self):
+        """Partial-Bereich aufheben (NORON, ganzes Panel); Idle bleibt wie gesetzt."""
+        if self._ptl is not None:
+            self._cmd(_NORON); self._ptl = None
+
     def fill_screen(self, c565): self.fill_rect(0,0,self._w,self._h,c565)
 
     def fill_rect(self,x,y,w,h,c565):
         if w<=0 or h<=0: return
+        cx0,cy0,cx1,cy1=self._clip
         x2,y2=x+w-1,y+h-1
+        if x<cx0: x=cx0
+        if y<cy0: y=cy0
+        if x2>cx1: x2=cx1
+        if y2>cy1: y2=cy1
+        if x>x2 or y>y2: return
+        if self._scr:
+            for sy,n,my in self._scroll_split(y,y2-y+1):
+                self._fill_win(x,my,x2,my+n-1,c565)
+            return
+        self._fill_win(x,y,x2,y2,c565)
+
+    def _fill_win(self,x,y,x2,y2,c565):
         self._set_window(x,y,x2,y2)
-        hi,lo=(c565>>8)&0xFF, c565&0xFF
-        # Zeilenpuffer füllen
-        for i in range(0,w*2,2):
-            self._mv_line[i]=hi; self._mv_line[i+1]=lo
-        for _ in range(h):
-            self._spi.write(self._mv_line[:w*2])
+        # Einfarbig: der Bytestrom ist unabhängig von der Breite -> in Blockgröße streamen
+        n=(x2-x+1)*(y2-y+1)*2
+        mv=self._fill_prepare(c565, n)
+        blk=len(mv)
+        while n>blk:
+            self._spi.write(mv); n-=blk
+        self._spi.write(mv[:n])
         self._cs.on()
 
+    def _fill_prepare(self, c565, n):
+        """Liefert den Blockpuffer mit mind. min(n, Budget) gültigen Bytes in c565."""
+        mv=self._mv_fill
+        if n>len(mv): n=len(mv)
+        if c565!=self._fill_c:
+            mv[0]=(c565>>8)&0xFF; mv[1]=c565&0xFF
+            self._fill_c=c565; self._fill_n=2
+        # Verdoppelndes Kopieren statt Byte-Schleife
+        k=self._fill_n
+        while k<n:
+            m=k if k+k<=n else n-k
+            mv[k:k+m]=mv[0:m]
+            k+=m
+        self._fill_n=k
+        return mv[:k]
+
     # --- Convenience-Linien & -Rahmen (nutzen fill_rect) ---
     def hline(self, x, y, w, color):
         if w > 0:
@@ -228,63 +660,322 @@ class ST7789Display:
         self.vline(x + w - 1, y, h, color)       # rechts
 
     def draw_pixel(self,x,y,c565):
-        if 0<=x<self._w and 0<=y<self._h:
+        cx0,cy0,cx1,cy1=self._clip
+        if cx0<=x<=cx1 and cy0<=y<=cy1:
+            if self._scr: y=self._scroll_split(y,1)[0][2]
             self._set_window(x,y,x,y)
-            self._spi.write(bytes([(c565>>8)&0xFF, c565&0xFF]))
+            pb=self._px2; pb[0]=(c565>>8)&0xFF; pb[1]=c565&0xFF
+            self._spi.write(pb)
             self._cs.on()
 
-    def draw_line(self,x0,y0,x1,y1,c565):
-        dx=abs(x1-x0); sx=1 if x0<x1 else -1
-        dy=-abs(y1-y0); sy=1 if y0<y1 else -1
-        err=dx+dy
-        while True:
-            self.draw_pixel(x0,y0,c565)
-            if x0==x1 and y0==y1: break
-            e2=2*err
-            if e2>=dy: err+=dy; x0+=sx
-            if e2<=dx: err+=dx; y0+=sy
-
-    def blit_rgb565(self, x, y, w, h, buf):
-        # Robust gegen Fenster-Clipping (unten/rechts). Sendet nur sichtbare Bytes.
+    # --- Formen über den Span-Rasterizer (ein Fenster pro Lauf statt pro Pixel) ---
+    def _span_emit(self, c565):
+        fr=self.fill_rect
+        return lambda x,y,w,h: fr(x,y,w,h,c565)
+
+    def draw_line(self,x0,y0,x1,y1,c565,thickness=1):
+        if thickness>1: span_thick_line(x0,y0,x1,y1,thickness,self._span_emit(c565))
+        else: span_line(x0,y0,x1,y1,self._span_emit(c565))
+
+    def draw_circle(self,cx,cy,r,c565,thickness=1):
+        span_circle(cx,cy,r,self._span_emit(c565),thickness)
+
+    def fill_circle(self,cx,cy,r,c565):
+        span_fill_circle(cx,cy,r,self._span_emit(c565))
+
+    def draw_arc(self,cx,cy,r,start_deg,end_deg,c565,thickness=1):
+        """Bogen im Uhrzeigersinn ab 12 Uhr (start_deg..end_deg)."""
+        span_arc(cx,cy,r,start_deg,end_deg,self._span_emit(c565),thickness)
+
+    def draw_round_rect(self,x,y,w,h,r,c565,thickness=1):
+        span_round_rect(x,y,w,h,r,self._span_emit(c565),thickness if thickness>0 else 1)
+
+    def fill_round_rect(self,x,y,w,h,r,c565):
+        span_round_rect(x,y,w,h,r,self._span_emit(c565),0)
+
+    def fill_polygon(self,pts,c565):
+        """Konvexes Polygon aus Pixelkoordinaten [(x,y),...]."""
+        span_polygon([(px+0.5,py+0.5) for px,py in pts],self._span_emit(c565))
+
+    def blit_rgb565(self, x, y, w, h, buf, stride=0, offset=0):
+        # Robust gegen Fenster-/Clip-Stack-Clipping. Sendet nur sichtbare Bytes.
+        # stride/offset: Unterrechteck aus einem größeren Puffer (Atlas, Vollbild-BG):
+        # stride = Zeilenlänge der Quelle in Pixeln (0 = w), offset = Startbyte in buf.
         if w <= 0 or h <= 0:
             return
 
-        # Effektives Fenster in logischen Koordinaten berechnen
-        x0 = 0 if x < 0 else x
-        y0 = 0 if y < 0 else y
+        # Effektives Fenster in logischen Koordinaten berechnen (aktueller Clip)
+        cx0, cy0, cx1, cy1 = self._clip
+        x0 = cx0 if x < cx0 else x
+        y0 = cy0 if y < cy0 else y
         x1 = x + w - 1
         y1 = y + h - 1
-        if x1 >= self._w: x1 = self._w - 1
-        if y1 >= self._h: y1 = self._h - 1
+        if x1 > cx1: x1 = cx1
+        if y1 > cy1: y1 = cy1
 
         w_eff = x1 - x0 + 1
         h_eff = y1 - y0 + 1
         if w_eff <= 0 or h_eff <= 0:
             return
 
-        # Fenster setzen (inkl. Offsets)
-        self._set_window(x0, y0, x1, y1)
-
         mv = buf if isinstance(buf, memoryview) else memoryview(buf)
+        row_stride = (stride if stride > w else w) * 2
+        off = offset + (y0 - y) * row_stride + (x0 - x) * 2
+        if self._scr:
+            # Scrollbereich aktiv: Zeilen auf Speicherzeilen umlegen (ggf. am Umbruch teilen)
+            for sy, n, my in self._scroll_split(y0, h_eff):
+                self._blit_win(x0, my, x1, n, mv, off + (sy - y0) * row_stride, row_stride, w_eff)
+            return
+        self._blit_win(x0, y0, x1, h_eff, mv, off, row_stride, w_eff)
 
-        # Falls nur unten geclippt wurde (Standardfall), kann ein Prefix gesendet werden
-        if w_eff == w and x0 == x:
-            # y-Shift (falls y < 0) berücksichtigen
-            start_row = max(0, y0 - y)
-            row_stride = w * 2
-            start_off = start_row * row_stride
-            self._spi.write(mv[start_off : start_off + (w * h_eff * 2)])
+    def _blit_win(self, x0, y0, x1, n, mv, off, row_stride, w_eff):
+        self._set_window(x0, y0, x1, y0 + n - 1)
+        if w_eff * 2 == row_stride:
+            # volle Breite sichtbar: zusammenhängender Block
+            self._spi.write(mv[off : off + row_stride * n])
         else:
-            # Allgemeiner Fall (auch rechts/links Clipping): zeilenweise senden
-            row_stride = w * 2
-            start_row = max(0, y0 - y)
-            start_col = max(0, x0 - x)
-            for r in range(h_eff):
-                off = (start_row + r) * row_stride + start_col * 2
-                self._spi.write(mv[off : off + (w_eff * 2)])
-
+            # Unterrechteck (Stride/Clip): Zeilen im Fill-Blockpuffer sammeln -> wenige große Writes
+            # im selben Fenster. Quelle darf der Blockpuffer selbst sein (Zeilen rücken nur nach vorn).
+            wb = w_eff * 2
+            out = self._mv_fill
+            per = len(out) // wb
+            if per < 2:
+                for r in range(n):
+                    self._spi.write(mv[off : off + wb]); off += row_stride
+            else:
+                self._fill_c = -1
+                while n > 0:
+                    k = per if n > per else n
+                    o = 0
+                    for r in range(k):
+                        out[o : o + wb] = mv[off : off + wb]; o += wb; off += row_stride
+                    self._spi.write(out[:o]); n -= k
         self._cs.on()
 
+    def blit_bands(self, x, y, w, h, paint):
+        """
+        Rechteck zeilenblockweise erzeugen und in einem Fenster senden (Offscreen-Komposition
+        ohne eigenen Vollpuffer): paint(buf, x, y, w, n) füllt n Zeilen à w Pixel ab Zeile y
+        (bereits auf den Clip beschnitten) in buf. buf ist der Fill-Blockpuffer.
+        """
+        if w <= 0 or h <= 0: return
+        cx0, cy0, cx1, cy1 = self._clip
+        x0 = cx0 if x < cx0 else x
+        y0 = cy0 if y < cy0 else y
+        x1 = x + w - 1
+        y1 = y + h - 1
+        if x1 > cx1: x1 = cx1
+        if y1 > cy1: y1 = cy1
+        w_eff = x1 - x0 + 1; h_eff = y1 - y0 + 1
+        if w_eff <= 0 or h_eff <= 0: return
+        out = self._mv_fill; self._fill_c = -1
+        wb = w_eff * 2
+        rows = len(out) // wb
+        if rows < 1: rows = 1; out = memoryview(bytearray(wb))
+        one = not self._scr
+        if one: self._set_window(x0, y0, x1, y1)
+        yy = y0
+        while yy <= y1:
+            n = y1 - yy + 1
+            if n > rows: n = rows
+            k = n * wb
+            paint(out, x0, yy, w_eff, n)
+            if one: self._spi.write(out[:k])
+            else: self.blit_rgb565(x0, yy, w_eff, n, out[:k])
+            yy += n
+        if one: self._cs.on()
+
+    def blit_blend(self, x, y, w, h, src, bg, alpha=None, key=None, bg_stride=LCD_W):
+        """
+        Sprite src (RGB565, w*h) auf einen Hintergrund komponieren, ein Durchlauf, ein Fenster.
+        alpha: 4-bit-Alpha je Pixel (2 Pixel/Byte, High-Nibble zuerst, 15 = deckend) oder None
+        key:   transparenter RGB565-Wert in src oder None
+        bg:    RGB565-Puffer in Bildschirmkoordinaten (Zeilenlänge bg_stride Pixel) oder Farbe (int)
+        """
+        if alpha is None and key is None:
+            self.blit_rgb565(x, y, w, h, src); return
+        if w <= 0 or h <= 0: return
+        cx0, cy0, cx1, cy1 = self._clip
+        x0 = cx0 if x < cx0 else x
+        y0 = cy0 if y < cy0 else y
+        x1 = x + w - 1
+        y1 = y + h - 1
+        if x1 > cx1: x1 = cx1
+        if y1 > cy1: y1 = cy1
+        w_eff = x1 - x0 + 1; h_eff = y1 - y0 + 1
+        if w_eff <= 0 or h_eff <= 0: return
+        L5, L6 = _blend_tables()
+        solid = isinstance(bg, int)
+        if solid: bh = (bg >> 8) & 0xFF; bl = bg & 0xFF
+        # Ausgabe zeilenblockweise im Fill-Blockpuffer; ohne Scrollversatz ein Fenster für alles
+        out = self._mv_fill; self._fill_c = -1
+        wb = w_eff * 2
+        rows = len(out) // wb
+        if rows < 1: rows = 1; out = memoryview(bytearray(wb))
+        one = not self._scr
+        if one: self._set_window(x0, y0, x1, y1)
+        k = 0; ys = y0
+        for r in range(h_eff):
+            sy = y0 - y + r
+            i = sy * w + (x0 - x)                       # Pixelindex in src
+            so = i * 2
+            if not solid: bo = ((y0 + r) * bg_stride + x0) * 2
+            for c in range(w_eff):
+                sh = src[so]; sl = src[so + 1]
+                if solid: dh = bh; dl = bl
+                else: dh = bg[bo]; dl = bg[bo + 1]; bo += 2
+                if key is not None and ((sh << 8) | sl) == key:
+                    sh = dh; sl = dl
+                elif alpha is not None:
+                    a = alpha[i >> 1]
+                    a = (a >> 4) if not (i & 1) else (a & 0x0F)
+                    if a == 0:
+                        sh = dh; sl = dl
+                    elif a != 15:
+                        s = (sh << 8) | sl; d = (dh << 8) | dl; ia = 15 - a
+                        v = ((L5[a * 32 + (s >> 11)] + L5[ia * 32 + (d >> 11)]) << 11) \
+                            | ((L6[a * 64 + ((s >> 5) & 63)] + L6[ia * 64 + ((d >> 5) & 63)]) << 5) \
+                            | (L5[a * 32 + (s & 31)] + L5[ia * 32 + (d & 31)])
+                        sh = v >> 8; sl = v & 0xFF
+                out[k] = sh; out[k + 1] = sl; k += 2
+                i += 1; so += 2
+            if k >= rows * wb or r == h_eff - 1:
+                n = k // wb
+                if one: self._spi.write(out[:k])
+                else: self.blit_rgb565(x0, ys, w_eff, n, out[:k])
+                ys += n; k = 0
+        if one: self._cs.on()
+
+    def blit_rle(self, x, y, src, off=0):
+        """
+        RLE-Sprite bei (x,y) zeichnen, ohne das Bild im RAM zu entpacken.
+        src: bytes/memoryview oder offene Datei (readinto/seek); off = Sprite-Anfang.
+        Läufe werden in Zeilenstreifen des Fill-Blockpuffers expandiert und gestreamt.
+        """
+        rd = getattr(src, "readinto", None)
+        if rd:
+            ib = self._rle_in
+            if ib is None: ib = self._rle_in = bytearray(512)
+            ibm = memoryview(ib)
+            src.seek(off); il = rd(ib) or 0; ip = 0
+        else:
+            ibm = ib = src if isinstance(src, memoryview) else memoryview(src)
+            ip = off; il = len(ib)
+        w, h = rle_size(ibm[ip:ip + 8]); ip += 8
+        if w <= 0 or h <= 0: return
+        out = self._mv_fill; self._fill_c = -1
+        wb = w * 2
+        sb = (len(out) // wb) * wb
+        if sb == 0: out = memoryview(bytearray(wb)); sb = wb
+        cx0, cy0, cx1, cy1 = self._clip
+        one = not self._scr and x >= cx0 and y >= cy0 and x + w - 1 <= cx1 and y + h - 1 <= cy1
+        if one: self._set_window(x, y, x + w - 1, y + h - 1)
+        total = wb * h; done = 0; k = 0; row = y
+        while done < total:
+            if rd and il - ip < _RLE_MAXPKT:
+                r = il - ip
+                ib[0:r] = ib[ip:il]; ip = 0
+                il = r + (rd(ibm[r:]) or 0)
+                if il == 0: break                   # Datei zu kurz
+            c = ib[ip]; ip += 1
+            if c & 0x80:
+                m = ((c & 0x7F) + 1) * 2; hi = ib[ip]; lo = ib[ip + 1]; ip += 2
+                while m:
+                    n = sb - k
+                    if n > m: n = m
+                    e = k + n
+                    out[k] = hi; out[k + 1] = lo; j = k + 2
+                    while j < e:
+                        q = j - k if j + j - k <= e else e - j
+                        out[j:j + q] = out[k:k + q]; j += q
+                    k = e; m -= n; done += n
+                    if k == sb or done == total:
+                        if one: self._spi.write(out[:k])
+                        else: self.blit_rgb565(x, row, w, k // wb, out[:k])
+                        row += k // wb; k = 0
+            else:
+                m = (c + 1) * 2
+                while m:
+                    n = sb - k
+                    if n > m: n = m
+                    out[k:k + n] = ibm[ip:ip + n]; ip += n
+                    k += n; m -= n; done += n
+                    if k == sb or done == total:
+                        if one: self._spi.write(out[:k])
+                        else: self.blit_rgb565(x, row, w, k // wb, out[:k])
+                        row += k // wb; k = 0
+        if one: self._cs.on()
+
+    # --- Hardware-Vertikalscroll (VSCRDEF/VSCSAD) ---------------------------
+    # Nur Rotation 0/2 (logisches y = Panelzeile). Gezeichnet wird weiter in
+    # Bildschirmkoordinaten; fill/blit/pixel legen Zeilen im Scrollbereich auf
+    # die passende Speicherzeile um. Nach scroll_by() nur den freigelegten
+    # Streifen neu zeichnen.
+    def scroll_define(self, top, height):
+        """Scrollbereich [top, top+height) festlegen; False, wenn die Rotation es nicht erlaubt."""
+        if self._rot not in (0, 2): return False
+        if top < 0: top = 0
+        if top + height > LCD_H: height = LCD_H - top
+        if height <= 0: return False
+        tfa = top if self._rot == 2 else LCD_H - top - height
+        bfa = 320 - tfa - height
+        self._cmd(_VSCRDEF, bytes((tfa >> 8, tfa & 0xFF, height >> 8, height & 0xFF, bfa >> 8, bfa & 0xFF)))
+        self._scr_def = (top, height, tfa)
+        self.scroll_to(0)
+        return True
+
+    def scroll_to(self, off):
+        """Inhalt des Bereichs um off Zeilen nach oben versetzt anzeigen (ein Register)."""
+        sd = self._scr_def
+        if not sd: return
+        top, height, tfa = sd
+        off %= height
+        self._scr_pos = off
+        self._scr = (top, height, off) if off else None
+        v = tfa + (off if self._rot == 2 else (-off) % height)
+        self._cmd(_VSCSAD, bytes((v >> 8, v & 0xFF)))
+
+    def scroll_by(self, dy, paint=None):
+        """
+        Um dy Zeilen scrollen (dy>0: Inhalt wandert nach oben) und den freigelegten
+        Streifen (Bildschirmkoordinaten) liefern; paint(x, y, w, h) zeichnet ihn unter Clip.
+        """
+        sd = self._scr_def
+        if not sd or not dy: return None
+        top, height, _ = sd
+        n = dy if dy > 0 else -dy
+        if n > height: n = height
+        self.scroll_to(self._scr_pos + dy)
+        ys = top + height - n if dy > 0 else top
+        if paint:
+            self.push_clip(0, ys, self._w, n)
+            try: paint(0, ys, self._w, n)
+            finally: self.pop_clip()
+        return 0, ys, self._w, n
+
+    def scroll_reset(self):
+        """Scrollbereich aufheben (Panel-Default wie in _init_panel); Inhalt danach neu zeichnen."""
+        self._scr_def = None; self._scr_pos = 0; self._scr = None
+        self._cmd(_VSCRDEF, b"\x00\x00\x00\xF0\x00\x00")
+        self._cmd(_VSCSAD, b"\x00\x00")
+
+    def _scroll_split(self, y, h):
+        """Bildschirmzeilen [y, y+h) -> [(y_screen, n, y_speicher), ...] bei aktivem Versatz."""
+        top, height, off = self._scr
+        out = []; ye = y + h; b = top + height
+        if y < top:
+            n = (ye if ye < top else top) - y
+            out.append((y, n, y)); y += n
+        while y < ye and y < b:
+            m = top + (y - top + off) % height
+            e = y + (b - m)                 # Umbruch in den Speicherzeilen
+            if e > ye: e = ye
+            if e > b: e = b
+            out.append((y, e - y, m)); y = e
+        if y < ye:
+            out.append((y, ye - y, y))
+        return out
+
     _FONT_5x7 = {
         '0':(0x3E,0x51,0x49,0x45,0x3E),'1':(0x00,0x42,0x7F,0x40,0x00),
         '2':(0x42,0x61,0x51,0x49,0x46),'3':(0x21,0x41,0x45,0x4B,0x31),
@@ -300,21 +991,91 @@ class ST7789Display:
         ':':(0x00,0x36,0x36,0x00,0x00),'.':(0x00,0x40,0x60,0x00,0x00),
         '/':(0x40,0x30,0x0C,0x03,0x00),
     }
+    def _glyph(self, ch, scale, fg, bg):
+        """Vorgerenderte Glyphe (5*scale x 7*scale, RGB565) aus dem LRU-Cache."""
+        key=(ch, scale, fg, bg)
+        e=self._gcache.get(key)
+        self._gtick+=1
+        if e is not None:
+            e[1]=self._gtick
+            return e[0]
+        g=self._FONT_5x7.get(ch, self._FONT_5x7[' '])
+        gw=5*scale; rb=gw*2
+        buf=bytearray(rb*7*scale)
+        fh=(fg>>8)&0xFF; fl=fg&0xFF; bh=(bg>>8)&0xFF; bl=bg&0xFF
+        mv=memoryview(buf)
+        for cy in range(7):
+            o=cy*scale*rb
+            for px in range(gw):
+                on=(g[px//scale]>>cy)&1
+                buf[o+px*2]=fh if on else bh; buf[o+px*2+1]=fl if on else bl
+            for k in range(1, scale):
+                mv[o+k*rb:o+(k+1)*rb]=mv[o:o+rb]
+        n=len(buf)
+        if n<=_CFG_GLYPH_BYTES:
+            while self._gcache and self._gcache_bytes+n>_CFG_GLYPH_BYTES:
+                old=None; ot=0
+                for k, v in self._gcache.items():
+                    if old is None or v[1]<ot: old=k; ot=v[1]
+                self._gcache_bytes-=len(self._gcache.pop(old)[0])
+            self._gcache[key]=[buf, self._gtick]; self._gcache_bytes+=n
+        return buf
+
+    def clear_glyph_cache(self):
+        self._gcache={}; self._gcache_bytes=0
+
+    def _char_spans(self, x, y, ch, color, scale):
+        """Transparente Glyphe: gesetzte Bits als Zeilen-Runs (vertikal zusammengefasst)."""
+        g=self._FONT_5x7.get(ch, self._FONT_5x7[' '])
+        emit=self._span_emit(color)
+        mg=_RunMerger(emit)
+        for cy in range(7):
+            spans=[]; run=-1
+            for cx in range(6):
+                on=cx<5 and (g[cx]>>cy)&1
+                if on and run<0: run=cx
+                elif not on and run>=0:
+                    spans.append(x+run*scale); spans.append((cx-run)*scale); run=-1
+            for k in range(scale):
+                mg.row(y+cy*scale+k, *spans)
+        mg.close()
+
     def draw_char_5x7(self,x,y,ch,color=WHITE,bg=None,scale=1):
-            g=self._FONT_5x7.get(ch, self._FONT_5x7[' ']); w,h=5,7
-            for cx in range(w):
-                col=g[cx]
-                for cy in range(h):
-                    if (col>>cy)&1:
-                        if scale==1: self.draw_pixel(x+cx,y+cy,color)
-                        else: self.fill_rect(x+cx*scale,y+cy*scale,scale,scale,color)
-                    elif bg is not None:
-                        if scale==1: self.draw_pixel(x+cx,y+cy,bg)
-                        else: self.fill_rect(x+cx*scale,y+cy*scale,scale,scale,bg)
+            if bg is None: self._char_spans(x,y,ch,color,scale)
+            else: self.blit_rgb565(x,y,5*scale,7*scale,self._glyph(ch,scale,color,bg))
     def draw_text_5x7(self,x,y,text,color=WHITE,bg=None,scale=1,spacing=1):
             cx=x; step=(5*scale)+spacing
-            for ch in text:
-                self.draw_char_5x7(cx,y,ch,color,bg,scale); cx+=step
+            if bg is None:
+                for ch in text:
+                    self._char_spans(cx,y,ch,color,scale); cx+=step
+                return
+            # Deckend: ganze Textzeile im Fill-Blockpuffer zusammensetzen -> ein Fenster pro Lauf
+            gw=5*scale; gh=7*scale; rb=gw*2
+            buf=self._mv_fill; cap=len(buf)
+            per=(cap//(gh*2)+spacing)//step   # Zeichen pro Lauf
+            if per<1:
+                for ch in text:
+                    self.draw_char_5x7(cx,y,ch,color,bg,scale); cx+=step
+                return
+            self._fill_c=-1                   # Blockpuffer wird überschrieben
+            bh=(bg>>8)&0xFF; bl=bg&0xFF
+            for i in range(0, len(text), per):
+                run=text[i:i+per]
+                w=len(run)*step-spacing; wb=w*2
+                if spacing>0:
+                    buf[0]=bh; buf[1]=bl
+                    k=2
+                    while k<wb*gh:
+                        m=k if k+k<=wb*gh else wb*gh-k
+                        buf[k:k+m]=buf[0:m]; k+=m
+                for j, ch in enumerate(run):
+                    gm=memoryview(self._glyph(ch,scale,color,bg))
+                    xo=j*step*2
+                    for r in range(gh):
+                        o=r*wb+xo
+                        buf[o:o+rb]=gm[r*rb:(r+1)*rb]
+                self.blit_rgb565(cx,y,w,gh,buf[:wb*gh])
+                cx+=len(run)*step
     def draw_text(self, x, y, s, color=WHITE, bg=None, face=None, style=None,
                       shadow=None, outline=None):
             return self.text(x, y, s, color=color, bg=bg, face=face, style=style,
@@ -366,6 +1127,112 @@ class ST7789Display:
             # Fallback 5x7, scale=2
             return self.measure_text_5x7(s, scale=2, spacing=1)
 
+# ---- Compositor (Retained-Mode Dirty-Rects) ---------------------------------
+class Compositor:
+    """
+    Sammelt invalidierte Rechtecke eines Frames, merged überlappende/angrenzende
+    und zeichnet sie bei flush() einmal von oben nach unten neu.
+    Layer sind Callables paint(x, y, w, h) in Z-Reihenfolge (unten -> oben);
+    beim Flush läuft jeder Layer unter dem Clip des Dirty-Rects.
+    begin()/end() klammern Event-Bursts: flush() innerhalb wird auf end() vertagt.
+    """
+    def __init__(self, disp, max_rects=12, merge_gap=2):
+        self.d = disp
+        self._layers = []
+        self._rects = []          # [x0, y0, x1, y1] inklusive
+        self._max = max_rects
+        self._gap = merge_gap     # Abstand (px), bis zu dem Rects als angrenzend gelten
+        self._depth = 0
+        self._want_flush = False
+
+    # --- Layer ---
+    def add_layer(self, paint):
+        self._layers.append(paint)
+
+    def clear_layers(self):
+        self._layers = []
+
+    # --- Invalidation ---
+    def invalidate(self, x, y, w, h):
+        if w <= 0 or h <= 0: return
+        # auf aktuellen Display-Clip beschneiden
+        cx0, cy0, cx1, cy1 = self.d._clip
+        x0 = x if x > cx0 else cx0
+        y0 = y if y > cy0 else cy0
+        x1 = x + w - 1
+        y1 = y + h - 1
+        if x1 > cx1: x1 = cx1
+        if y1 > cy1: y1 = cy1
+        if x0 > x1 or y0 > y1: return
+        self._add(x0, y0, x1, y1)
+
+    def invalidate_all(self):
+        cx0, cy0, cx1, cy1 = self.d._clip
+        self._rects = [[cx0, cy0, cx1, cy1]]
+
+    def discard(self):
+        """Verwirft offene Rects (z.B. nach einem Vollbild-Render)."""
+        self._rects = []
+        self._want_flush = False
+
+    def pending(self):
+        return len(self._rects)
+
+    def _add(self, x0, y0, x1, y1):
+        g = self._gap
+        rects = self._rects
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(rects)):
+                r = rects[i]
+                # überlappend oder innerhalb des Gaps angrenzend -> vereinigen
+                if x0 <= r[2] + g + 1 and r[0] <= x1 + g + 1 and y0 <= r[3] + g + 1 and r[1] <= y1 + g + 1:
+                    if r[0] < x0: x0 = r[0]
+                    if r[1] < y0: y0 = r[1]
+                    if r[2] > x1: x1 = r[2]
+                    if r[3] > y1: y1 = r[3]
+                    rects.pop(i)
+                    merged = True
+                    break
+        rects.append([x0, y0, x1, y1])
+        if len(rects) > self._max:
+            # zu fragmentiert: auf Bounding-Box zusammenfassen
+            bx0 = min(r[0] for r in rects); by0 = min(r[1] for r in rects)
+            bx1 = max(r[2] for r in rects); by1 = max(r[3] for r in rects)
+            self._rects = [[bx0, by0, bx1, by1]]
+
+    # --- Frame ---
+    def begin(self):
+        self._depth += 1
+
+    def end(self):
+        if self._depth > 0:
+            self._depth -= 1
+        if self._depth == 0 and self._want_flush:
+            self.flush()
+
+    def flush(self):
+        if self._depth > 0:
+            self._want_flush = True
+            return 0
+        self._want_flush = False
+        rects = self._rects
+        if not rects: return 0
+        self._rects = []
+        rects.sort(key=lambda r: (r[1], r[0]))
+        d = self.d
+        for x0, y0, x1, y1 in rects:
+            w = x1 - x0 + 1; h = y1 - y0 + 1
+            d.push_clip(x0, y0, w, h)
+            try:
+                for paint in self._layers:
+                    try: paint(x0, y0, w, h)
+                    except Exception as e: log_warn("compositor layer error: %r" % e)
+            finally:
+                d.pop_clip()
+        return len(rects)
+
     # ---- Factory ----
 def create_display(power_on=True, **kwargs):
     if power_on:
@@ -0,0 +1,201 @@
+# hand_table.py — Vorberechnete Zeigergeometrie als Zeilenprofile (hands.bin aus host/hands_build.py)
+# Nur der erste Quadrant (0..90°) liegt in der Datei; die übrigen drei Quadranten entstehen beim
+# Lesen durch Spiegeln an der Zeigerachse (x -> 2cx - x, y -> 2cy - y), ohne Trigonometrie.
+# Datei: ">4sHHBBBB" Magic "HND2", Quadrantenlänge Stunde (qh) und Minute (qm), cx, cy,
+#        Palettenindex der Zeiger, 0; (qh+1 + qm+1 + 1) x u32 Offsets; Records.
+#        Records 0..qh: Stunde, Position p = 0..qh (Vollkreis 4*qh); danach qm+1 Minuten-Records.
+# Record (Zeilen lückenlos ab y0):
+#   y0, n                       Startzeile, Zeilenzahl (je 1 Byte)
+#   (x0, nl, nm, nr)[n]         je Zeile: erstes Pixel, nl Kantenpixel, nm deckende, nr Kantenpixel
+#   Deckungen                   alle Kantenpixel (nl + nr je Zeile) als Nibbles, High-Nibble zuerst;
+#                               0 = frei (Lücke), 1..14 = a/15 Deckung, 15 = deckend
+# HandSpans hält das ausgepackte Span-Format, mit dem Renderer und Dirty-Bands arbeiten:
+#   y0, n, cnt[n], (xa, xb, c)*   c = Palettenindex (Low-Nibble) | Deckung << 4 (0 = deckend)
+# Zur Laufzeit: ein readinto() je Zeiger in einen festen Puffer, dann Auspacken (ganzzahlig).
+try:
+    import ustruct as struct
+except Exception:
+    import struct
+try:
+    from array import array
+except Exception:
+    from uarray import array
+
+MAGIC = b"HND2"
+_HDR = 12          # ">4sHHBBBB"
+REC_MAX = 1024     # größter ausgepackter Zeiger (Minutenzeiger mit Kantenpixeln ~ 920 Bytes)
+SRC_MAX = 512      # größter gepackter Record
+
+
+class HandSpans:
+    """Ein Zeiger in einer Position; Puffer und Zeilenindex werden wiederverwendet."""
+    def __init__(self, cap=REC_MAX):
+        self.buf = bytearray(cap)
+        self.start = array("H", [0] * 257)   # Byteoffset des ersten Spans je Zeile (+ Ende)
+        self.y0 = 0
+        self.n = 0
+
+    def index(self):
+        b = self.buf; n = b[1]
+        self.y0 = b[0]; self.n = n
+        o = 2 + n; st = self.start
+        for i in range(n):
+            st[i] = o; o += b[2 + i] * 3
+        st[n] = o
+
+    def set(self, rec):
+        self.buf[:len(rec)] = rec
+        self.index()
+
+    def row(self, y):
+        """-> (a, b): Bytebereich der Spans in Zeile y (a == b: keine)."""
+        i = y - self.y0
+        if i < 0 or i >= self.n: return 0, 0
+        return self.start[i], self.start[i + 1]
+
+    def same_row(self, other, y):
+        a, b = self.row(y); c, d = other.row(y)
+        if b - a != d - c: return False
+        p = self.buf; q = other.buf
+        while a < b:
+            if p[a] != q[c]: return False
+            a += 1; c += 1
+        return True
+
+
+class HandTable:
+    """read(pos, spans): Position pos (Stunde 0..4*qh-1, danach Minute) in spans auspacken."""
+    def __init__(self, path):
+        self._f = open(path, "rb")
+        hdr = self._f.read(_HDR)
+        if len(hdr) < _HDR or hdr[0:4] != MAGIC:
+            self._f.close()
+            raise ValueError("hand table: magic")
+        self.qh, self.qm, self.cx, self.cy, self.c, _r = struct.unpack_from(">HHBBBB", hdr, 4)
+        self.count = 4 * (self.qh + self.qm)          # Positionen (720 + 60)
+        k = self.qh + self.qm + 3
+        self._off = array("I", struct.unpack(">%dI" % k, self._f.read(k * 4)))
+        self._src = bytearray(SRC_MAX)
+        self._nib = array("H", [0] * 257)             # erstes Nibble je Zeile
+
+    def _map(self, pos):
+        # Position -> (Record, Spiegeln x, Spiegeln y); Quadranten: 0..q direkt, dann y, x+y, x
+        if pos < 4 * self.qh:
+            q = self.qh; base = 0
+        else:
+            pos -= 4 * self.qh; q = self.qm; base = self.qh + 1
+        if pos <= q: return base + pos, False, False
+        if pos <= 2 * q: return base + 2 * q - pos, False, True
+        if pos <= 3 * q: return base + pos - 2 * q, True, True
+        return base + 4 * q - pos, True, False
+
+    def read(self, pos, spans):
+        rec, fx, fy = self._map(pos)
+        o = self._off[rec]; ln = self._off[rec + 1] - o
+        if ln > len(self._src): self._src = bytearray(ln)
+        self._f.seek(o)
+        self._f.readinto(memoryview(self._src)[:ln])
+        self.unpack(self._src, spans, fx, fy)
+
+    def unpack(self, s, spans, fx=False, fy=False):
+        """Record s (gepackt) -> spans (Span-Format), gespiegelt um (cx, cy)."""
+        y0 = s[0]; n = s[1]; nib = self._nib
+        k = 0
+        for i in range(n):
+            nib[i] = k; r = 2 + i * 4; k += s[r + 1] + s[r + 3]
+        e0 = 2 + n * 4                          # Beginn der Nibbles
+        out = spans.buf
+        need = 2 + n + (k + n) * 3             # je Zeile höchstens nl + nr + 1 Spans
+        if need > len(out): out = spans.buf = bytearray(need)
+        out[0] = 2 * self.cy - (y0 + n - 1) if fy else y0; out[1] = n
+        c = self.c; cx2 = 2 * self.cx
+        op = 2 + n
+        for j in range(n):
+            i = n - 1 - j if fy else j
+            r = 2 + i * 4
+            x0 = s[r]; nl = s[r + 1]; nm = s[r + 2]; nr = s[r + 3]
+            ln = nl + nm + nr; nb = nib[i]
+            xs = cx2 - (x0 + ln - 1) if fx else x0
+            cnt = 0; pa = 0; px = 0; pl = 0     # offener Span: Deckung, Start, Länge
+            t = 0
+            while t < ln:
+                u = ln - 1 - t if fx else t     # Pixel in Quellrichtung
+                if nl <= u < nl + nm:
+                    a = 15; run = nm            # deckender Mittelteil in einem Schritt
+                else:
+                    q = nb + (u if u < nl else u - nm)
+                    a = s[e0 + (q >> 1)]; a = (a & 15) if q & 1 else (a >> 4); run = 1
+                if a == pa:
+                    pl += run
+                else:
+                    if pa:
+                        out[op] = px; out[op + 1] = px + pl - 1
+                        out[op + 2] = c if pa == 15 else c | (pa << 4)
+                        op += 3; cnt += 1
+                    pa = a; px = xs + t; pl = run
+                t += run
+            if pa:
+                out[op] = px; out[op + 1] = px + pl - 1
+                out[op + 2] = c if pa == 15 else c | (pa << 4)
+                op += 3; cnt += 1
+            out[2 + j] = cnt
+        spans.index()
+
+    def close(self):
+        try: self._f.close()
+        except Exception: pass
+
+
+def pack(rows):
+    """Zeilenspans {y: [[xa, xb, c], ...]} -> Span-Format (Sekundenzeiger zur Laufzeit)."""
+    ys = [y for y in rows if 0 <= y < 240]
+    if not ys: return bytes(2)
+    y0 = min(ys); n = max(ys) - y0 + 1
+    out = bytearray(2 + n); out[0] = y0; out[1] = n
+    for i in range(n):
+        lst = rows.get(y0 + i) or ()
+        k = 0
+        for xa, xb, c in lst:
+            if xa < 0: xa = 0
+            if xb > 239: xb = 239
+            if xb < xa: continue
+            out += bytes((xa, xb, c)); k += 1
+        out[2 + i] = k
+    return bytes(out)
+
+
+def encode(rows):
+    """Zeilenspans eines Zeigers (eine Farbe) -> gepackter Record (Host-Builder)."""
+    ys = [y for y in rows if 0 <= y < 240]
+    if not ys: return bytes(2)
+    y0 = min(ys); n = max(ys) - y0 + 1
+    head = bytearray((y0, n)); nibs = []
+    for i in range(n):
+        px = {}
+        for xa, xb, c in rows.get(y0 + i) or ():
+            a = c >> 4 or 15
+            for x in range(max(xa, 0), min(xb, 239) + 1): px[x] = a
+        if not px:
+            head += bytes(4); continue
+        x0 = min(px); x1 = max(px)
+        seq = [px.get(x, 0) for x in range(x0, x1 + 1)]
+        # deckender Mittelteil = längster Lauf aus 15 (Rest: Kanten-Nibbles)
+        best = (0, 0); j = 0
+        while j < len(seq):
+            if seq[j] == 15:
+                k = j
+                while k < len(seq) and seq[k] == 15: k += 1
+                if k - j > best[1] - best[0]: best = (j, k)
+                j = k
+            else:
+                j += 1
+        nl = best[0]; nm = best[1] - best[0]; nr = len(seq) - best[1]
+        head += bytes((x0, nl, nm, nr))
+        nibs += seq[:nl] + seq[best[1]:]
+    if len(nibs) & 1: nibs.append(0)
+    return bytes(head) + bytes((nibs[i] << 4) | nibs[i + 1] for i in range(0, len(nibs), 2))
+
+
+def load(path):
+    """HandTable; fehlt hands.bin, ist das ein Build-Fehler (host/hands_build.py) – kein Rückfall."""
+    return HandTable(path)
@@ -0,0 +1,147 @@
+# ink_atlas.py — Hintergrundunabhängige Kacheln (nur "Tinte") zur Laufzeit auf den BG legen
+# Format (host/ink_convert.py): je Kachel ein Paketstrom über w*h Pixel (zeilenweise):
+#   00nnnnnn  n+1 Pixel durchsichtig (BG bleibt)
+#   01nnnnnn  n+1 Pixel einer Farbe, 2 Bytes RGB565-BE folgen
+#   1nnnnnnn  n+1 Pixel literal, (n+1)*2 Bytes folgen
+# Zusammengesetzte Kacheln liegen in einem LRU-Cache im Budget (Puffer werden recycelt);
+# pin() hält die Kacheln eines Composes gemeinsam gültig.
+try:
+    from core.logger import warn as log_warn
+except Exception:
+    def log_warn(*a, **k): pass
+
+INK_SKIP = 0x00
+INK_RUN  = 0x40
+INK_LIT  = 0x80
+
+
+class InkAtlas:
+    """
+    get(x, y, w, h, offset, length, bg, bg_stride=240) -> memoryview auf die fertige Kachel
+    (BG-Ausschnitt + Tinte). Gültig bis zum nächsten get(), also direkt blitten – außer zwischen
+    pin(True) und pin(False).
+    bg: RGB565-Vollbild (bytes/memoryview), aus dem der Ausschnitt unter der Kachel kommt;
+    bg_stride=0: bg ist eine Zeile (z.B. schwarz), die unter jede Kachelzeile gelegt wird –
+    eigener Cache-Eintrag, damit Kacheln auf BG und auf Einheitsgrund sich nicht vermischen.
+    Auf dem BG hängt die Kachel auch an (x, y): build_assets legt gleiche Tinte verschiedener Slots
+    auf einen offset, der BG darunter ist aber je Position ein anderer.
+    """
+    def __init__(self, path, budget_bytes=65_536):
+        self.path = path
+        self.budget = int(budget_bytes)
+        self._f = None
+        self._src = bytearray(0)   # Paketpuffer (wächst auf die größte Kachel)
+        self._cache = {}           # (offset, x, y) bzw. ~offset (Einheitsgrund) -> [buf, length, tick]
+        self._free = []
+        self._bytes = 0
+        self._tick = 0
+        self._pin = 0              # Ticks >= _pin sind gepinnt (0: aus)
+        self.hits = 0
+        self.misses = 0
+
+    def _file(self):
+        if self._f is None:
+            self._f = open(self.path, "rb")
+        return self._f
+
+    def _read(self, offset, length):
+        if len(self._src) < length:
+            self._src = bytearray(length)
+        mv = memoryview(self._src)[:length]
+        f = self._file()
+        f.seek(offset)
+        n = f.readinto(mv)
+        if n is not None and n < length:
+            log_warn("ink %s: short read @%d (%d/%d)" % (self.path, offset, n, length))
+        return mv
+
+    def get(self, x, y, w, h, offset, length, bg, bg_stride=240):
+        n = w * h * 2
+        k = (offset, x, y) if bg_stride else ~offset
+        self._tick += 1
+        e = self._cache.get(k)
+        if e is not None and e[1] == n:
+            e[2] = self._tick; self.hits += 1
+            return memoryview(e[0])[:n]
+        self.misses += 1
+        if e is not None:
+            del self._cache[k]; self._free.append(e[0])
+        buf = self._take(n)
+        dst = memoryview(buf)
+        # 1) BG-Ausschnitt als Grund
+        row = w * 2; bs = bg_stride * 2; so = y * bs + x * 2
+        for r in range(h):
+            dst[r * row:(r + 1) * row] = bg[so:so + row]; so += bs
+        # 2) Tinte darüber
+        src = self._read(offset, length)
+        ip = 0; op = 0
+        while ip < length and op < n:
+            c = src[ip]; ip += 1
+            if c & INK_LIT:
+                m = ((c & 0x7F) + 1) * 2
+                dst[op:op + m] = src[ip:ip + m]; ip += m; op += m
+            elif c & INK_RUN:
+                hi = src[ip]; lo = src[ip + 1]; ip += 2
+                end = op + ((c & 0x3F) + 1) * 2
+                while op < end:
+                    buf[op] = hi; buf[op + 1] = lo; op += 2
+            else:
+                op += ((c & 0x3F) + 1) * 2
+        self._cache[k] = [buf, n, self._tick]
+        return dst[:n]
+
+    def _take(self, length):
+        # best fit aus freien Puffern, sonst im Budget anlegen, sonst LRU verdrängen
+        while True:
+            best = -1; cap = 0
+            for i, b in enumerate(self._free):
+                k = len(b)
+                if k >= length and (best < 0 or k < cap):
+                    best = i; cap = k
+            if best >= 0:
+                return self._free.pop(best)
+            if self._bytes + length <= self.budget or not (self._cache or self._free):
+                self._bytes += length
+                return bytearray(length)
+            old = None; ot = 0
+            for k, v in self._cache.items():
+                if self._pin and v[2] >= self._pin: continue
+                if old is None or v[2] < ot: old = k; ot = v[2]
+            if old is not None:
+                self._free.append(self._cache.pop(old)[0])
+            elif self._free:
+                self._bytes -= len(self._free.pop(0))
+            else:
+                self._bytes += length
+                return bytearray(length)
+
+    def pin(self, on=True):
+        """
+        pin(True): ab jetzt gelieferte Kacheln werden nicht verdrängt, ihre Views bleiben gültig
+        (Budget darf dafür überlaufen); pin(False) gibt sie frei und trimmt aufs Budget.
+        """
+        if on:
+            self._pin = self._tick + 1; return
+        self._pin = 0
+        while self._bytes > self.budget and (self._cache or self._free):
+            if self._free:
+                self._bytes -= len(self._free.pop()); continue
+            old = None; ot = 0
+            for k, v in self._cache.items():
+                if old is None or v[2] < ot: old = k; ot = v[2]
+            self._bytes -= len(self._cache.pop(old)[0])
+
+    def resident(self):
+        return self._bytes + len(self._src)
+
+    def clear(self):
+        """Zusammengesetzte Kacheln verwerfen (z.B. BG gewechselt/freigegeben)."""
+        self._cache = {}; self._free = []; self._bytes = 0
+        self._src = bytearray(0)
+
+    def close(self):
+        self.clear()
+        if self._f is not None:
+            try: self._f.close()
+            except Exception: pass
+            self._f = None
@@ -0,0 +1,230 @@
+# screen_registry.py — Screens als Deskriptoren: Import + Konstruktion bei der ersten Navigation
+# ScreenRegistry verhält sich wie das dict aus load_screens() (id -> Instanz), legt einen Screen
+# aber erst beim ersten Zugriff an. Jeder geladene Screen kostet Heap: Modul + Instanz (gemessen
+# über gc beim Laden) plus das, was sein erstes on_show nachlädt (Face, Atlanten, Asset-Cache –
+# gemessen um den ersten on_show-Aufruf); ruhende Screens werden nach LRU verdrängt (Instanz + Modul aus sys.modules),
+# sobald SCREEN_CACHE_BYTES überschritten ist. Der sichtbare Screen und seine Nachbarn in der
+# main-Kette bleiben geladen. Screens, deren Import/Konstruktion scheitert, fallen wie bei
+# load_screens() aus dem Mapping heraus (in, keys(), Iteration).
+import sys, gc
+try:
+    from core.logger import warn as log_warn
+except Exception:
+    def log_warn(*a, **k): pass
+try:
+    import config
+    _CFG_BUDGET = int(getattr(config, "SCREEN_CACHE_BYTES", 98_304))
+except Exception:
+    _CFG_BUDGET = 98_304
+
+_PKG = "screens"
+
+
+def _heap():
+    # belegter Heap in Bytes: gc.mem_alloc (MicroPython), am Host tracemalloc, sofern es läuft;
+    # ohne beides keine Messung – Screens kosten dann 0 B und das Budget verdrängt nichts
+    fn = getattr(gc, "mem_alloc", None)
+    if fn: return fn()
+    try:
+        import tracemalloc
+        if tracemalloc.is_tracing(): return tracemalloc.get_traced_memory()[0]
+    except Exception:
+        pass
+    return 0
+
+
+def _screen_class(mod, sid):
+    """Screen-Klasse eines Moduls: Screen, sonst SCREEN_ID == sid, sonst Screen*/erste mit on_show."""
+    cls = getattr(mod, "Screen", None)
+    if isinstance(cls, type): return cls
+    cand = []
+    for name in dir(mod):
+        obj = getattr(mod, name)
+        if isinstance(obj, type) and hasattr(obj, "on_show"):
+            if getattr(obj, "SCREEN_ID", None) == sid: return obj
+            cand.append((not name.startswith("Screen"), name, obj))
+    if not cand: return None
+    cand.sort(key=lambda c: (c[0], c[1]))
+    return cand[0][2]
+
+
+class ScreenRegistry:
+    """
+    Mapping id -> Screen (lazy). screens[sid] lädt bei Bedarf; sid in screens, keys() und len()
+    arbeiten nur auf den Deskriptoren (ohne fehlgeschlagene Screens). items()/values() laden alles
+    (nur für Altcode gedacht).
+    """
+    def __init__(self, disp, manager, ids, chain=(), budget_bytes=_CFG_BUDGET, package=_PKG,
+                 on_create=None):
+        self.d = disp
+        self.manager = manager
+        self.budget = int(budget_bytes)
+        self.package = package
+        self.on_create = on_create        # on_create(sid, screen) nach der Konstruktion
+        self._ids = []
+        for sid in ids:
+            if sid not in self._ids: self._ids.append(sid)
+        self._chain = list(chain or ())
+        self._bad = set()     # Import/Konstruktion gescheitert
+        self._e = {}          # sid -> [screen, kosten, tick]
+        self._bytes = 0
+        self._tick = 0
+        self._current = None
+        self._anchor = None   # zuletzt gezeigter Screen der main-Kette
+        self.loads = 0
+        self.evictions = 0
+
+    # --- Mapping ---
+    def __contains__(self, sid):
+        return sid in self._ids and sid not in self._bad
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._ids) - len(self._bad)
+
+    def keys(self):
+        return [sid for sid in self._ids if sid not in self._bad]
+
+    def __getitem__(self, sid):
+        e = self._e.get(sid)
+        if e is None:
+            if sid not in self: raise KeyError(sid)
+            e = self._load(sid)
+            if e is None: raise KeyError(sid)
+        self._tick += 1; e[2] = self._tick
+        return e[0]
+
+    def get(self, sid, default=None):
+        try:
+            return self[sid]
+        except KeyError:
+            return default
+
+    def items(self):
+        out = []
+        for sid in self.keys():
+            s = self.get(sid)          # ein Zugriff je Screen (Laden + LRU)
+            if s is not None: out.append((sid, s))
+        return out
+
+    def values(self):
+        return [scr for _, scr in self.items()]
+
+    def current(self):
+        """Sichtbarer Screen (zuletzt on_show) oder None – lädt nichts."""
+        e = self._e.get(self._current)
+        return e[0] if e else None
+
+    def loaded(self):
+        """Geladene Screens (ohne zu laden) -> {sid: screen}."""
+        return dict((sid, e[0]) for sid, e in self._e.items())
+
+    # --- Laden / Verdrängen ---
+    def _modname(self, sid):
+        return "%s.%s" % (self.package, sid) if self.package else sid
+
+    def _load(self, sid):
+        gc.collect(); h0 = _heap()
+        try:
+            mod = __import__(self._modname(sid), None, None, ("*",))
+            cls = _screen_class(mod, sid)
+            if cls is None: raise ImportError("keine Screen-Klasse")
+            try:
+                scr = cls(self.d, manager=self.manager)
+            except TypeError:
+                scr = cls(self.d)
+        except Exception as e:
+            log_warn("screen %s: %r" % (sid, e))
+            self._bad.add(sid)
+            return None
+        self._hook(sid, scr)
+        if self.on_create:
+            try: self.on_create(sid, scr)
+            except Exception as e: log_warn("screen %s on_create: %r" % (sid, e))
+        gc.collect()
+        cost = _heap() - h0
+        if cost < 0: cost = 0
+        self._tick += 1
+        e = [scr, cost, self._tick]
+        self._e[sid] = e
+        self._bytes += cost
+        self.loads += 1
+        return e
+
+    def _hook(self, sid, scr):
+        # on_show meldet den sichtbaren Screen (Nachbarn/Verdrängung), ohne den Screen zu ändern;
+        # das erste on_show wird gemessen und den Kosten des Screens zugeschlagen
+        fn = getattr(scr, "on_show", None)
+        if fn is None: return
+        first = [True]
+        def on_show(*a, **kw):
+            self._shown(sid)
+            if not first[0]: return fn(*a, **kw)
+            first[0] = False
+            gc.collect(); h0 = _heap()
+            try:
+                return fn(*a, **kw)
+            finally:
+                gc.collect()
+                self._charge(sid, _heap() - h0)
+        scr.on_show = on_show
+
+    def _charge(self, sid, n):
+        e = self._e.get(sid)
+        if e is None or n <= 0: return
+        e[1] += n; self._bytes += n
+        self._fit()
+
+    def _keep(self):
+        keep = set((self._current,))
+        ch = self._chain
+        if self._anchor in ch:
+            i = ch.index(self._anchor)
+            keep.add(self._anchor)
+            keep.add(ch[i - 1]); keep.add(ch[(i + 1) % len(ch)])
+        return keep
+
+    def _shown(self, sid):
+        self._current = sid
+        if sid in self._chain: self._anchor = sid
+        e = self._e.get(sid)
+        if e is not None:
+            self._tick += 1; e[2] = self._tick
+        self._fit()
+
+    def _fit(self):
+        """Ruhende Screens (nicht sichtbar, keine main-Nachbarn) nach LRU verdrängen, bis das Budget passt."""
+        if self._bytes <= self.budget: return
+        keep = self._keep(); n = 0
+        while self._bytes > self.budget:
+            old = None; ot = 0
+            for sid, e in self._e.items():
+                if sid not in keep and (old is None or e[2] < ot): old = sid; ot = e[2]
+            if old is None: break
+            self.evict(old, collect=False); n += 1
+        if n: gc.collect()
+
+    def evict(self, sid, collect=True):
+        """Instanz und Modul freigeben; der nächste Zugriff lädt den Screen neu."""
+        if sid == self._current: return False
+        e = self._e.pop(sid, None)
+        if e is None: return False
+        self._bytes -= e[1]
+        name = self._modname(sid)
+        sys.modules.pop(name, None)
+        pkg = sys.modules.get(self.package) if self.package else None
+        if pkg is not None:
+            try: delattr(pkg, sid)
+            except Exception: pass
+        self.evictions += 1
+        if collect: gc.collect()
+        return True
+
+    def resident(self):
+        return self._bytes
+
+    def stats(self):
+        return {"bytes": self._bytes, "budget": self.budget, "loaded": len(self._e),
+                "screens": len(self), "failed": len(self._bad), "loads": self.loads, "evictions": self.evictions}
@@ -1,4 +1,15 @@
 # main.py – RTC-Sync (PCF8563), vchain-Navigation, EventBus-only Backlight/Sleep
+# Patched v0.9.7:
+# - "time/frame" nur, solange der sichtbare Screen Frames will (wants_frames(): offener Flush,
+#   Sekundenzeiger-Sweep); sonst ruht der 30-Hz-Takt
+# Patched v0.9.6:
+# - Screens lazy (lib/screen_registry): Import + Konstruktion erst bei der ersten Navigation, ruhende
+#   Screens unter SCREEN_CACHE_BYTES nach LRU verdrängt (main-Nachbarn bleiben); SPI-Stats-Tag beim Laden
+# - Start-Screen über screens.get(): scheitert er beim Laden, kommt der nächste Kandidat (kein KeyError)
+# Patched v0.9.5:
+# - Always-on (AOD_ON_DIM): DIM publiziert "display/aod" {"on": True} (Uhr-Screens schalten Idle/
+#   Partial, nur Minuten) und setzt AOD_BACKLIGHT; Aufwachen publiziert {"on": False} vor dem Hellschalten
+# - Always-on nur, wenn der sichtbare Screen es kann (supports_aod()); sonst normales DIM (BACKLIGHT_DIM)
 # Patched v0.9.4:
 # - Manager erzeugung verwendet jetzt das modul-level eventbus (gewrappt von StatusStore)
 # - Dadurch akzeptieren alle publishes ttl_ms und keine TypeError mehr
@@ -16,7 +27,8 @@ from core.power_manager import PowerManager
 from touch import Touch
 # >>> WICHTIG: wir importieren das modul-level eventbus und binden es später
 import core.eventbus as eventbus_mod
-from core.nav import Nav, load_screens
+from core.nav import Nav
+from lib.screen_registry import ScreenRegistry
 from core.screen_manager import ScreenManager
 
 # --- WIFI: Neu
@@ -87,6 +99,17 @@ def _sync_time_from_pcf():
         log_warn("RTC sync failed: %r" % e)
 
 
+def _tag_on_show(disp, sid, scr):
+    """SPI-Statistik: ab on_show() wird der Verkehr dem Screen sid zugerechnet."""
+    fn = getattr(scr, "on_show", None)
+    if fn is None:
+        return
+    def on_show(*a, **kw):
+        disp.stats_tag(sid)
+        return fn(*a, **kw)
+    scr.on_show = on_show
+
+
 def boot():
     # --- Logging-Level setzen ---
     try:
@@ -198,6 +221,34 @@ def boot():
     if bright_lvl < 0: bright_lvl = 0
     if bright_lvl > 255: bright_lvl = 255
 
+    # --- Always-on statt reinem Dimmen (Uhr-Screens) ---
+    aod_on = bool(getattr(config, "AOD_ON_DIM", False))
+    try:
+        aod_lvl = int(getattr(config, "AOD_BACKLIGHT", 24))
+    except Exception:
+        aod_lvl = 24
+    if aod_lvl < 0: aod_lvl = 0
+    if aod_lvl > 255: aod_lvl = 255
+    aod_active = False
+    screens = None           # ScreenRegistry (siehe Navigation), liefert den sichtbaren Screen
+
+    def _aod_capable():
+        scr = screens.current() if screens is not None else None
+        fn = getattr(scr, "supports_aod", None)
+        try:
+            return bool(fn and fn())
+        except Exception:
+            return False
+
+    def _wants_frames():
+        # nur Screens mit wants_frames() abonnieren "time/frame"; ohne Screen kein Takt
+        scr = screens.current() if screens is not None else None
+        fn = getattr(scr, "wants_frames", None)
+        try:
+            return bool(fn and fn())
+        except Exception:
+            return False
+
     # --- Backlight-Backend-Erkennung (Display-only) ---
     _bl_backend = None
     for obj, names in (
@@ -262,6 +313,15 @@ def boot():
     except Exception:
         pass
 
+    def _aod_set(on: bool):
+        nonlocal aod_active
+        if on == aod_active: return
+        aod_active = on
+        try:
+            eventbus_mod.publish("display/aod", {"on": on})
+        except Exception as e:
+            log_warn(f"[AOD] publish failed: {e!r}")
+
     # --- Zentrale Handler-Logik (Topic kommt jetzt aus dem Wrapper) ---
     def _handle(topic: str, payload=None):
         try:
@@ -272,17 +332,23 @@ def boot():
 
         if topic in ("power/active", "display/wake", "sys/wake"):
             _panel_sleep(False)
+            _aod_set(False)          # Face erst in Vollfarbe, dann hell
             _bl_set(bright_lvl)
             if hasattr(pm, "kick"):
                 try: pm.kick()
                 except Exception: pass
 
         elif topic in ("power/will_dim", "display/dim"):
-            _bl_set(dim_lvl)
+            probe = isinstance(payload, dict) and payload.get("probe")
+            if aod_on and not probe and _aod_capable():
+                _aod_set(True)
+                _bl_set(aod_lvl)
+            else:
+                _bl_set(dim_lvl)
 
         elif topic == "power/will_sleep":
             _bl_set(0)
-            _panel_sleep(True)
+            _panel_sleep(True)       # Always-on bleibt bis zum Aufwachen gesetzt
 
     def _bind(topic):
         return lambda ev=None, **kw: _handle(topic, ev if ev is not None else kw if kw else None)
@@ -349,17 +415,31 @@ def boot():
             pass
 
     all_ids = list(nav.all_ids())
-    screens = load_screens(disp, sm, all_ids)
+    # Deskriptoren statt load_screens(): nur der Start-Screen wird vor dem ersten Frame geladen
+    screens = ScreenRegistry(disp, sm, all_ids, chain=getattr(nav, "main", None) or ())
     sm.register(screens)
 
-    if nav.start in screens:
-        sm.show(nav.start)
-    else:
-        first_main = nav.main[0] if nav.main else None
-        if first_main and first_main in screens:
-            sm.show(first_main)
-        elif screens:
-            sm.show(next(iter(screens.keys())))
+    # --- SPI-Statistik (opt-in, DISPLAY_STATS_MS > 0) ---
+    try:
+        stats_ms = int(getattr(config, "DISPLAY_STATS_MS", 0) or 0)
+    except Exception:
+        stats_ms = 0
+    if stats_ms > 0:
+        try:
+            disp.stats_enable(True)
+            # Screens entstehen erst bei der Navigation: Tag beim Konstruieren anhängen
+            screens.on_create = lambda sid, scr: _tag_on_show(disp, sid, scr)
+        except Exception as e:
+            log_warn("display stats init failed: %r" % e)
+            stats_ms = 0
+
+    # Start-Screen über get(): lädt ihn; scheitert Import/Konstruktion, fällt er aus screens heraus
+    # und der nächste Kandidat kommt dran (wie früher load_screens() kaputte Screens übersprang)
+    first_main = nav.main[0] if nav.main else None
+    for sid in [nav.start, first_main] + screens.keys():
+        if sid and screens.get(sid) is not None:
+            sm.show(sid)
+            break
 
     # --- Jetzt: LoRa erst NACH UI/STAGE hochziehen; Konstruktion kann blockieren, also safe try/except
     try:
@@ -391,6 +471,12 @@ def boot():
     last_poll = time.ticks_ms()
     last_batt = time.ticks_ms()
     batt_interval = int(getattr(config, "BATTERY_UPDATE_MS", 15000))
+    last_stats = time.ticks_ms()
+    # Frame-Takt für flüssige Animationen (z.B. Sekundenzeiger); nur solange der Screen ihn will
+    frame_hz = int(getattr(config, "UI_FRAME_HZ", 30))
+    frame_ms = 1000 // frame_hz if frame_hz > 0 else 0
+    frame_evt = {"ms": 0}
+    last_frame = time.ticks_ms()
 
     log_info("Boot done. Enter main loop.")
     while True:
@@ -437,6 +523,15 @@ def boot():
             except Exception:
                 pass
 
+        if frame_ms and time.ticks_diff(now_ms, last_frame) >= frame_ms:
+            last_frame = now_ms
+            if _wants_frames():
+                frame_evt["ms"] = now_ms
+                try:
+                    eventbus_mod.publish("time/frame", frame_evt)
+                except Exception:
+                    pass
+
         # --- Battery/USB periodisch aktualisieren (nur echte Keys, keine Fallbacks)
         if time.ticks_diff(now_ms, last_batt) >= batt_interval:
             last_batt = now_ms
@@ -454,6 +549,16 @@ def boot():
             except Exception as e:
                 log_warn("battery/usb poll failed: %r" % e)
 
+        # --- SPI-Statistik periodisch veröffentlichen und zurücksetzen
+        if stats_ms and time.ticks_diff(now_ms, last_stats) >= stats_ms:
+            last_stats = now_ms
+            try:
+                eventbus_mod.publish("display/spi_stats", {"period_ms": stats_ms,
+                                                           "tags": disp.stats_snapshot()})
+                disp.stats_reset()
+            except Exception as e:
+                log_warn("display stats publish failed: %r" % e)
+
         time.sleep_ms(10)
 
 
@@ -1,5 +1,9 @@
-# screens/charge.py — v0.2.4
+# screens/charge.py — v0.3.1
+# - wants_frames(): main.py publiziert "time/frame" nur, solange der Face einen Flush offen hat
+# - Setter des Faces invalidieren nur die geänderten Rects; kein render_full() mehr je Akku-/USB-Event
+# - "time/frame" → face.tick() (Flush im Frame-Takt), Face-Methoden einmal aufgelöst (dispatch_table)
 import sys, time, config
+from ui.face_runtime import dispatch_table
 
 try:
     from core.logger import info as log_info, warn as log_warn, debug as log_debug
@@ -55,8 +59,8 @@ class ScreenCharge:
     def __init__(self, d=None, manager=None, eventbus=None, **kw):
         self.d=d; self.manager=manager
         self.eb=self._resolve_bus(eventbus, manager)
-        self.face=None; self._visible=False
-        self._tok={'batt':None,'usb':None,'scr':None,'redraw':None}
+        self.face=None; self._fx={}; self._visible=False
+        self._tok={'batt':None,'usb':None,'frame':None,'scr':None,'redraw':None}
         if self.eb:
             def _cb_scr(*a, **k):
                 tgt=None
@@ -109,6 +113,7 @@ class ScreenCharge:
         if not face_cls: raise ImportError('Face-Klasse nicht gefunden.')
         inst=face_cls(self.d)
         self.face=inst
+        self._fx=dispatch_table(inst)
         try: setattr(self.face,'manager',self.manager)
         except Exception: pass
         try:
@@ -124,9 +129,15 @@ class ScreenCharge:
     def on_show(self, *a, **k):
         self._visible=True
         if self.face is None: self._load_face()
-        self._prime()
-        try: self.face.render_full()
-        except Exception as e: log_warn('charge face full render error: %r', e)
+        # Priming nur als Zustand: render_full() deckt die offenen Rects ab (ein Fenster)
+        comp=getattr(self.face,'comp',None)
+        if comp: comp.begin()
+        try:
+            self._prime()
+            try: self._fx['render_full']()
+            except Exception as e: log_warn('charge face full render error: %r', e)
+        finally:
+            if comp: comp.end()
         if self.eb:
             def _x(*args, **kw):
                 if args:
@@ -139,8 +150,11 @@ class ScreenCharge:
                 return None
             def _b(*args, **kw): p=_x(*args, **kw) or {}; self._on_battery(p)
             def _u(*args, **kw): p=_x(*args, **kw) or {}; self._on_usb(p)
+            def _f(*args, **kw): p=_x(*args, **kw) or {}; self._fx['tick'](p.get('ms'))
             self._tok['batt']=self.eb.subscribe('status/battery', _b)
             self._tok['usb'] =self.eb.subscribe('status/usb', _u)
+            if 'tick' in self._fx:
+                self._tok['frame']=self.eb.subscribe('time/frame', _f)
 
     def _prime(self):
         s=self._status_store()
@@ -150,8 +164,8 @@ class ScreenCharge:
             usb =s.get('status/usb',     fresh_only=False) or {}
         except Exception:
             batt={}; usb={}
-        self._on_battery(batt, draw=False)
-        self._on_usb(usb, draw=False)
+        self._on_battery(batt)
+        self._on_usb(usb)
 
     def on_hide(self, *a, **k):
         self._visible=False
@@ -161,13 +175,25 @@ class ScreenCharge:
                     try: self.eb.unsubscribe(t)
                     except Exception: pass
                     self._tok[k]=None
+        # Face-Puffer an den gemeinsamen Asset-Cache zurückgeben (lädt beim nächsten Render neu)
+        rel=self._fx.get('release')
+        if rel:
+            try: rel()
+            except Exception as e: log_warn('charge face release_assets error: %r', e)
+
+    def wants_frames(self):
+        # Frame-Takt nur bei offenem Flush/Burst des Faces (FaceBase.wants_frames)
+        if not self._visible or 'tick' not in self._fx: return False
+        fn=self._fx.get('wants')
+        try: return bool(fn()) if fn else True
+        except Exception: return True
 
     def _on_redraw(self):
         if not self._visible or not self.face: return
-        try: self.face.render_full()
+        try: self._fx['render_full']()
         except Exception as e: log_warn('charge face redraw error: %r', e)
 
-    def _on_battery(self, p, draw=True):
+    def _on_battery(self, p):
         try:
             pct = p.get('percent', None)
             mv  = p.get('vbat_mV', None)  # keine Fallbacks
@@ -176,17 +202,15 @@ class ScreenCharge:
             pct=mv=chg=None
         try:
             self.face.set_battery(percent=pct, vbat_mv=mv, charging=chg)
-            if draw: self.face.render_full()
         except Exception as e: log_warn('charge _on_battery error: %r', e)
 
-    def _on_usb(self, p, draw=True):
+    def _on_usb(self, p):
         try:
             st = p.get('state', None)  # erwartet: 'charging' | 'data' | 'on' | 'off'
         except Exception:
             st=None
         try:
             self.face.set_usb(state=st)
-            if draw: self.face.render_full()
         except Exception as e: log_warn('charge _on_usb error: %r', e)
 
 class Screen(ScreenCharge): pass
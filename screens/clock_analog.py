@@ -1,11 +1,22 @@
-# screens/clock_analog.py — v0.4.8
-# Fixes:
+# screens/clock_analog.py — v0.7.2
+# - wants_frames(): main.py publiziert "time/frame" nur bei Sweep (> 1 Hz) oder offenem Flush
+# - supports_aod(): main.py wählt Always-on beim DIM nur, wenn der Face es kann
+# - Always-on ("display/aod"): Face auf Idle/Partial-Zeigerband (set_aod/render_aod), Sekunden-
+#   und Frame-Abos ruhen bis zum Aufwachen, dann wieder render_full() mit Sekundenzeiger
+# - Face-Methoden einmal beim Laden aufgelöst (ui.face_runtime.dispatch_table), kein hasattr je Tick
+# - "time/frame" → face.tick() (Flush im Frame-Takt + Sekundenzeiger), ältere Faces: render_frame()
+# - Kein Nachzeichnen nach render_full() mehr (render() mit gleicher Minute war ein Leerlauf)
+# Changes v0.5.0:
+# - "time/frame" → face.render_frame() (Sekundenzeiger-Zwischenschritte, Rate regelt der Face)
+# - Priming/Replay als ein Compositor-Frame (face.comp begin/end → ein Flush)
+# Fixes v0.4.8:
 # - Priming aus StatusStore vor erstem Draw (fresh_only=False)
 # - Sofortiges Icon-Replay nach Priming (hartes Zeichnen/Flush)
 # - Kein _defer_icon_draw mehr (kann Zeichnen verhindern, je nach Face)
 # - Robustere Logs zum Debuggen
 import sys, time
 import config
+from ui.face_runtime import dispatch_table
 
 try:
     from core.logger import info as log_info, warn as log_warn, debug as log_debug
@@ -74,16 +85,19 @@ class ScreenClockAnalog:
         self.eb = self._resolve_bus(eventbus, manager)
 
         self.face = None
+        self._fx = {}           # dispatch_table(face): Schlüssel -> gebundene Methode
         self._face_id = None
         self._visible = False
         self._last_hms = (-1, -1, -1)
         self._primed = False
+        self._aod = False
+        self._sec_subs = ()     # (key, topic, cb) der Sekunden-/Frame-Abos (ruhen im Always-on)
 
         self._tok = {
-            "min": None, "sec": None, "tick": None,
+            "min": None, "sec": None, "tick": None, "frame": None,
             "wifi": None, "bt": None, "lora": None,
             "batt": None, "usb": None, "notif": None, "notif2": None,
-            "scr": None,
+            "scr": None, "aod": None,
         }
 
         # Bereits jetzt auf "screen/changed" hören (kommt kurz nach on_show)
@@ -198,35 +212,50 @@ class ScreenClockAnalog:
             log_warn("clock_analog: store.get failed: %r", e)
             wifi_p = bt_p = batt_p = usb_p = notif_p = None
 
-        # per Handler ausführen → zeichnet nur Dirty-Rects
-        if wifi_p  is not None: self._on_wifi(wifi_p)
-        if bt_p    is not None: self._on_bt(bt_p)
-        if batt_p  is not None: self._on_batt(batt_p)
-        if usb_p   is not None: self._on_usb(usb_p)
-        if notif_p is not None: self._on_notif(notif_p)
+        # per Handler ausführen → sammelt nur Dirty-Rects, ein Flush am Ende
+        comp = self._face_comp()
+        if comp: comp.begin()
+        try:
+            if wifi_p  is not None: self._on_wifi(wifi_p)
+            if bt_p    is not None: self._on_bt(bt_p)
+            if batt_p  is not None: self._on_batt(batt_p)
+            if usb_p   is not None: self._on_usb(usb_p)
+            if notif_p is not None: self._on_notif(notif_p)
+        finally:
+            if comp: comp.end()
 
         return True
 
+    def _face_comp(self):
+        """Compositor des Faces (falls vorhanden) für begin()/end()-Klammern."""
+        return getattr(self.face, "comp", None) if self.face else None
+
     def _replay_icons(self):
         """Erzwinge sichtbares Zeichnen der bereits gesetzten Icon-States."""
+        comp = self._face_comp()
+        if comp: comp.begin()
         try:
             groups = ("wifi","bt","battery","charge","msg","lora","usb")
-            if hasattr(self.face, "set_icon"):
+            fn = self._fx.get("icon")
+            if fn is not None:
+                icons = getattr(self.face, "icons", None)
                 for g in groups:
-                    s = None
-                    if hasattr(self.face, "icons") and isinstance(self.face.icons, dict):
-                        s = self.face.icons.get(g)
+                    s = icons.get(g) if isinstance(icons, dict) else None
                     if s is not None:
-                        try: self.face.set_icon(g, s)
+                        try: fn(g, s)
                         except Exception: pass
-            if hasattr(self.face, "request_draw"):
-                self.face.request_draw()
+            fn = self._fx.get("draw")
+            if fn is not None:
+                fn()
             else:
                 t = time.localtime()
-                if hasattr(self.face, "render"):
-                    self.face.render(int(t[3]), int(t[4]), int(t[5]))
+                fn = self._fx.get("render")
+                if fn is not None:
+                    fn(int(t[3]), int(t[4]), int(t[5]))
         except Exception:
             pass
+        finally:
+            if comp: comp.end()
 
     # ---------- drawing helpers ----------
 
@@ -302,7 +331,10 @@ class ScreenClockAnalog:
             br = getattr(self.d, "blit_rgb565", None)
             if br is None: raise
             inst = face_cls(self.d, br)
+        if self.face is not None and self.face is not inst:
+            self._release_assets()
         self.face = inst
+        self._fx = dispatch_table(inst)
         self._face_id = face_id
 
         try: setattr(self.face, "manager", self.manager)
@@ -334,26 +366,29 @@ class ScreenClockAnalog:
         if not draws_full_bg:
             self._hard_clear()
 
-        # 3) Priming aus Store (vor dem ersten sichtbaren Render)
-        primed = self._prime_icons_from_store()
-        log_debug("clock_analog: primed=%s", primed)
-
-        # 4) Erstes Render (BG + Hände), Hände direkt „ziehen“
-        hh, mm, ss = self._now_hms()
+        # 3..5 als ein Compositor-Frame: Icon-Rects werden erst am Ende geflusht
+        comp = self._face_comp()
+        if comp: comp.begin()
         try:
-            if hasattr(self.face, "render_full"):
-                self.face.render_full(hh, mm, ss)
-            elif hasattr(self.face, "render"):
-                self.face.render(hh, mm, ss)
-            if hasattr(self.face, "render"):
-                self.face.render(hh, mm, ss)
-        except Exception as e:
-            try: log_warn("face initial draw error: %r", e)
-            except Exception: pass
-        self._last_hms = (hh, mm, ss)
+            # 3) Priming aus Store (vor dem ersten sichtbaren Render)
+            primed = self._prime_icons_from_store()
+            log_debug("clock_analog: primed=%s", primed)
 
-        # 5) Icons aktiv sichtbar machen
-        self._replay_icons()
+            # 4) Erstes Render (BG + Hände), Hände direkt „ziehen“
+            hh, mm, ss = self._now_hms()
+            fn = self._fx.get("render_full") or self._fx.get("render")
+            try:
+                if fn is not None:
+                    fn(hh, mm, ss)
+            except Exception as e:
+                try: log_warn("face initial draw error: %r", e)
+                except Exception: pass
+            self._last_hms = (hh, mm, ss)
+
+            # 5) Icons aktiv sichtbar machen
+            self._replay_icons()
+        finally:
+            if comp: comp.end()
 
         # 6) Live-Events abonnieren
         def _extract_payload(*args, **kw):
@@ -369,6 +404,7 @@ class ScreenClockAnalog:
         def _cb_min(*args, **kw):   self._on_min(_extract_payload(*args, **kw) or {})
         def _cb_sec(*args, **kw):   self._on_sec(_extract_payload(*args, **kw) or {})
         def _cb_tick(*args, **kw):  self._on_tick_1hz({})
+        def _cb_frame(*args, **kw): self._on_frame(_extract_payload(*args, **kw) or {})
 
         def _cb_bt(*args, **kw):    self._on_bt(_extract_payload(*args, **kw) or {})
         def _cb_wifi(*args, **kw):  self._on_wifi(_extract_payload(*args, **kw) or {})
@@ -376,11 +412,17 @@ class ScreenClockAnalog:
         def _cb_batt(*args, **kw):  self._on_batt(_extract_payload(*args, **kw) or {})
         def _cb_usb(*args, **kw):   self._on_usb(_extract_payload(*args, **kw) or {})
         def _cb_notif(*args, **kw): self._on_notif(_extract_payload(*args, **kw) or {})
+        def _cb_aod(*args, **kw):   self._on_aod(_extract_payload(*args, **kw) or {})
 
         if self.eb:
             self._tok["min"]   = self.eb.subscribe("time/min", _cb_min)
-            self._tok["sec"]   = self.eb.subscribe("time/sec", _cb_sec)
-            self._tok["tick"]  = self.eb.subscribe("time/sec", _cb_tick)
+            subs = [("sec", "time/sec", _cb_sec), ("tick", "time/sec", _cb_tick)]
+            # Frame-Takt: tick() (FaceBase) oder Sekundenzeiger-Zwischenschritte (render_frame)
+            if "tick" in self._fx or "frame" in self._fx:
+                subs.append(("frame", "time/frame", _cb_frame))
+            self._sec_subs = tuple(subs)
+            self._suspend_seconds(False)
+            self._tok["aod"]   = self.eb.subscribe("display/aod",          _cb_aod)
 
             self._tok["wifi"]  = self.eb.subscribe("status/wifi",          _cb_wifi)
             self._tok["bt"]    = self.eb.subscribe("status/bt",            _cb_bt)
@@ -395,14 +437,27 @@ class ScreenClockAnalog:
 
         self._primed = True
 
+    def _release_assets(self):
+        # Face-Puffer an den gemeinsamen Asset-Cache zurückgeben (Face-Objekt bleibt, lädt beim nächsten Render neu)
+        rel = self._fx.get("release")
+        if rel:
+            try: rel()
+            except Exception as e: log_warn("face release_assets error: %r", e)
+
     def on_hide(self, *a, **kw):
         self._visible = False
+        if self._aod:
+            # Panel zurück in den Normalmodus, der nächste Screen zeichnet selbst
+            self._aod = False
+            try: self._fx["aod"](False)
+            except Exception: pass
         if self.eb:
             for k, tok in list(self._tok.items()):
                 if tok is not None:
                     try: self.eb.unsubscribe(tok)
                     except Exception: pass
                     self._tok[k] = None
+        self._release_assets()
 
     # ---------- rendering ----------
 
@@ -413,34 +468,29 @@ class ScreenClockAnalog:
             self._hard_clear()
         hh, mm, ss = self._now_hms()
         try:
-            self.face.render_full(hh, mm, ss)
+            self._fx["render_full"](hh, mm, ss)
         except Exception as e:
             log_warn("face.render_full error: %r", e)
-        try:
-            if hasattr(self.face, "render"):
-                self.face.render(hh, mm, ss)
-        except Exception:
-            pass
         self._last_hms = (hh, mm, ss)
 
     def render(self, *a, **kw):
         if not self._visible: return
         hh, mm, ss = self._now_hms()
         try:
-            self.face.render(hh, mm, ss)
+            self._fx["render"](hh, mm, ss)
         except Exception as e:
             log_warn("face.render error: %r", e)
         self._last_hms = (hh, mm, ss)
 
     # ---------- event forwarding ----------
 
-    def _forward(self, meth, payload):
-        fn = getattr(self.face, meth, None)
-        if callable(fn):
+    def _forward(self, key, payload):
+        fn = self._fx.get(key)
+        if fn is not None:
             try:
                 fn(payload); return True
             except Exception as e:
-                log_warn("%s error: %r", meth, e)
+                log_warn("face %s error: %r", key, e)
                 return False
         return False
 
@@ -448,7 +498,7 @@ class ScreenClockAnalog:
 
     def _on_min(self, payload=None):
         if not self._visible: return
-        self._forward("on_time", payload or {})
+        self._forward("time", payload or {})
         try:
             hh = int(payload.get("hh")) if isinstance(payload, dict) else None
             mm = int(payload.get("mm")) if isinstance(payload, dict) else None
@@ -458,7 +508,8 @@ class ScreenClockAnalog:
         if hh is None or mm is None:
             hh, mm, ss = self._now_hms()
         try:
-            self.face.render(hh, mm, ss)
+            if self._aod: self._fx["render_aod"](hh, mm)
+            else: self._fx["render"](hh, mm, ss)
         except Exception as e:
             log_warn("face.render(min) error: %r", e)
         self._last_hms = (hh, mm, ss)
@@ -468,16 +519,60 @@ class ScreenClockAnalog:
         try:
             t = time.localtime()
             hh, mm, ss = int(t[3]), int(t[4]), int(t[5])
-            if hasattr(self.face, "render_sec") and callable(getattr(self.face, "render_sec")):
-                self.face.render_sec(hh, mm, ss)
-            elif hasattr(self.face, "render_seconds") and callable(getattr(self.face, "render_seconds")):
-                self.face.render_seconds(hh, mm, ss)
-            else:
-                self.face.render(hh, mm, ss)
+            (self._fx.get("sec") or self._fx["render"])(hh, mm, ss)
             self._last_hms = (hh, mm, ss)
         except Exception:
             pass
 
+    def _on_frame(self, payload=None):
+        if not self._visible: return
+        try:
+            (self._fx.get("tick") or self._fx["frame"])((payload or {}).get("ms"))
+        except Exception:
+            pass
+
+    def wants_frames(self):
+        # Frame-Takt nur bei Sweep oder offenem Flush (Face.wants_frames), nicht im Always-on;
+        # ältere Faces ohne wants_frames() bekommen ihn wie bisher immer
+        if not self._visible or self._aod: return False
+        if "tick" not in self._fx and "frame" not in self._fx: return False
+        fn = self._fx.get("wants")
+        try: return bool(fn()) if fn else True
+        except Exception: return True
+
+    # ---------- always-on ----------
+
+    def supports_aod(self):
+        # Always-on braucht einen Face mit set_aod() + render_aod() (FaceBase)
+        return self._visible and "aod" in self._fx and "render_aod" in self._fx
+
+    def _suspend_seconds(self, suspend):
+        # Always-on: keine Sekunden-/Frame-Events (kein Wecken je Sekunde), beim Aufwachen neu abonnieren
+        if not self.eb: return
+        for k, topic, cb in self._sec_subs:
+            if suspend:
+                if self._tok[k] is not None:
+                    try: self.eb.unsubscribe(self._tok[k])
+                    except Exception: pass
+                    self._tok[k] = None
+            elif self._tok[k] is None:
+                self._tok[k] = self.eb.subscribe(topic, cb)
+
+    def _on_aod(self, payload=None):
+        on = bool((payload or {}).get("on"))
+        if not self._visible or on == self._aod: return
+        fn = self._fx.get("aod")
+        if fn is None or (on and "render_aod" not in self._fx): return
+        self._aod = on
+        hh, mm, ss = self._now_hms()
+        if on: self._suspend_seconds(True)
+        try:
+            fn(on, hh, mm, ss)
+        except Exception as e:
+            log_warn("face aod error: %r", e)
+        if not on: self._suspend_seconds(False)
+        self._last_hms = (hh, mm, ss)
+
     def _on_tick_1hz(self, payload=None):
         if not self._visible or not self._primed: return
         s = self._status_store()
@@ -502,62 +597,63 @@ class ScreenClockAnalog:
     # ---- icon helpers ----
 
     def _invalidate_icon_rect(self, group):
-        face = self.face
+        # FaceBase-Faces invalidieren in set_icon() selbst (nur bei Zustandswechsel)
+        if "tick" in self._fx: return True
         try:
-            rects = getattr(face, "ICON_RECTS", None)
+            rects = getattr(self.face, "ICON_RECTS", None)
             if isinstance(rects, dict) and group in rects:
                 x,y,w,h = rects[group]
-                if hasattr(face, "invalidate_region"):
-                    face.invalidate_region(x,y,w,h)
-                if hasattr(face, "request_draw"):
-                    face.request_draw()
+                fn = self._fx.get("region")
+                if fn is not None: fn(x,y,w,h)
+                fn = self._fx.get("draw")
+                if fn is not None: fn()
                 return True
         except Exception:
             pass
         return False
 
     def _set_icon(self, group, state):
-        fn = getattr(self.face, "set_icon", None)
-        if callable(fn):
+        fn = self._fx.get("icon")
+        if fn is not None:
             try: fn(group, state)
             except Exception: pass
         if not self._invalidate_icon_rect(group):
             try:
                 t = time.localtime()
-                self.face.render(int(t[3]), int(t[4]), int(t[5]))
+                self._fx["render"](int(t[3]), int(t[4]), int(t[5]))
             except Exception:
                 pass
 
     # ---- domain handlers (live) ----
 
     def _on_wifi(self, payload=None):
-        if self._forward("on_wifi", payload): return
+        if self._forward("wifi", payload): return
         self._set_icon("wifi", self._map_wifi(payload))
 
     def _on_bt(self, payload=None):
-        if self._forward("on_bt", payload): return
+        if self._forward("bt", payload): return
         self._set_icon("bt", self._map_bt(payload))
 
     def _on_lora(self, payload=None):
-        if self._forward("on_lora", payload): return
+        if self._forward("lora", payload): return
         s = (payload or {}).get("state", "off")
         state = "error" if s == "error" else ("on" if s in ("on","link","tx","rx") else "off")
         self._set_icon("lora", state)
 
     def _on_usb(self, payload=None):
-        if self._forward("on_usb", payload): return
+        if self._forward("usb", payload): return
         s = (payload or {}).get("state", "disconnected")
         self._set_icon("charge", "on" if s == "charging" else "off")
 
     def _on_batt(self, payload=None):
-        if self._forward("on_battery", payload): return
+        if self._forward("battery", payload): return
         lvl = self._map_battery_level(payload)
         self._set_icon("battery", lvl)
         ch = "on" if (isinstance(payload, dict) and payload.get("charging")) else "off"
         self._set_icon("charge", ch)
 
     def _on_notif(self, payload=None):
-        if self._forward("on_notif", payload): return
+        if self._forward("notif", payload): return
         self._set_icon("msg", self._map_msg(payload))
 
 
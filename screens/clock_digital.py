@@ -1,10 +1,19 @@
-# screens/clock_digital.py — v0.3.9
-# Changes vs v0.3.8:
+# screens/clock_digital.py — v0.5.2
+# - wants_frames(): main.py publiziert "time/frame" nur, solange der Face einen Flush offen hat
+# - supports_aod(): main.py wählt Always-on beim DIM nur, wenn der Face es kann
+# - Always-on ("display/aod"): Face auf Idle/Partial-Minutenlayout (set_aod/render_aod),
+#   Sekunden-/Frame-Abos ruhen bis zum Aufwachen, dann wieder render_full() in Vollfarbe
+# - Face-Methoden einmal beim Laden aufgelöst (ui.face_runtime.dispatch_table), kein getattr je Event
+# - "time/frame" → face.tick(): Icon-/Ziffern-Invalidierungen werden im Frame-Takt geflusht
+# Changes v0.3.10:
+# - StatusStore-Prime als ein Compositor-Frame (face.comp begin/end → ein Flush)
+# Changes v0.3.9 vs v0.3.8:
 # - EventBus-Kompat: Wrapper für ALLE Subscriptions (inkl. time/min, time/sec)
 # - _BusAdapter speichert (topic, cb, token); unsubscribe() funktioniert für v1.2 (topic,cb) und v1.3 (token)
 # - StatusStore-Prime, 1 Hz Expiry, Forwarding & Icon-Mapping unverändert
 import sys, time
 import config
+from ui.face_runtime import dispatch_table
 
 try:
     from core.logger import info as log_info, warn as log_warn, debug as log_debug
@@ -87,14 +96,18 @@ class ScreenClockDigital:
         self.eb = self._resolve_bus(eventbus, manager)
 
         self.face = None
+        self._fx = {}           # dispatch_table(face): Schlüssel -> gebundene Methode
         self._face_id = None
         self._visible = False
         self._last_hm = (-1, -1)
+        self._aod = False
+        self._sec_subs = ()     # (key, topic, cb) der Sekunden-/Frame-Abos (ruhen im Always-on)
 
         self._tok = {
-            "min": None, "sec": None, "tick": None,
+            "min": None, "sec": None, "tick": None, "frame": None,
             "wifi": None, "bt": None, "lora": None,
             "batt": None, "usb": None, "notif": None, "notif2": None,
+            "aod": None,
         }
 
     # ---------- bus/status helpers ----------
@@ -192,7 +205,10 @@ class ScreenClockDigital:
                 raise
             inst = face_cls(self.d, br)
 
+        if self.face is not None and self.face is not inst:
+            self._release_assets()
         self.face = inst
+        self._fx = dispatch_table(inst)
         self._face_id = face_id
 
         try: setattr(self.face, "manager", self.manager)
@@ -222,11 +238,9 @@ class ScreenClockDigital:
             self._hard_clear()
 
         hh, mm = self._now_hm()
+        fn = self._fx.get("render_full") or self._fx.get("render")
         try:
-            if hasattr(self.face, "render_full"):
-                self.face.render_full(hh, mm)
-            elif hasattr(self.face, "render"):
-                self.face.render(hh, mm)
+            if fn: fn(hh, mm)
         except Exception as e:
             log_warn("face initial draw error: %r", e)
         self._last_hm = (hh, mm)
@@ -245,6 +259,7 @@ class ScreenClockDigital:
         def _cb_min(*args, **kw):   self._on_min(_extract_payload(*args, **kw) or {})
         def _cb_sec(*args, **kw):   self._on_sec(_extract_payload(*args, **kw) or {})
         def _cb_tick(*args, **kw):  self._on_tick_1hz({})
+        def _cb_frame(*args, **kw): self._on_frame(_extract_payload(*args, **kw) or {})
 
         def _cb_bt(*args, **kw):    self._on_bt(_extract_payload(*args, **kw) or {})
         def _cb_wifi(*args, **kw):  self._on_wifi(_extract_payload(*args, **kw) or {})
@@ -252,13 +267,21 @@ class ScreenClockDigital:
         def _cb_batt(*args, **kw):  self._on_batt(_extract_payload(*args, **kw) or {})
         def _cb_usb(*args, **kw):   self._on_usb(_extract_payload(*args, **kw) or {})
         def _cb_notif(*args, **kw): self._on_notif(_extract_payload(*args, **kw) or {})
+        def _cb_aod(*args, **kw):   self._on_aod(_extract_payload(*args, **kw) or {})
 
         # --- Subscriptions (über Adapter → v1.2/v1.3 safe) ---
         if self.eb:
             self._tok["min"]   = self.eb.subscribe("time/min", _cb_min)
+            subs = []
             if bool(getattr(self.face, "WANTS_SECONDS", False)):
-                self._tok["sec"] = self.eb.subscribe("time/sec", _cb_sec)
-            self._tok["tick"]  = self.eb.subscribe("time/sec", _cb_tick)
+                subs.append(("sec", "time/sec", _cb_sec))
+            subs.append(("tick", "time/sec", _cb_tick))
+            # Frame-Takt nur für Faces mit tick() (FaceBase); ältere zeichnen sofort
+            if "tick" in self._fx:
+                subs.append(("frame", "time/frame", _cb_frame))
+            self._sec_subs = tuple(subs)
+            self._suspend_seconds(False)
+            self._tok["aod"]   = self.eb.subscribe("display/aod",    _cb_aod)
 
             self._tok["wifi"]  = self.eb.subscribe("status/wifi",    _cb_wifi)
             self._tok["bt"]    = self.eb.subscribe("status/bt",      _cb_bt)
@@ -274,26 +297,44 @@ class ScreenClockDigital:
         # --- StatusStore Prime: sofortige Anfangswerte ---
         s = self._status_store()
         if s:
-            for t, fn in (("status/wifi", self._on_wifi),
-                          ("status/bt",   self._on_bt),
-                          ("status/battery", self._on_batt),
-                          ("status/notif", self._on_notif),
-                          ("status/notifications", self._on_notif)):
-                try:
-                    p = s.get(t, fresh_only=False)
-                    if p is not None:
-                        fn(p)
-                except Exception:
-                    pass
+            comp = getattr(self.face, "comp", None)
+            if comp: comp.begin()
+            try:
+                for t, fn in (("status/wifi", self._on_wifi),
+                              ("status/bt",   self._on_bt),
+                              ("status/battery", self._on_batt),
+                              ("status/notif", self._on_notif),
+                              ("status/notifications", self._on_notif)):
+                    try:
+                        p = s.get(t, fresh_only=False)
+                        if p is not None:
+                            fn(p)
+                    except Exception:
+                        pass
+            finally:
+                if comp: comp.end()
+
+    def _release_assets(self):
+        # Face-Puffer an den gemeinsamen Asset-Cache zurückgeben (Face-Objekt bleibt, lädt beim nächsten Render neu)
+        rel = self._fx.get("release")
+        if rel:
+            try: rel()
+            except Exception as e: log_warn("face release_assets error: %r", e)
 
     def on_hide(self, *a, **kw):
         self._visible = False
+        if self._aod:
+            # Panel zurück in den Normalmodus, der nächste Screen zeichnet selbst
+            self._aod = False
+            try: self._fx["aod"](False)
+            except Exception: pass
         if self.eb:
             for k, tok in list(self._tok.items()):
                 if tok is not None:
                     try: self.eb.unsubscribe(tok)
                     except Exception: pass
                     self._tok[k] = None
+        self._release_assets()
 
     # ---------- rendering ----------
 
@@ -304,7 +345,7 @@ class ScreenClockDigital:
             self._hard_clear()
         hh, mm = self._now_hm()
         try:
-            self.face.render_full(hh, mm)
+            self._fx["render_full"](hh, mm)
         except Exception as e:
             log_warn("face.render_full error: %r", e)
         self._last_hm = (hh, mm)
@@ -314,20 +355,20 @@ class ScreenClockDigital:
         hh, mm = self._now_hm()
         if (hh, mm) != self._last_hm:
             try:
-                self.face.render(hh, mm)
+                self._fx["render"](hh, mm)
             except Exception as e:
                 log_warn("face.render error: %r", e)
             self._last_hm = (hh, mm)
 
     # ---------- event forwarding ----------
 
-    def _forward(self, meth, payload):
-        fn = getattr(self.face, meth, None)
-        if callable(fn):
+    def _forward(self, key, payload):
+        fn = self._fx.get(key)
+        if fn is not None:
             try:
                 fn(payload); return True
             except Exception as e:
-                log_warn("%s error: %r", meth, e)
+                log_warn("face %s error: %r", key, e)
                 return False
         return False
 
@@ -335,7 +376,7 @@ class ScreenClockDigital:
 
     def _on_min(self, payload=None):
         if not self._visible: return
-        self._forward("on_time", payload or {})
+        self._forward("time", payload or {})
         try:
             hh = int(payload.get("hh")) if isinstance(payload, dict) else None
             mm = int(payload.get("mm")) if isinstance(payload, dict) else None
@@ -345,20 +386,69 @@ class ScreenClockDigital:
             hh, mm = self._now_hm()
         if (hh, mm) != self._last_hm:
             try:
-                self.face.render(hh, mm)
+                self._fx["render_aod" if self._aod else "render"](hh, mm)
             except Exception as e:
                 log_warn("face.render error: %r", e)
             self._last_hm = (hh, mm)
 
     def _on_sec(self, payload=None):
         if not self._visible: return
-        if hasattr(self.face, "render_seconds"):
+        fn = self._fx.get("sec")
+        if fn is not None:
             try:
                 t = time.localtime()
-                self.face.render_seconds(int(t[3]), int(t[4]), int(t[5]))
+                fn(int(t[3]), int(t[4]), int(t[5]))
             except Exception:
                 pass
 
+    def _on_frame(self, payload=None):
+        if not self._visible: return
+        try:
+            self._fx["tick"](payload.get("ms"))
+        except Exception:
+            pass
+
+    def wants_frames(self):
+        # Frame-Takt nur bei offenem Flush/Burst des Faces (FaceBase.wants_frames), nicht im Always-on
+        if not self._visible or self._aod or "tick" not in self._fx: return False
+        fn = self._fx.get("wants")
+        try: return bool(fn()) if fn else True
+        except Exception: return True
+
+    # ---------- always-on ----------
+
+    def supports_aod(self):
+        # Always-on braucht einen Face mit set_aod() + render_aod() (FaceBase)
+        return self._visible and "aod" in self._fx and "render_aod" in self._fx
+
+    def _suspend_seconds(self, suspend):
+        # Always-on: keine Sekunden-/Frame-Events (kein Wecken je Sekunde), beim Aufwachen neu abonnieren
+        if not self.eb: return
+        for k, topic, cb in self._sec_subs:
+            if suspend:
+                if self._tok[k] is not None:
+                    try: self.eb.unsubscribe(self._tok[k])
+                    except Exception: pass
+                    self._tok[k] = None
+            elif self._tok[k] is None:
+                self._tok[k] = self.eb.subscribe(topic, cb)
+
+    def _on_aod(self, payload=None):
+        on = bool((payload or {}).get("on"))
+        if not self._visible or on == self._aod: return
+        fn = self._fx.get("aod")
+        if fn is None or (on and "render_aod" not in self._fx): return
+        self._aod = on
+        t = time.localtime()
+        hh, mm = int(t[3]), int(t[4])
+        if on: self._suspend_seconds(True)
+        try:
+            fn(on, hh, mm, int(t[5]))
+        except Exception as e:
+            log_warn("face aod error: %r", e)
+        if not on: self._suspend_seconds(False)
+        self._last_hm = (hh, mm)
+
     def _on_tick_1hz(self, payload=None):
         if not self._visible: return
         s = self._status_store()
@@ -383,15 +473,15 @@ class ScreenClockDigital:
     # ---- icon helpers ----
 
     def _set_icon(self, group, state):
-        fn = getattr(self.face, "set_icon", None)
-        if callable(fn):
+        fn = self._fx.get("icon")
+        if fn is not None:
             try: fn(group, state)
             except Exception: pass
 
     # ---- domain handlers ----
 
     def _on_wifi(self, payload=None):
-        if self._forward("on_wifi", payload): return
+        if self._forward("wifi", payload): return
         s = (payload or {}).get("state", "off")
         if   s == "error":                      state = "error"
         elif s in ("on", "connected", "ap"):    state = "connected"
@@ -400,7 +490,7 @@ class ScreenClockDigital:
         self._set_icon("wifi", state)
 
     def _on_bt(self, payload=None):
-        if self._forward("on_bt", payload): return
+        if self._forward("bt", payload): return
         s = (payload or {}).get("state", "off")
         if   s == "error":                          state = "error"
         elif s == "connected":                      state = "connected"
@@ -409,7 +499,7 @@ class ScreenClockDigital:
         self._set_icon("bt", state)
 
     def _on_lora(self, payload=None):
-        if self._forward("on_lora", payload): return
+        if self._forward("lora", payload): return
         s = (payload or {}).get("state", "off")
         if s == "error":      state = "error"
         elif s in ("on", "link", "tx", "rx"): state = "on"
@@ -417,12 +507,12 @@ class ScreenClockDigital:
         self._set_icon("lora", state)
 
     def _on_usb(self, payload=None):
-        if self._forward("on_usb", payload): return
+        if self._forward("usb", payload): return
         s = (payload or {}).get("state", "disconnected")
         self._set_icon("charge", "on" if s == "charging" else "off")
 
     def _on_batt(self, payload=None):
-        if self._forward("on_battery", payload): return
+        if self._forward("battery", payload): return
         p = 0; charging = False
         try: p = int((payload or {}).get("percent", 0) or 0)
         except Exception: p = 0
@@ -437,7 +527,7 @@ class ScreenClockDigital:
         self._set_icon("battery", lvl)
 
     def _on_notif(self, payload=None):
-        if self._forward("on_notif", payload): return
+        if self._forward("notif", payload): return
         flag = 0
         try:
             if isinstance(payload, dict):
@@ -4,6 +4,11 @@
 
 import json
 
+try:
+    from lib.asset_index import AssetIndex
+except Exception:
+    AssetIndex = None
+
 try:
     from core import eventbus as bus
 except Exception:
@@ -25,6 +30,12 @@ class QuickP1:
 
     META = "/ui/themes/standard/quick_p1/quick_p1_meta.json"
     BIN  = "/ui/themes/standard/quick_p1/quick_p1_atlas.bin"
+    # RLE-Variante (host/rle_convert.py): wird direkt aus der Datei gestreamt
+    RLE_META = "/ui/themes/standard/quick_p1/quick_p1_meta_rle.json"
+    RLE_BIN  = "/ui/themes/standard/quick_p1/quick_p1_atlas.rle"
+    # Binärindizes (host/index_compile.py) zu den beiden Metas
+    IDX     = "/ui/themes/standard/quick_p1/quick_p1_meta.idx"
+    RLE_IDX = "/ui/themes/standard/quick_p1/quick_p1_meta_rle.idx"
 
     def __init__(self, d=None, manager=None, **kw):
         self.d = d
@@ -32,6 +43,8 @@ class QuickP1:
         self.meta = None
         self.bin = None
         self._atlas_w = 0
+        self._rle = False
+        self._rf = None          # offener RLE-Atlas, solange der Screen sichtbar ist
         self.state = {"wifi": False, "bt": False, "lora": False, "mqtt": False}
         self._subbed = False
 
@@ -42,33 +55,69 @@ class QuickP1:
             return fs.open(path, mode)
         return open(path, mode)
 
+    def _rle_file(self):
+        # einmal je Sichtbarkeit öffnen (bis on_hide), nicht je Sprite
+        if self._rf is None:
+            self._rf = self._open(self.RLE_BIN, "rb")
+        return self._rf
+
+    def _rle_close(self):
+        if self._rf is not None:
+            try: self._rf.close()
+            except Exception: pass
+            self._rf = None
+
+    def _index(self, idx_path, meta_path):
+        """(group, state) -> (x, y, w, h, offset, length) und Atlasbreite; JSON nur als Fallback."""
+        if AssetIndex is not None:
+            try:
+                with self._open(idx_path, "rb") as f:
+                    ix = AssetIndex(data=f.read())
+                return ix, ix.stride
+            except Exception:
+                pass
+        with self._open(meta_path, "r") as f:
+            meta = json.loads(f.read())
+        lut = {}
+        for group, states in meta.get("groups", {}).items():
+            for st, sp in states.items():
+                w = sp["w"]; h = sp["h"]
+                lut[(group, st)] = (sp.get("x", 0), sp.get("y", 0), w, h,
+                                    sp["offset"], sp.get("length", w * h * 2))
+        return lut, int(meta.get("atlas", {}).get("w") or 0)
+
     def _load_assets(self):
+        if self.meta is None and hasattr(self.d, "blit_rle"):
+            try:
+                self.meta, _ = self._index(self.RLE_IDX, self.RLE_META)
+                self._rle = True
+                return
+            except Exception:
+                self.meta = None
+        if self._rle:
+            return
         if self.meta is None:
-            with self._open(self.META, "r") as f:
-                self.meta = json.loads(f.read())
-            self._atlas_w = int(self.meta.get("atlas", {}).get("w") or 0)
+            self.meta, self._atlas_w = self._index(self.IDX, self.META)
         if self.bin is None:
             with self._open(self.BIN, "rb") as f:
                 self.bin = f.read()
 
     # --- Drawing
     def _draw_sprite(self, group, is_on, x, y):
-        g = self.meta["groups"].get(group, {})
-        sp = g.get("on" if is_on else "off")
+        sp = self.meta.get((group, "on" if is_on else "off"))
         if not sp:
             return
-        off = sp["offset"]; w = sp["w"]; h = sp["h"]
-        stride_bytes = self._atlas_w * 2
-        row_bytes = w * 2
-        mv = memoryview(self.bin)
-        for yy in range(h):
-            row_start = off + yy * stride_bytes
-            self.d.blit_rgb565(x, y + yy, w, 1, mv[row_start: row_start + row_bytes])
+        w = sp[2]; h = sp[3]; off = sp[4]
+        if self._rle:
+            self.d.blit_rle(x, y, self._rle_file(), off)
+            return
+        # Sprite als Unterrechteck des Atlas (Zeilenlänge _atlas_w): ein Fenster
+        self.d.blit_rgb565(x, y, w, h, self.bin, self._atlas_w, off)
 
     def _fill_black(self):
+        # Ein Aufruf: der Treiber streamt das Rechteck blockweise aus seinem Fill-Puffer
         try:
-            for y in range(0, 240, 16):
-                self.d.fill_rect(0, y, 240, min(16, 240 - y), 0x0000)
+            self.d.fill_rect(0, 0, 240, 240, 0x0000)
         except Exception:
             pass
 
@@ -114,6 +163,7 @@ class QuickP1:
 
 
     def on_hide(self, *args, **kwargs):
+        self._rle_close()
         if self._subbed:
             bus.unsubscribe("status/wifi", self.on_wifi)
             bus.unsubscribe("status/bt",   self.on_bt)
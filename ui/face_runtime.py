@@ -0,0 +1,371 @@
+# ui/face_runtime.py — v0.2.0
+# - Always-on: set_aod() schaltet das Panel auf Idle (8 Farben) + Partial-Bereich AOD_BAND und
+#   zeichnet über render_aod() nur das Minutenlayout; Icon-Wechsel werden dann nur gemerkt
+# - Always-on komponiert auf Schwarz (plain) statt auf dem BG: Idle zeigt nur 8 Farben, Verläufe
+#   würden posterisiert
+# - _compose löst Kachel-Funktionen einmal je Aufruf auf (Atlas dabei gepinnt, _pin), statt in
+#   jedem 20-Zeilen-Band neu: kein Verdrängen + Neudekodieren derselben Kachel pro Band
+# - wants_frames() (tick() liefert es auch): offene Invalidierung oder laufender Burst; main.py
+#   publiziert "time/frame" nur dann, sonst ruht der Frame-Takt
+# Gemeinsame Laufzeit der Watchfaces und des Charge-Faces:
+# - FaceBase: Display/Manager aus den Konstruktor-Argumenten, Assets über den Asset-Cache,
+#   Binärindex, Icon-Zustand, echte Invalidierung (Compositor) mit Frame-Takt: tick() flusht
+#   höchstens UI_FACE_FPS-mal je Sekunde, ohne Takt wird sofort geflusht
+# - Ein Dirty-Rect = ein Fenster: BG-Zeilen + Kacheln/Flächen im Fill-Puffer (blit_bands)
+# - scratch()/pattern(): gepoolte Arbeitspuffer (es ist immer nur ein Face sichtbar)
+# - dispatch_table(): Face-Methoden einmal beim Laden auflösen statt getattr je Event
+try:
+    from lib.display_st7789 import Compositor
+except Exception:
+    Compositor = None
+try:
+    from lib.asset_index import load as _load_index
+except Exception:
+    _load_index = None
+try:
+    from lib.asset_cache import acquire as _acquire, release as _release
+except Exception:
+    _acquire = None; _release = None
+try:
+    import utime as _time
+except Exception:
+    import time as _time
+try:
+    import config
+    _CFG_FPS = int(getattr(config, "UI_FACE_FPS", 30))
+except Exception:
+    _CFG_FPS = 30
+
+W, H = 240, 240
+_STALE_MS = 250     # so lange ohne tick(): kein Frame-Takt (mehr), request_draw() flusht sofort
+
+
+def _join(a, b):
+    if not a: return b
+    if a.endswith("/"):
+        return a + b
+    return a + "/" + b
+
+
+def _read(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+# ---- Scratch-Pool ----------------------------------------------------------
+_POOL = {}
+
+
+def scratch(key, n):
+    """Arbeitspuffer key mit mindestens n Bytes (wächst, wird wiederverwendet) -> memoryview[:n]."""
+    b = _POOL.get(key)
+    if b is None or len(b) < n:
+        b = bytearray(n); _POOL[key] = b
+    return memoryview(b)[:n]
+
+
+def pattern(c565):
+    """Eine Bildschirmzeile in Farbe c565 (gepoolt) -> memoryview, für Flächen und leeren Grund."""
+    b = _POOL.get(c565)
+    if b is None:
+        b = bytearray(((c565 >> 8) & 0xFF, c565 & 0xFF)) * W; _POOL[c565] = b
+    return memoryview(b)
+
+
+def scratch_free():
+    _POOL.clear()
+
+
+# ---- Dispatch-Tabelle -------------------------------------------------------
+# Schlüssel -> Methodennamen in Vorrangreihenfolge (render_seconds: Digital, render_sec: Analog)
+_DISPATCH = (("render", ("render",)), ("render_full", ("render_full",)),
+             ("sec", ("render_seconds", "render_sec")), ("frame", ("render_frame",)),
+             ("tick", ("tick",)), ("time", ("on_time",)),
+             ("wifi", ("on_wifi",)), ("bt", ("on_bt",)), ("lora", ("on_lora",)),
+             ("battery", ("on_battery",)), ("usb", ("on_usb",)), ("notif", ("on_notif",)),
+             ("icon", ("set_icon",)), ("draw", ("request_draw",)),
+             ("region", ("invalidate_region",)), ("release", ("release_assets",)),
+             ("aod", ("set_aod",)), ("render_aod", ("render_aod",)),
+             ("wants", ("wants_frames",)))
+
+
+def dispatch_table(face):
+    """Gebundene Methoden eines (auch älteren) Faces einmal auflösen -> {schlüssel: callable}."""
+    fx = {}
+    if face is None: return fx
+    for key, names in _DISPATCH:
+        for n in names:
+            fn = getattr(face, n, None)
+            if callable(fn):
+                fx[key] = fn; break
+    return fx
+
+
+class FaceBase:
+    """
+    Basis der Faces. Unterklassen setzen NAME/ASSET_BASE/ASSETS und liefern über _items()
+    die Kacheln eines Rechtecks; gezeichnet wird nur, was invalidiert wurde:
+      set_icon()/invalidate_region() -> Dirty-Rect, request_draw() -> Flush (sofort oder im tick)
+    """
+    NAME = ""
+    DRAWS_FULL_BG = True
+    WANTS_SECONDS = False
+    ICON_RECTS = {}
+    OFF_ICONS = True          # False: Zustand "off" zeigt BG statt einer "off"-Kachel
+    ASSET_BASE = ""           # z.B. "ui/charge_face/gold_black"
+    ASSETS = {}               # Attribut -> Datei im assets-Ordner (über den Asset-Cache)
+    AOD_BAND = None           # (y, h): Zeilen des Minutenlayouts im Always-on (None: ganzes Bild)
+
+    def __init__(self, *args, **kwargs):
+        self.d = kwargs.get("display")
+        self.manager = kwargs.get("manager")
+        for a in args:
+            if getattr(a, "blit_rgb565", None) and self.d is None:
+                self.d = a
+            elif getattr(a, "status", None) is not None and self.manager is None:
+                self.manager = a
+        self.status = kwargs.get("status")
+        self.bus = kwargs.get("bus")
+
+        self._dir = _join(self.ASSET_BASE, "assets")
+        self._paths = dict((k, _join(self._dir, v)) for k, v in self.ASSETS.items())
+        self.bg = None; self.atlas = None; self.icons_lut = None
+        for k in self._paths: setattr(self, k, None)
+        self.icons = {}
+
+        # Frame-Takt: letzter tick(), letzter Flush im Takt, offener Flush
+        self._frame_ms = 1000 // _CFG_FPS if _CFG_FPS > 0 else 0
+        self._tick_ms = None; self._flush_ms = None; self._want = False
+        self._fx = None
+        # Always-on: aktiv, zuletzt gezeichnete Minute (hh, mm)
+        self._aod = False; self._aod_hm = None
+
+        self.comp = None
+        if Compositor and self.d is not None:
+            self.comp = Compositor(self.d)
+            self.comp.add_layer(self._paint)
+
+    # ---- Assets ----
+    def _assets(self):
+        for attr, path in self._paths.items():
+            if getattr(self, attr) is None:
+                setattr(self, attr, _acquire(path) if _acquire else _read(path))
+
+    def release_assets(self):
+        """Puffer an den Asset-Cache zurückgeben (Screen.on_hide); der nächste Draw holt sie neu."""
+        for attr, path in self._paths.items():
+            if _release and getattr(self, attr) is not None: _release(path)
+            setattr(self, attr, None)
+        if self.comp: self.comp.discard()
+        self._tick_ms = None; self._want = False
+        scratch_free()
+
+    def _index(self, name, listkey, fields):
+        """Binärindex (<name>.idx, host/index_compile.py); sonst einmalig aus <name>.json."""
+        idx = _load_index(_join(self._dir, name + ".idx")) if _load_index else None
+        if idx is not None: return idx
+        raw = _read(_join(self._dir, name + ".json"))
+        if not raw: return None
+        try:
+            import ujson as _json
+        except Exception:
+            import json as _json
+        try:
+            lut = {}
+            meta = _json.loads(raw)
+            for it in meta.get(listkey) or meta.get("items") or ():
+                k = tuple(it.get(f) for f in fields)
+                tw = int(it.get("w", 0)); th = int(it.get("h", 0))
+                lut[k if len(k) > 1 else k[0]] = (
+                    int(it.get("x", 0) or 0), int(it.get("y", 0) or 0), tw, th,
+                    int(it.get("offset", 0)), int(it.get("length", tw*th*2)))
+            return lut
+        except Exception:
+            return None
+
+    def dispatch(self):
+        if self._fx is None: self._fx = dispatch_table(self)
+        return self._fx
+
+    # ---- Invalidierung + Frame-Takt ----
+    def _dirty(self, x, y, w, h):
+        # ohne Compositor gleich zeichnen (ein Fenster), sonst bis zum Flush sammeln
+        if w <= 0 or h <= 0: return
+        if self.comp: self.comp.invalidate(x, y, w, h)
+        else:
+            self._assets(); self._paint(x, y, w, h)
+
+    def invalidate(self):
+        if self.comp: self.comp.invalidate_all()
+        else: self._dirty(0, 0, W, H)
+        self.request_draw()
+
+    def invalidate_region(self, x, y, w, h):
+        self._dirty(x, y, w, h)
+        self.request_draw()
+
+    def request_draw(self):
+        """Flush anfordern: im Frame-Takt beim nächsten tick(), ohne Takt sofort."""
+        if not self.comp: return
+        t = self._tick_ms; now = _time.ticks_ms()
+        if t is None or _time.ticks_diff(now, t) > _STALE_MS:
+            # kein Frame-Takt: sofort flushen; wants_frames() holt ihn für den Rest des Bursts
+            self._flush_ms = now
+            self.flush()
+        else:
+            self._want = True
+
+    def flush(self):
+        self._want = False
+        if self.comp and self.comp.pending():
+            self._assets()
+            self.comp.flush()
+
+    def tick(self, now_ms=None):
+        """
+        Frame-Takt (time/frame): offene Rects höchstens UI_FACE_FPS-mal je Sekunde flushen.
+        -> wants_frames(): braucht der Face weitere Frames?
+        """
+        now = _time.ticks_ms() if now_ms is None else now_ms
+        self._tick_ms = now
+        if self._want and (self._flush_ms is None or
+                           _time.ticks_diff(now, self._flush_ms) >= self._frame_ms):
+            self._flush_ms = now
+            self.flush()
+        self.on_frame(now)
+        return self.wants_frames()
+
+    def wants_frames(self):
+        """Offener Flush oder letzter Flush jünger als _STALE_MS (Burst läuft, Takt halten)."""
+        if self._want: return True
+        t = self._flush_ms
+        return t is not None and _time.ticks_diff(_time.ticks_ms(), t) <= _STALE_MS
+
+    def on_frame(self, now_ms):
+        pass
+
+    # ---- Icons ----
+    def _icon_tile(self, group, state):
+        """(x, y, w, h, offset, length) der Icon-Kachel am Bildschirm oder None."""
+        if state is None or (state == "off" and not self.OFF_ICONS) or not self.icons_lut:
+            return None
+        t = self.icons_lut.get((group, state))
+        if t is None: return None
+        r = self.ICON_RECTS.get(group)
+        if r is None: return t
+        return (r[0], r[1], t[2] or r[2], t[3] or r[3], t[4], t[5])
+
+    def _icon_dirty(self, group, state):
+        t = self._icon_tile(group, state) or self.ICON_RECTS.get(group)
+        if t: self._dirty(t[0], t[1], t[2], t[3])
+
+    def set_icon(self, group, state):
+        state = "off" if state is None else str(state)
+        prev = self.icons.get(group)
+        if prev == state: return
+        self.icons[group] = state
+        if self._aod: return          # im Always-on nur merken, render_full() beim Aufwachen
+        self._icon_dirty(group, prev)
+        self._icon_dirty(group, state)
+        self.request_draw()
+
+    def _icon_items(self, x, y, w, h, out):
+        for g, st in self.icons.items():
+            t = self._icon_tile(g, st)
+            if t and t[0] < x + w and x < t[0] + t[2] and t[1] < y + h and y < t[1] + t[3]:
+                out.append((t, self.atlas))
+        return out
+
+    # ---- Always-on ----
+    def set_aod(self, on, hh=None, mm=None, ss=None):
+        """
+        Ein: Panel auf Idle (8 Farben) + Partial-Bereich AOD_BAND, dann render_aod(hh, mm).
+        Aus: render_full(hh, mm, ss), danach Panel zurück auf Normalmodus (ohne hh: nur Panel).
+        """
+        on = bool(on)
+        if on == self._aod: return
+        self._aod = on; self._aod_hm = None
+        if self.comp: self.comp.discard()
+        self._want = False
+        d = self.d
+        panel = getattr(d, "idle_mode", None) is not None
+        if on:
+            if panel:
+                d.idle_mode(True)
+                if self.AOD_BAND: d.partial_mode(self.AOD_BAND[0], self.AOD_BAND[1])
+            if hh is not None: self.render_aod(hh, mm)
+        else:
+            if hh is not None: self.render_full(hh, mm, ss)
+            if panel:
+                d.normal_mode(); d.idle_mode(False)
+
+    def render_aod(self, hh, mm):
+        """Minutenlayout im Always-on; Standard: AOD_BAND (bzw. ganzes Bild) auf Schwarz je Minute neu."""
+        if self._aod_hm == (hh, mm): return
+        self._assets()
+        y, h = self.AOD_BAND or (0, H)
+        self._compose(0, y, W, h, self._items(0, y, W, h), None, True)
+        self._aod_hm = (hh, mm)
+
+    # ---- Komposition ----
+    def _items(self, x, y, w, h):
+        """Kacheln über dem BG, die (x, y, w, h) schneiden, in Zeichenreihenfolge."""
+        return self._icon_items(x, y, w, h, [])
+
+    def _paint(self, x, y, w, h):
+        # Compositor-Layer: läuft unter dem Clip des Dirty-Rects, ein Fenster (Always-on: schwarz)
+        self._compose(x, y, w, h, self._items(x, y, w, h), None, self._aod)
+
+    def _compose(self, x, y, w, h, items=(), under=None, plain=False):
+        """
+        Rechteck in einem Fenster: BG-Zeilen, under(buf, x, y, w, n), dann items zeilenblockweise
+        im Fill-Puffer (blit_bands). items: [(t, src), ...], t = (x, y, w, h, offset, length) am
+        Bildschirm; src: Atlas (Kachel ab offset), Funktion t -> Kachelpuffer ab 0, oder Farbe (int).
+        plain: schwarzer Grund statt BG (Always-on).
+        Funktionen werden einmal vor dem ersten Band aufgelöst; _pin(True) hält ihre Puffer
+        (Atlas-Views) bis zum letzten Band gültig.
+        """
+        bg = None if plain else self.bg
+        blank = None if bg else pattern(0)
+        res = []              # (t, src, offset): Funktionen aufgelöst, nur Kacheln im Rechteck
+        def paint(buf, x, y, w, n):
+            wb = w*2; ye = y + n; xe = x + w
+            if w == W and bg: buf[0:n*wb] = bg[y*W*2:ye*W*2]
+            else:
+                for r in range(n):
+                    if bg: buf[r*wb:(r+1)*wb] = bg[((y+r)*W + x)*2:((y+r)*W + x)*2 + wb]
+                    else: buf[r*wb:(r+1)*wb] = blank[:wb]
+            if under: under(buf, x, y, w, n)
+            for t, src, so in res:
+                tx, ty, tw, th = t[0], t[1], t[2], t[3]
+                if ty >= ye or ty + th <= y: continue
+                c0 = tx if tx > x else x; c1 = tx + tw if tx + tw < xe else xe
+                if c1 <= c0: continue
+                k = (c1 - c0)*2; r0 = ty if ty > y else y; r1 = ty + th if ty + th < ye else ye
+                do = (r0 - y)*wb + (c0 - x)*2
+                if type(src) is int:
+                    row = pattern(src)
+                    for r in range(r0, r1):
+                        buf[do:do+k] = row[:k]; do += wb
+                    continue
+                so += ((r0 - ty)*tw + (c0 - tx))*2
+                for r in range(r0, r1):
+                    buf[do:do+k] = src[so:so+k]; so += tw*2; do += wb
+        self._pin(True)
+        try:
+            for t, src in items:
+                tx, ty, tw, th = t[0], t[1], t[2], t[3]
+                if ty >= y + h or ty + th <= y or tx >= x + w or tx + tw <= x: continue
+                if type(src) is int: res.append((t, src, 0))
+                elif callable(src): res.append((t, src(t), 0))
+                else: res.append((t, src, t[4]))
+            self.d.blit_bands(x, y, w, h, paint)
+        finally:
+            self._pin(False)
+
+    def _pin(self, on):
+        # Kachel-Cache der Funktionen in items während eines Composes pinnen (Face-spezifisch)
+        pass
@@ -1,29 +1,76 @@
-# gold_classic_analog — v0.6.6
-# - set_icon() blitted sofort in den Icon-Rect (kein Defer)
+# gold_classic_analog — v0.9.3
+# - Zeigerbänder komponieren die Icons im Band mit (_items wie im Digital-Face), statt sie mit
+#   reinem BG + Zeigern zu überschreiben
+# - hands.bin nur noch erster Quadrant als Zeilenprofile (50 KB statt 443 KB), die übrigen
+#   Positionen entstehen durch Spiegeln beim Lesen; kein Gleitkomma-Rückfall mehr im Face
+#   (Rastern nur noch in host/hands_build.py), fehlt die Tabelle, ist das ein Build-Fehler
+# - Sekundenzeiger springt standardmäßig (ANALOG_SECONDS_HZ = 1), Sweep ist opt-in; wants_frames()
+#   hält den Frame-Takt nur bei Sweep (> 1 Hz) oder offener Invalidierung
+# - time immer importiert (utime/time wie face_runtime): kein stilles Aussetzen der Zwischenschritte
+# - Always-on (render_aod): Stunde + Minute auf Schwarz im Zeigerband, ohne BG/Icons/Sekunde;
+#   Minutenwechsel wie render() nur über die überstrichenen Zeilen
+# - FaceBase (ui/face_runtime): Icons invalidieren, Flush im Frame-Takt (tick → render_frame),
+#   Icon-Rect = Kachelgröße (Akku 26 px breit, vorher auf 20 px beschnitten); Vollbild inkl.
+#   Icons in einem Fenster
+# - Zeiger mit Kantenglättung (4-bit-Deckung, Mischtabellen des Treibers) statt Schattenpass
+# - Sekundenzeiger (SHOW_SECONDS): render_sec() 1 Hz, render_frame() Zwischenschritte bis
+#   ANALOG_SECONDS_HZ, nur der überstrichene Streifen; Budget-Monitor senkt die Rate
+# - Zeigergeometrie vorberechnet (assets/hands.bin, 780 Positionen): Render = Tabellenlauf
+# - Minutenwechsel löscht nur die überstrichenen Zeilen (alte ∪ neue Spans), nicht das Zeigerquadrat
+# - Zeiger als Zeilenspans, offscreen über den BG-Ausschnitt komponiert: ein Fenster je Tick
+#   (Stunde + Minute gemeinsam, die Stunde wird beim reinen Stundenwechsel nicht mehr gelöscht)
+# - set_icon() invalidiert den Icon-Rect; request_draw() flusht den Compositor (ein SPI-Pass je Burst)
 # - Wi‑Fi-Mapping: connected/ap→"connected", off/disabled→"off", sonst→"connecting"
-# - Render-Order: Minute-Clear → Stunde → Minute (kein Verschwinden der Stunde)
+from ui.face_runtime import FaceBase, pattern
 try:
-    import uos as _os
+    from lib.display_st7789 import blend_tables as _blend_tables
 except Exception:
-    import os as _os
+    _blend_tables = None
+try:
+    from array import array
+except Exception:
+    from uarray import array
+from lib.hand_table import HandSpans, load as _load_hands, pack as _pack_hands
+try:
+    import utime as _time
+except Exception:
+    import time as _time
+try:
+    import config
+    _CFG_SEC_ON = bool(getattr(config, "SHOW_SECONDS", True))
+    _CFG_SEC_HZ = int(getattr(config, "ANALOG_SECONDS_HZ", 1))
+except Exception:
+    _CFG_SEC_ON = True
+    _CFG_SEC_HZ = 1
 
 W, H = 240, 240
+_BAND_TX_PX = 64    # Fensterwechsel (CASET/RASET/RAMWR) in Pixeln gerechnet, für _dirty_bands
+HAND_POS = 780      # 720 Stunden- + 60 Minutenpositionen (hands.bin)
+SEC_STEPS = 1800    # Sekundenzeiger-Raster (0,2°), jede Rate teilt 30 Schritte je Sekunde
+SEC_RATES = (1, 2, 3, 5, 6, 10, 15, 30)
 NAME = "gold_classic_analog"
 DRAWS_FULL_BG = True
 DEBUG = False
 
-def _join(a, b):
-    if not a: return b
-    if a.endswith("/"):
-        return a + b
-    return a + "/" + b
+def _sec_rate(hz):
+    r = 1
+    for k in SEC_RATES:
+        if k <= hz: r = k
+    return r
 
-def _read(path):
-    try:
-        with open(path, "rb") as f:
-            return f.read()
-    except Exception:
-        return None
+_SIN = None
+
+def _sin(u):
+    """sin(u * 0,2°) in Q14 aus einer Viertelwellen-Tabelle (451 Werte, einmal berechnet)."""
+    global _SIN
+    if _SIN is None:
+        import math
+        _SIN = array("h", [int(math.sin(i*math.pi/900.0)*16384.0 + 0.5) for i in range(451)])
+    u %= SEC_STEPS
+    if u <= 450:  return _SIN[u]
+    if u <= 900:  return _SIN[900 - u]
+    if u <= 1350: return -_SIN[u - 900]
+    return -_SIN[1800 - u]
 
 def _rgb565(r, g, b):
     return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
@@ -36,128 +83,72 @@ ICON_RECTS = {
     "msg":    (212, 212, 20, 20),
 }
 
-class Face:
+class Face(FaceBase):
+    NAME = NAME
+    DRAWS_FULL_BG = True
+    ICON_RECTS = ICON_RECTS
+    OFF_ICONS = False
+    AOD_BAND = (31, 179)     # Zeigerband: Zeilen 31..209 aller Positionen in hands.bin
+    ASSET_BASE = "ui/watchfaces_analog/%s" % NAME
+    ASSETS = {"bg": "bg_full.bin", "atlas": "icons_atlas.bin"}
+
     def __init__(self, *args, **kwargs):
-        self.d = kwargs.get("display")
-        self.manager = kwargs.get("manager")
-        for a in args:
-            if getattr(a, "blit_rgb565", None) and self.d is None:
-                self.d = a
-            elif getattr(a, "status", None) is not None and self.manager is None:
-                self.manager = a
-        self.status = kwargs.get("status")
-        self.bus    = kwargs.get("bus")
-
-        base = "ui/watchfaces_analog/%s" % NAME
-        assets = _join(base, "assets")
-
-        # Hintergrund (RGB565 240x240)
-        self.bg = _read(_join(assets, "bg_full.bin"))
-
-        # Icons-Atlas + Meta
-        self.icons_meta = None
-        meta_raw = _read(_join(assets, "icons_meta.json")) \
-                or _read(_join(assets, "icons_manifest.json")) \
-                or _read(_join(assets, "icons.json"))
-        if meta_raw:
-            try:
-                import ujson as _json
-            except Exception:
-                import json as _json
-            try:
-                meta = _json.loads(meta_raw)
-                self.icons_meta = meta.get("icons") or meta.get("items")
-            except Exception:
-                self.icons_meta = None
-        self.atlas = _read(_join(assets, "icons_atlas.bin"))
+        FaceBase.__init__(self, *args, **kwargs)
+        # Zeigertabelle bleibt im Flash, nur die Offsets liegen im RAM
+        self._hands_path = "%s/hands.bin" % self._dir
+        self._ht = None
+        self._assets()
+        # Icons-Index: (group, state) -> (x, y, w, h, offset, length)
+        self.icons_lut = self._index("icons_meta", "icons", ("group", "state"))
 
         # State
         self.icons = {"wifi":"off","bt":"off","battery":"100","charge":"off","msg":"off"}
         self._last_hh = None; self._last_mm = None
-        self._bbox_hr = None; self._bbox_min = None
+        # Zeilenspans (Stunde, Minute): aktuelle und zuletzt gezeichnete Position, feste Puffer
+        self._cur = (HandSpans(), HandSpans()); self._old = (HandSpans(), HandSpans())
+        # Sekundenzeiger: eigene Span-Puffer (neu/alt), Position im 1800er-Raster
+        self._sec_on = _CFG_SEC_ON
+        self._sec_hz_max = _sec_rate(_CFG_SEC_HZ); self._sec_hz = self._sec_hz_max
+        self._sec = (HandSpans(),); self._sec_old = (HandSpans(),)
+        self._sec_u = None           # gezeichnete Position (None: noch keine)
+        self._sec_s = None           # letzte gemeldete Sekunde (render_sec) ...
+        self._sec_t0 = 0             # ... und ihr Zeitpunkt in ms, Basis für Zwischenschritte
+        self._sec_last = 0           # ms des letzten gezeichneten Schritts
+        self._sec_over = 0; self._sec_good = 0   # Budget-Monitor
 
         # Zeiger-Style
         self.cx, self.cy = 120, 120
         self.min_len, self.min_th = 88, 6
         self.hr_len,  self.hr_th  = 60, 8
         self.col_gold   = _rgb565(232, 198, 87)
-        self.col_shadow = _rgb565(60, 45, 10)
-
-        # Buffer-Cache
-        self._solid_cache = {}
-
-    # -------- small helpers --------
-    def request_draw(self):
-        try:
-            getattr(self.manager, "request_draw", lambda: None)()
-        except Exception:
-            pass
-
-    def invalidate_region(self, x, y, w, h):
-        self.request_draw()
-
-    def _bg_slice(self, x, y, w, h):
-        if not self.bg: return None
-        if x < 0: w += x; x = 0
-        if y < 0: h += y; y = 0
-        if x + w > W: w = W - x
-        if y + h > H: h = H - y
-        if w <= 0 or h <= 0: return None
-        row = W * 2
-        out = bytearray(w*h*2)
-        for j in range(h):
-            src = (y + j) * row + x * 2
-            out[j*w*2:(j+1)*w*2] = self.bg[src:src + w*2]
-        return bytes(out)
-
-    def _solid_buf(self, w, h, color565):
-        key = (w, h, color565)
-        buf = self._solid_cache.get(key)
-        if buf: return buf
-        b = bytearray(w*h*2)
-        hi = (color565 >> 8) & 0xFF; lo = color565 & 0xFF
-        for i in range(0, len(b), 2):
-            b[i] = hi; b[i+1] = lo
-        self._solid_cache[key] = bytes(b)
-        return self._solid_cache[key]
-
-    def _fill_rect(self, x, y, w, h, color565):
-        if w<=0 or h<=0: return
-        try:
-            self.d.blit_rgb565(x, y, w, h, self._solid_buf(w, h, color565))
-        except Exception:
-            pass
-
-    # -------- icons --------
-    def _atlas_draw(self, group, state):
-        if not (self.icons_meta and self.atlas): return
-        rect = ICON_RECTS.get(group)
-        if not rect: return
-        x, y, w, h = rect
-        cand = None
-        for it in self.icons_meta:
-            if it.get("group")==group and it.get("state")==state:
-                cand = it; break
-        if cand is None:
-            return
-        off = int(cand.get("offset", 0)); ln = int(cand.get("length", 0))
-        tw  = int(cand.get("w", w));      th = int(cand.get("h", h))
-        try:
-            view = memoryview(self.atlas)[off:off+ln]
-            self.d.blit_rgb565(x, y, tw, th, view)
-        except Exception:
-            pass
-
-    def set_icon(self, group, tag):
-        self.icons[group] = tag
-        x,y,w,h = ICON_RECTS.get(group, (0,0,0,0))
-        if not w or not h: return
-        if tag == "off" or tag is None:
-            buf = self._bg_slice(x,y,w,h)
-            if buf: self.d.blit_rgb565(x,y,w,h,buf)
-        else:
-            self._atlas_draw(group, tag)
-        self.request_draw()
+        self.sec_len, self.sec_tail = 96, 18
+        self.col_sec    = _rgb565(200, 48, 32)
+
+        # Palette der Spans (0 Gold, 1 Sekunde); Kanäle (r5, g6, b5) für Kantenpixel mit
+        # Teildeckung, Musterzeilen für deckende Spans kommen aus dem Scratch-Pool (pattern)
+        self._colors = (self.col_gold, self.col_sec)
+        self._pal = [(c >> 11, (c >> 5) & 63, c & 31) for c in self._colors]
+
+    # -------- assets --------
+    def _assets(self):
+        FaceBase._assets(self)
+        if self._ht is None:
+            self._ht = _load_hands(self._hands_path)
+
+    def release_assets(self):
+        """Puffer an den Asset-Cache zurückgeben (Screen.on_hide); nächster Render holt sie neu."""
+        FaceBase.release_assets(self)
+        if self._ht: self._ht.close()
+        self._ht = None
+
+    def on_frame(self, now_ms):
+        # Frame-Takt (tick): Sekundenzeiger-Zwischenschritte
+        self.render_frame(now_ms)
+
+    def wants_frames(self):
+        # Sweep braucht jeden Frame; 1 Hz kommt über time/sec
+        if self._sec_on and self._sec_hz > 1 and not self._aod: return True
+        return FaceBase.wants_frames(self)
 
     # Domain-Mappings
     def on_wifi(self, payload=None):
@@ -202,106 +193,227 @@ class Face:
         self.set_icon("msg", "on" if (cnt>0 or flg==1) else "off")
 
     # -------- hands --------
-    def _bbox(self, angle_deg, length, thickness):
-        r = length + thickness + 2
-        x = int(self.cx - r); y = int(self.cy - r)
-        w = int(2*r); h = int(2*r)
-        if x<0: w+=x; x=0
-        if y<0: h+=y; y=0
-        if x+w>W: w=W-x
-        if y+h>H: h=H-y
-        return x,y,w,h
-
-    def _draw_capsule_core(self, x0,y0,x1,y1,thick,color,clip,taper_px):
+    # Positionen: Stunde (hh%12)*60+mm (0..719, 0,5°-Schritte), Minute 720+mm.
+    # Zeilenspans kommen aus hands.bin (host/hands_build.py, erster Quadrant, Rest gespiegelt).
+    @staticmethod
+    def _span_add(rows, y, xa, xb, c):
+        lst = rows.get(y)
+        if lst is None:
+            rows[y] = [[xa, xb, c]]; return
+        sp = lst[-1]
+        # an den letzten Span gleicher Farbe/Deckung anhängen (Schritte laufen monoton in x)
+        if sp[2] == c and xa <= sp[1]+1 and xb >= sp[0]-1:
+            if xa < sp[0]: sp[0] = xa
+            if xb > sp[1]: sp[1] = xb
+        else:
+            lst.append([xa, xb, c])
+
+    def _load_hands(self, hh, mm):
+        """Beide Zeiger in die freien Span-Puffer laden; vorige Position bleibt für den Diff."""
+        self._old, self._cur = self._cur, self._old
+        for spans, pos in ((self._cur[0], (hh%12)*60 + mm%60), (self._cur[1], 720 + mm%60)):
+            self._ht.read(pos, spans)
+
+    def _hand_paint(self, hands):
+        """Zeigerspans über die BG-Zeilen im Fill-Puffer legen (under-Painter für _compose)."""
+        pats = [pattern(c) for c in self._colors]; pal = self._pal
+        L5, L6 = _blend_tables()
+        def paint(buf, x, y, w, n):
+            wb = w*2; xe = x + w - 1
+            for r in range(n):
+                o = r*wb
+                for h in hands:
+                    a, b = h.row(y+r); sb = h.buf
+                    while a < b:
+                        xa = sb[a]; xb = sb[a+1]; c = sb[a+2]; a += 3
+                        if xa < x: xa = x
+                        if xb > xe: xb = xe
+                        if xb < xa: continue
+                        p = o + (xa - x)*2; al = c >> 4
+                        if not al:
+                            k = (xb - xa + 1)*2
+                            buf[p:p+k] = pats[c][:k]; continue
+                        # Kantenpixel: Zeigerfarbe mit Deckung al über den bisherigen Inhalt mischen
+                        pr, pg, pb = pal[c & 15]; ia = 15 - al
+                        r5 = L5[al*32 + pr]; g6 = L6[al*64 + pg]; b5 = L5[al*32 + pb]
+                        while xa <= xb:
+                            d = (buf[p] << 8) | buf[p+1]
+                            v = ((r5 + L5[ia*32 + (d >> 11)]) << 11) \
+                                | ((g6 + L6[ia*64 + ((d >> 5) & 63)]) << 5) \
+                                | (b5 + L5[ia*32 + (d & 31)])
+                            buf[p] = v >> 8; buf[p+1] = v & 0xFF
+                            p += 2; xa += 1
+        return paint
+
+    def _compose_hands(self, r, hands):
+        # Icons im Band mitkomponieren: ein Band über einem Icon-Rect darf es nicht löschen
+        x, y, w, h = r
+        self._compose(x, y, w, h, self._items(x, y, w, h), self._hand_paint(hands))
+
+    def _dirty_bands(self, old, new):
+        """
+        Nur Zeilen, deren Spans sich geändert haben; je Zeile x-Ausdehnung über alte + neue Spans.
+        Benachbarte Zeilen werden zu Bändern zusammengelegt, solange das Rechteck nicht mehr
+        Fläche kostet als ein weiteres Fenster (_BAND_TX_PX). -> [(x, y, w, h), ...]
+        """
+        ya = H; ye = -1
+        both = old + new
+        for h in both:
+            if h.n:
+                if h.y0 < ya: ya = h.y0
+                if h.y0 + h.n > ye: ye = h.y0 + h.n
+        out = []; bx0 = bx1 = by0 = by1 = -1
+        for y in range(ya, ye):
+            k = 0
+            while k < len(new) and old[k].same_row(new[k], y): k += 1
+            if k == len(new): continue
+            x0 = W; x1 = -1
+            for h in both:
+                a, b = h.row(y); sb = h.buf
+                while a < b:
+                    if sb[a] < x0: x0 = sb[a]
+                    if sb[a+1] > x1: x1 = sb[a+1]
+                    a += 3
+            if x1 < x0: continue
+            if by1 == y - 1:
+                m0 = bx0 if bx0 < x0 else x0; m1 = bx1 if bx1 > x1 else x1
+                n = y - by0 + 1
+                if n*(m1 - m0 + 1) <= (n-1)*(bx1 - bx0 + 1) + (x1 - x0 + 1) + _BAND_TX_PX:
+                    bx0, bx1, by1 = m0, m1, y
+                    continue
+            if by1 >= 0: out.append((bx0, by0, bx1 - bx0 + 1, by1 - by0 + 1))
+            bx0, bx1, by0, by1 = x0, x1, y, y
+        if by1 >= 0: out.append((bx0, by0, bx1 - bx0 + 1, by1 - by0 + 1))
+        return out
+
+    def _layers(self):
+        # Zeichenreihenfolge: Stunde, Minute, Sekunde (falls sichtbar)
+        return self._cur + self._sec if self._sec_u is not None else self._cur
+
+    # -------- second hand --------
+    # Überstrichener Streifen (alte ∪ neue Spans) wird über BG + Stunde/Minute neu komponiert;
+    # die gecachte Ebene darunter sind bg_full und die Span-Puffer der beiden Zeiger.
+    def _line_rows(self, rows, x0,y0,x1,y1,c):
+        # 2 px breite Bresenham-Linie als Zeilenspans
         dx=x1-x0; dy=y1-y0
         ax=dx if dx>=0 else -dx; ay=dy if dy>=0 else -dy
-        r0=thick//2;  r0 = r0 if r0>=1 else 1
-        L=ax if ax>=ay else ay
-        if taper_px>L: taper_px=L
-        if clip: bx,by,bw,bh=clip
-        else: bx,by,bw,bh=self._bbox(0, max(ax,ay), thick)
+        sx=1 if dx>=0 else -1; sy=1 if dy>=0 else -1; err=0
         if ax>=ay:
-            step_y=1 if dy>=0 else -1; err=0; y=y0; sx=1 if dx>=0 else -1
-            for i in range(0, ax+1):
+            y=y0
+            for i in range(ax+1):
                 x=x0+i*sx
-                r = r0 - ((i-(ax-taper_px))*(r0-1)//(taper_px if taper_px else 1)) if i>ax-taper_px else r0
-                rx=x; ry=y-r; rw=1; rh=2*r+1
-                if not (rx+rw<=bx or ry+rh<=by or rx>=bx+bw or ry>=by+bh):
-                    cx1=rx if rx>bx else bx; cy1=ry if ry>by else by
-                    cw=(rx+rw if rx+rw<bx+bw else bx+bw)-cx1
-                    ch=(ry+rh if ry+rh<by+bh else by+bh)-cy1
-                    if cw>0 and ch>0: self._fill_rect(cx1,cy1,cw,ch,color)
+                self._span_add(rows, y, x, x, c); self._span_add(rows, y+1, x, x, c)
                 err+=ay
-                if (err<<1)>=ax: y+=step_y; err-=ax
+                if (err<<1)>=ax: y+=sy; err-=ax
         else:
-            step_x=1 if dx>=0 else -1; err=0; x=x0; sy=1 if dy>=0 else -1
-            for i in range(0, ay+1):
-                y=y0+i*sy
-                r = r0 - ((i-(ay-taper_px))*(r0-1)//(taper_px if taper_px else 1)) if i>ay-taper_px else r0
-                rx=x-r; ry=y; rw=2*r+1; rh=1
-                if not (rx+rw<=bx or ry+rh<=by or rx>=bx+bw or ry>=by+bh):
-                    cx1=rx if rx>bx else bx; cy1=ry if ry>by else by
-                    cw=(rx+rw if rx+rw<bx+bw else bx+bw)-cx1
-                    ch=(ry+rh if ry+rh<by+bh else by+bh)-cy1
-                    if cw>0 and ch>0: self._fill_rect(cx1,cy1,cw,ch,color)
+            x=x0
+            for i in range(ay+1):
+                self._span_add(rows, y0+i*sy, x, x+1, c)
                 err+=ax
-                if (err<<1)>=ay: x+=step_x; err-=ay
-
-    def _draw_capsule_line(self, x0,y0,x1,y1,thick,color,clip=None,taper_px=10):
-        self._draw_capsule_core(x0,y0,x1,y1,thick+2,self.col_shadow,clip,taper_px)
-        self._draw_capsule_core(x0,y0,x1,y1,thick,  color,         clip,taper_px)
-
-    def _erase_bbox(self, bbox):
-        if not bbox: return
-        x,y,w,h = bbox
-        buf = self._bg_slice(x,y,w,h)
-        if buf: self.d.blit_rgb565(x,y,w,h,buf)
-
-    def _draw_hour(self, hh, mm, clip=None):
-        import math
-        ang = ((hh%12)/12.0)*360.0 + (mm/60.0)*30.0 - 90.0
-        ex = self.cx + int(math.cos(ang*math.pi/180.0)*self.hr_len)
-        ey = self.cy + int(math.sin(ang*math.pi/180.0)*self.hr_len)
-        bbox = clip if clip else self._bbox(ang, self.hr_len, self.hr_th)
-        self._draw_capsule_line(self.cx,self.cy,ex,ey,self.hr_th,self.col_gold,bbox,8)
-        return bbox
-
-    def _draw_minute(self, hh, mm, clip=None):
-        import math
-        ang = (mm/60.0)*360.0 - 90.0
-        ex = self.cx + int(math.cos(ang*math.pi/180.0)*self.min_len)
-        ey = self.cy + int(math.sin(ang*math.pi/180.0)*self.min_len)
-        bbox = clip if clip else self._bbox(ang, self.min_len, self.min_th)
-        self._draw_capsule_line(self.cx,self.cy,ex,ey,self.min_th,self.col_gold,bbox,12)
-        return bbox
+                if (err<<1)>=ay: x+=sx; err-=ay
+
+    def sec_rows(self, u):
+        """Zeilenspans des Sekundenzeigers in Position u (0..1799), Festkomma-Trig, mit Nabe."""
+        sn = _sin(u); cs = _sin(u + 450)
+        L = self.sec_len; T = self.sec_tail
+        x1 = self.cx + ((sn*L + 8192) >> 14); y1 = self.cy - ((cs*L + 8192) >> 14)
+        x0 = self.cx - ((sn*T + 8192) >> 14); y0 = self.cy + ((cs*T + 8192) >> 14)
+        rows = {}
+        self._line_rows(rows, x0,y0,x1,y1,1)
+        for dy, r in ((-2,1),(-1,2),(0,2),(1,2),(2,1)):
+            rows.setdefault(self.cy+dy, []).append([self.cx-r, self.cx+r+1, 1])
+        return rows
+
+    def _sec_set(self, u):
+        self._sec_old, self._sec = self._sec, self._sec_old
+        self._sec[0].set(_pack_hands(self.sec_rows(u)))
+        self._sec_u = u
+
+    def _sec_draw(self, u, now):
+        if u == self._sec_u: return
+        self._sec_set(u)
+        for r in self._dirty_bands(self._sec_old, self._sec):
+            self._compose_hands(r, self._layers())
+        self._sec_last = now
+
+    def _sec_budget(self, cost_us, late):
+        # Frame-Budget: Zeichnen > halbe Periode oder Schritt zu spät (Loop hängt hinterher)
+        # → nach 3 Überläufen eine Rate tiefer; nach ~10 s ruhigem Lauf wieder eine höher
+        hz = self._sec_hz
+        if late or cost_us*2 > 1_000_000//hz:
+            self._sec_good = 0; self._sec_over += 1
+            if self._sec_over >= 3 and hz > 1:
+                self._sec_hz = _sec_rate(hz - 1); self._sec_over = 0
+        else:
+            self._sec_over = 0; self._sec_good += 1
+            if self._sec_good >= 10*hz and hz < self._sec_hz_max:
+                self._sec_hz = SEC_RATES[SEC_RATES.index(hz) + 1]; self._sec_good = 0
+
+    def sec_rate(self):
+        """Aktuelle Sekundenzeiger-Rate in Hz (nach Budget-Monitor)."""
+        return self._sec_hz if self._sec_on else 0
+
+    def render_sec(self, hh, mm, ss, now_ms=None):
+        """1-Hz-Takt (time/sec): Zeiger auf die volle Sekunde, Basis für render_frame()."""
+        if not self._sec_on or self._last_mm is None: return
+        self._assets()
+        now = _time.ticks_ms() if now_ms is None else now_ms
+        self._sec_s = ss % 60; self._sec_t0 = now
+        self._sec_draw(self._sec_s * (SEC_STEPS//60), now)
+
+    def render_frame(self, now_ms=None):
+        """Zwischenschritte des Sekundenzeigers (time/frame); zeichnet nur bei neuer Position."""
+        hz = self._sec_hz
+        if not self._sec_on or hz <= 1 or self._sec_s is None: return
+        now = _time.ticks_ms() if now_ms is None else now_ms
+        k = _time.ticks_diff(now, self._sec_t0) * hz // 1000
+        if k < 0: return
+        if k >= hz: k = hz - 1          # nächste Sekunde noch nicht gemeldet: stehen bleiben
+        u = self._sec_s * (SEC_STEPS//60) + k * (SEC_STEPS//60//hz)
+        if u == self._sec_u: return
+        late = _time.ticks_diff(now, self._sec_last) > 2000//hz
+        t = _time.ticks_us()
+        self._assets()
+        self._sec_draw(u, now)
+        self._sec_budget(_time.ticks_diff(_time.ticks_us(), t), late)
 
     # -------- render API --------
     def render_full(self, hh, mm, ss):
-        if self.bg:
-            self.d.blit_rgb565(0,0,W,H,self.bg)
-        # Icons nach aktuellem State
-        for g,tag in self.icons.items():
-            if tag and tag!="off":
-                self._atlas_draw(g, tag)
-        # Zeiger
-        self._bbox_hr  = self._draw_hour(hh, mm)
-        self._bbox_min = self._draw_minute(hh, mm)
+        self._assets()
+        # Vollbild deckt alle offenen Dirty-Rects ab
+        if self.comp:
+            self.comp.discard()
+        self._want = False
+        # BG + Zeiger + Icons als ein Fenster (zeilenblockweise komponiert)
+        self._load_hands(hh, mm)
+        if self._sec_on:
+            self._sec_set((ss % 60) * (SEC_STEPS//60))
+        self._compose(0, 0, W, H, self._items(0, 0, W, H), self._hand_paint(self._layers()))
         self._last_hh, self._last_mm = hh, mm
 
+    def render_aod(self, hh, mm):
+        """Always-on: Stunde/Minute ohne Sekundenzeiger auf schwarzem Grund (erstes Bild: ganzes Band)."""
+        if self._aod_hm == (hh, mm): return
+        self._assets()
+        self._load_hands(hh, mm)
+        paint = self._hand_paint(self._cur)
+        if self._aod_hm is None:
+            y, h = self.AOD_BAND
+            self._compose(0, y, W, h, (), paint, True)
+        else:
+            for r in self._dirty_bands(self._old, self._cur):
+                self._compose(r[0], r[1], r[2], r[3], (), paint, True)
+        self._aod_hm = (hh, mm)
+
     def render(self, hh, mm, ss):
+        self._assets()
         if self._last_mm is None:
             self.render_full(hh, mm, ss); return
-        # Minute wechselt → Clear alte Minute, dann Stunde + Minute neu
-        if mm != self._last_mm:
-            self._erase_bbox(self._bbox_min)
-            self._bbox_hr  = self._draw_hour(hh, mm)
-            self._bbox_min = self._draw_minute(hh, mm)
-            self._last_mm = mm; self._last_hh = hh
+        if mm == self._last_mm and hh == self._last_hh:
             return
-        # Stunde wechselt (selten) → beide neu, damit Reihenfolge stimmt
-        if hh != self._last_hh:
-            self._erase_bbox(self._bbox_hr)
-            self._bbox_hr  = self._draw_hour(hh, mm)
-            self._erase_bbox(self._bbox_min)
-            self._bbox_min = self._draw_minute(hh, mm)
-            self._last_hh = hh; self._last_mm = mm
+        # Minute/Stunde wechselt → nur die überstrichene Fläche (alte ∪ neue Spans der geänderten
+        # Zeilen) neu: BG + beide Zeiger, bandweise im Fill-Puffer komponiert
+        self._load_hands(hh, mm)
+        for r in self._dirty_bands(self._old, self._cur):
+            self._compose_hands(r, self._layers())
+        self._last_hh = hh; self._last_mm = mm
@@ -7,17 +7,43 @@ except Exception:
 
 _FACE = None
 
-# gold_waves_orbitron v0.5.3 — tighter spacing, DDAY, immediate icons
+# gold_waves_orbitron v0.7.0 — tighter spacing, DDAY, icons via dirty-rect compositor, digits as ink over BG,
+# first frame composed in one window (blit_bands)
+# - Always-on (render_aod): nur HH:MM im Band der Zeitzeilen (ohne Datum, Sekunden, Icons),
+#   danach je Minute nur die geänderten Ziffern; Tinte auf Schwarz statt auf bg_full (Idle: 8 Farben)
+# - FaceBase (ui/face_runtime): Slots und Icons werden nur invalidiert, ein Flush komponiert jedes
+#   Dirty-Rect (BG + Ziffern + Icons) in einem Fenster; Stundenwechsel "10:59"→"11:00" = ein Fenster
+# - Ziffern-Atlas während eines Composes gepinnt (_pin): jede Kachel einmal gelesen/dekodiert
+# - Ziffern nur noch als Tinte (digit_ink.bin, ~150 KB); der gebackene 1,1-MB-Atlas ist reine
+#   Build-Quelle (host/assets_src) und liegt nicht mehr auf dem Gerät, kein AtlasReader-Fallback
 try:
     import ujson as json
 except Exception:
     import json
+from ui.face_runtime import FaceBase, pattern
+from lib.ink_atlas import InkAtlas
+try:
+    from lib.asset_index import load as _load_index
+except Exception:
+    _load_index = None
+try:
+    from lib.asset_cache import acquire as _acquire, release as _release
+except Exception:
+    _acquire = None; _release = None
 try:
     import utime as _time
 except Exception:
     import time as _time
+try:
+    import config
+    _CFG_DIGIT_CACHE = int(getattr(config, "DIGIT_ATLAS_CACHE_BYTES", 65_536))
+except Exception:
+    _CFG_DIGIT_CACHE = 65_536
 
 ASSET_DIR="ui/watchfaces_digital/gold_waves_orbitron/assets"
+# Zeichenreihenfolge der Slots: Mitte, Zeit, Sekunden (Icons liegen darüber)
+_SLOTS=("WD","DDAY","MON","YEAR","H1","H2","M1","M2","SS")
+_AOD_SLOTS=("H1","H2","M1","M2")
 _BG=None; _BGM=None; _DA=None; _DM=None; _IA=None; _IM=None
 
 def _b(p):
@@ -28,21 +54,42 @@ def _j(p):
 def _ensure():
     global _BG,_BGM,_DA,_DM,_IA,_IM
     if _BG is None:
-        _BG=_b(ASSET_DIR+"/bg_full.bin")
+        # BG/Icons aus dem gemeinsamen Asset-Cache (Refcount, Dedupe, Budget)
+        _BG=_acquire(ASSET_DIR+"/bg_full.bin") if _acquire else _b(ASSET_DIR+"/bg_full.bin")
         try: _BGM=memoryview(_BG)
         except: _BGM=None
     if _DA is None or _DM is None:
-        _DA=_b(ASSET_DIR+"/digit_atlas.bin"); _DM={}
-        for t in _j(ASSET_DIR+"/digit_meta.json").get("tiles",[]):
-            _DM[(t.get("slot"), str(t.get("char")))]=(t["x"],t["y"],t["w"],t["h"],t["offset"],t["length"])
-    if _IA is None or _IM is None:
-        _IA=_b(ASSET_DIR+"/icons_atlas.bin"); _IM={}
-        for t in _j(ASSET_DIR+"/icons_meta.json").get("icons",[]):
-            _IM[(t.get("group"), str(t.get("state")))]=(t["x"],t["y"],t["w"],t["h"],t["offset"],t["length"])
+        # Tinte ohne BG (host/build_assets.py, ~150 KB), zur Laufzeit auf bg_full gelegt;
+        # Binärindex (host/index_compile.py) statt JSON, JSON nur als Fallback
+        _DA=InkAtlas(ASSET_DIR+"/digit_ink.bin", _CFG_DIGIT_CACHE)
+        _DM=_load_index(ASSET_DIR+"/digit_ink_meta.idx") if _load_index else None
+        if _DM is None:
+            _DM={}
+            for t in _j(ASSET_DIR+"/digit_ink_meta.json").get("tiles",[]):
+                _DM[(t.get("slot"), str(t.get("char")))]=(t["x"],t["y"],t["w"],t["h"],t["offset"],t["length"])
+    if _IA is None:
+        _IA=_acquire(ASSET_DIR+"/icons_atlas.bin") if _acquire else _b(ASSET_DIR+"/icons_atlas.bin")
+    if _IM is None:
+        _IM=_load_index(ASSET_DIR+"/icons_meta.idx") if _load_index else None
+        if _IM is None:
+            _IM={}
+            for t in _j(ASSET_DIR+"/icons_meta.json").get("icons",[]):
+                _IM[(t.get("group"), str(t.get("state")))]=(t["x"],t["y"],t["w"],t["h"],t["offset"],t["length"])
 
-class Face:
+def release_assets():
+    """BG/Icons an den Asset-Cache zurückgeben, Ziffernkacheln verwerfen (Screen.on_hide)."""
+    global _BG,_BGM,_IA
+    if _release:
+        if _BG is not None: _release(ASSET_DIR+"/bg_full.bin")
+        if _IA is not None: _release(ASSET_DIR+"/icons_atlas.bin")
+    _BG=None; _BGM=None; _IA=None
+    if _DA is not None and hasattr(_DA, "clear"): _DA.clear()
 
-    WANTS_SECONDS = True
+class Face(FaceBase):
+    NAME="gold_waves_orbitron"
+    DRAWS_FULL_BG=True
+    WANTS_SECONDS=True
+    AOD_BAND=(20,198)     # Stunden- bis Minutenzeile (H 20..100, M 138..218)
     ICON_RECTS = {
         "wifi": (10, 5, 20, 20),
         "bt": (34, 5, 20, 20),
@@ -52,41 +99,20 @@ class Face:
         "battery": (209, 5, 26, 20),
     }
 
-    def _icon_state_init(self):
-        if getattr(self, "_icon_state", None) is None:
-            self._icon_state = {}
+    def __init__(self, d, *a):
+        FaceBase.__init__(self, d, *a)
+        self._assets()
+        self.last={"H1":"","H2":"","M1":"","M2":"","SS":"","WD":"","DDAY":"","MON":"","YEAR":""}
+        self.icons={"wifi":"off","bt":"off","lora":"off","msg":"off","charge":"off","battery":"100"}
 
-    def _update_icon(self, group, tag):
-        self._icon_state_init()
-        prev = self._icon_state.get(group)
-        if prev == tag:
-            return
-        self._icon_state[group] = tag
-        try:
-            self.set_icon(group, tag)
-        except Exception:
-            pass
-        x, y, w, h = self.ICON_RECTS.get(group, (0, 0, 0, 0))
-        if w and h:
-            try: self.invalidate_region(x, y, w, h)
-            except Exception: pass
-        try: self.request_draw()
-        except Exception:
-            try: self.render()
-            except Exception:
-                try: self.render_full()
-                except Exception: pass
-
-    def _restore_icons_after_full_draw(self):
-        st = getattr(self, "_icon_state", None) or {}
-        if not st:
-            return
-        for g, t in st.items():
-            try:
-                self.set_icon(g, t)
-            except Exception:
-                pass
+    # --- Assets liegen modulweit (_ensure), der Face hält nur Referenzen ---
+    def _assets(self):
+        _ensure(); self.bg=_BGM or _BG; self.atlas=_IA; self.icons_lut=_IM
+    def release_assets(self):
+        FaceBase.release_assets(self); release_assets()
+        self.bg=None; self.atlas=None
 
+    # --- Domain-Mappings -> set_icon (invalidiert, Flush im Frame-Takt) ---
     def on_bt(self, payload=None):
         s = (payload or {}).get("state")
         if   s == "connected":
@@ -97,7 +123,7 @@ class Face:
             tag = "error"
         else:
             tag = "off"
-        self._update_icon("bt", tag)
+        self.set_icon("bt", tag)
 
     def on_wifi(self, payload=None):
         s = (payload or {}).get("state")
@@ -109,7 +135,7 @@ class Face:
             tag = "connecting"
         else:
             tag = "off"
-        self._update_icon("wifi", tag)
+        self.set_icon("wifi", tag)
 
     def on_notif(self, payload=None):
         flag = 0
@@ -121,103 +147,107 @@ class Face:
                     flag = 1 if int(payload.get("count") or 0) > 0 else 0
         except Exception:
             flag = 0
-        self._update_icon("msg", "on" if flag else "off")
+        self.set_icon("msg", "on" if flag else "off")
 
     def on_battery(self, payload=None):
         p = 0; charging = False
         try: p = int((payload or {}).get("percent", 0) or 0)
         except Exception: p = 0
         charging = bool((payload or {}).get("charging", False))
-        self._update_icon("charge", "on" if charging else "off")
+        self.set_icon("charge", "on" if charging else "off")
         if   p <= 10:   lvl = "0"
         elif p <= 30:   lvl = "20"
         elif p <= 50:   lvl = "40"
         elif p <= 70:   lvl = "60"
         elif p <= 90:   lvl = "80"
         else:           lvl = "100"
-        self._update_icon("battery", lvl)
-
-    def invalidate(self):
-        pass
+        self.set_icon("battery", lvl)
 
+    def on_lora(self,p):
+        s=(p or {}).get("state","off")
+        self.set_icon("lora","on" if s!="off" else "off")
+    def on_usb(self,p): self.set_icon("charge","on" if (p or {}).get("state")=="charging" else "off")
 
-    NAME="gold_waves_orbitron"
-    DRAWS_FULL_BG=True
-    WANTS_SECONDS=True
-    def __init__(self, d):
-        _ensure(); self.d=d
-        self.last={"H1":"","H2":"","M1":"","M2":"","SS":"","WD":"","DDAY":"","MON":"","YEAR":""}
-        self.icons={"wifi":"off","bt":"off","lora":"off","msg":"off","charge":"off","battery":"100"}
-    def _blit(self,buf,x,y,w,h): self.d.blit_rgb565(x,y,w,h,buf)
-    def _bg(self,x,y,w,h):
-        stride=240*2; mv=_BGM or _BG
-        for r in range(h):
-            off=(y+r)*stride + x*2
-            self._blit(mv[off:off+w*2], x,y+r,w,1)
+    # --- Komposition: Slots (Ziffern/Mitte) unter den Icons ---
+    def _items(self,x,y,w,h):
+        out=[]
+        for sl in (_AOD_SLOTS if self._aod else _SLOTS):
+            if self.last[sl]: self._slot_items(sl,self.last[sl],out)
+        out=[it for it in out if it[0][0]<x+w and x<it[0][0]+it[0][2] and it[0][1]<y+h and y<it[0][1]+it[0][3]]
+        return out if self._aod else self._icon_items(x,y,w,h,out)
     def _tile(self,slot,key): return _DM.get((slot,str(key)))
-    def _icon(self,grp,st): return _IM.get((grp,str(st)))
-    def _draw_slot(self,slot,key):
-        t=self._tile(slot,key); 
-        if not t: return
-        x,y,w,h,off,ln=t
-        self._blit(_DA[off:off+ln], x,y,w,h)
-    def _draw_icon(self,grp,st):
-        t=self._icon(grp,st); 
-        if not t: return
+    def _pin(self,on):
+        p=getattr(_DA,"pin",None)
+        if p: p(on)
+    def _tile_buf(self,t):
         x,y,w,h,off,ln=t
-        self._blit(_IA[off:off+ln], x,y,w,h)
+        # Always-on: Tinte auf schwarzer Grundzeile (bg_stride 0), sonst auf dem BG-Ausschnitt
+        if self._aod: return _DA.get(x,y,w,h,off,ln,pattern(0),0)
+        return _DA.get(x,y,w,h,off,ln,_BGM or _BG)
+    def _slot_items(self,slot,key,out):
+        # vom Asset-Build zerlegte Mehrzeichen-Slots (host/build_assets.py "compose"): Zellen <slot><i>
+        t=self._tile(slot,key)
+        if t: out.append((t,self._tile_buf)); return
+        key=str(key)
+        if len(key)>1:
+            for i,ch in enumerate(key): self._slot_items("%s%d"%(slot,i),ch,out)
+    def _set_slot(self,slot,key):
+        # Slot wechseln: alte und neue Kacheln invalidieren (gleiche Rects werden im Compositor vereinigt)
+        old=self.last[slot]
+        if old==key: return
+        self.last[slot]=key
+        tiles=[]
+        if old: self._slot_items(slot,old,tiles)
+        self._slot_items(slot,key,tiles)
+        for t,_ in tiles: self._dirty(t[0],t[1],t[2],t[3])
+
     def on_show(self):
-        self._bg(0,0,240,240); t=_time.localtime(); self.render_full(t[3],t[4],t[5])
-        # Repaint icons with whatever state we currently hold
-        for g,s in self.icons.items():
-            self._draw_icon(g,s)
+        # render_full() bringt BG, Slots und Icons in einem Fenster
+        self._assets(); t=_time.localtime(); self.render_full(t[3],t[4],t[5])
     def render_full(self,hh,mm,ss=None):
-        self._bg(0,0,240,240); self._draw_middle(force=True)
-        sHH="{:02d}".format(int(hh)); sMM="{:02d}".format(int(mm))
-        for sl,ch in (("H1",sHH[0]),("H2",sHH[1]),("M1",sMM[0]),("M2",sMM[1])):
-            self._draw_slot(sl,ch); self.last[sl]=ch
+        self._assets()
+        if self.comp: self.comp.discard()
+        self._want=False
         if ss is None: ss=_time.localtime()[5]
-        self._draw_seconds(ss)
-        for g,s in self.icons.items(): self._draw_icon(g,s)
-        try: self._restore_icons_after_full_draw()
-        except Exception: pass
+        sHH="{:02d}".format(int(hh)); sMM="{:02d}".format(int(mm))
+        for sl,ch in self._middle_keys()+(("H1",sHH[0]),("H2",sHH[1]),("M1",sMM[0]),("M2",sMM[1]),
+                                          ("SS","{:02d}".format(int(ss)))):
+            self.last[sl]=ch
+        # eigenes Stats-Tag, damit der Vollbild-Pfad in display/spi_stats einzeln sichtbar ist
+        tag=getattr(self.d,"stats_tag",None); prev=tag(self.NAME+"/full") if tag else None
+        try: self._compose(0,0,240,240,self._items(0,0,240,240))
+        finally:
+            if tag: tag(prev)
     def render(self,hh,mm,ss=None):
+        self._assets()
         sHH="{:02d}".format(int(hh)); sMM="{:02d}".format(int(mm))
-        if not self.last["WD"] or not self.last["DDAY"] or not self.last["MON"] or not self.last["YEAR"]:
-            self._draw_middle(force=True)
-        if self.last["M2"]!=sMM[1]: self._draw_slot("M2",sMM[1]); self.last["M2"]=sMM[1]
-        if self.last["M1"]!=sMM[0]: self._draw_slot("M1",sMM[0]); self.last["M1"]=sMM[0]
-        if sMM=="00" and self.last["H2"]!=sHH[1]: self._draw_slot("H2",sHH[1]); self.last["H2"]=sHH[1]
-        if sMM=="00" and self.last["H1"]!=sHH[0]: self._draw_slot("H1",sHH[0]); self.last["H1"]=sHH[0]
-        if ss is not None: self._draw_seconds(ss)
-        if sHH=="00" and sMM=="00": self._draw_middle(force=True)
-    def render_seconds(self,hh,mm,ss): self._draw_seconds(ss)
-    def _draw_seconds(self,ss):
-        key="{:02d}".format(int(ss))
-        if self.last["SS"]==key: return
-        self._draw_slot("SS",key); self.last["SS"]=key
-    def _draw_middle(self, force=False):
+        self._set_slot("M2",sMM[1]); self._set_slot("M1",sMM[0])
+        if sMM=="00" or not self.last["H1"]:
+            self._set_slot("H2",sHH[1]); self._set_slot("H1",sHH[0])
+        if ss is not None: self._set_slot("SS","{:02d}".format(int(ss)))
+        if (sHH=="00" and sMM=="00") or not self.last["WD"]: self._set_middle()
+        self.request_draw()
+    def render_aod(self,hh,mm):
+        # Always-on: erstes Bild = ganzes Band auf Schwarz (Datum verschwindet), dann nur Ziffernwechsel
+        self._assets()
+        s="{:02d}{:02d}".format(int(hh),int(mm))
+        if self._aod_hm is None:
+            for sl,ch in zip(_AOD_SLOTS,s): self.last[sl]=ch
+            y,h=self.AOD_BAND
+            self._compose(0,y,240,h,self._items(0,y,240,h),None,True)
+        else:
+            for sl,ch in zip(_AOD_SLOTS,s): self._set_slot(sl,ch)
+            self.flush()
+        self._aod_hm=(hh,mm)
+    def render_seconds(self,hh,mm,ss):
+        self._set_slot("SS","{:02d}".format(int(ss))); self.request_draw()
+    def _middle_keys(self):
         lt=_time.localtime()
-        wd=str((lt[6])%7)
-        if force or self.last["WD"]!=wd: self._draw_slot("WD",wd); self.last["WD"]=wd
-        day="{:02d}".format(lt[2])
-        if force or self.last["DDAY"]!=day: self._draw_slot("DDAY",day); self.last["DDAY"]=day
         mons=["Jan","Feb","Mär","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"]
-        mon=mons[max(0,min(11,lt[1]-1))]
-        if force or self.last["MON"]!=mon: self._draw_slot("MON",mon); self.last["MON"]=mon
-        year="{:04d}".format(lt[0])
-        if force or self.last["YEAR"]!=year: self._draw_slot("YEAR",year); self.last["YEAR"]=year
-    # icons API (immediate draw)
-    def set_icon(self,grp,st):
-        st=str(st)
-        if self.icons.get(grp)!=st:
-            self.icons[grp]=st
-        self._draw_icon(grp,st)
-    def on_lora(self,p):
-        s=(p or {}).get("state","off")
-        self.set_icon("lora","on" if s!="off" else "off")
-    def on_notif(self,p): self.set_icon("msg","on" if (p or {}).get("flag",0) else "off")
-    def on_usb(self,p): self.set_icon("charge","on" if (p or {}).get("state")=="charging" else "off")
+        return (("WD",str((lt[6])%7)),("DDAY","{:02d}".format(lt[2])),
+                ("MON",mons[max(0,min(11,lt[1]-1))]),("YEAR","{:04d}".format(lt[0])))
+    def _set_middle(self):
+        for sl,k in self._middle_keys(): self._set_slot(sl,k)
 _FACE=None
 def on_show(display,*a,**k):
     global _FACE; _ensure(); _FACE=Face(display); _FACE.on_show(); return _FACE